@@ -0,0 +1,246 @@
+"""
+Headless command line interface.
+
+    python -m cli calculate --year 2026 --month 3 --grade JG6 --leave 2026-03-12
+    python -m cli export --year 2026 --month 3 --grade JG6 --format pdf -o march.pdf
+    python -m cli fetch-holidays --year 2026
+    python -m cli export --year 2026 --all-months --grade JG6 -o 2026.pdf
+    python -m cli batch --roster staff.csv --year 2026 --month 3 -o summary.csv
+    python -m cli batch --roster staff.csv --year 2026 --month 3 -o roster.pdf
+    python -m cli batch --roster staff.csv --year 2026 --month 3 -o summary.csv --export-dir out --formats pdf,xlsx --merge zip
+
+Only `domain` and `services` are imported at module load. Tk is never
+imported, and each exporter (openpyxl / reportlab) is imported only when
+its format is requested.
+"""
+import argparse
+import json
+import os
+import sys
+import datetime as dt
+from typing import Dict, List, Optional, Tuple
+
+from domain.calculator import calculate_period, calculate_periods, GRADE_RATES
+from domain.dates import parse_dates
+from domain.models import CalculationResult
+from services.holiday_service import HolidayService
+from services.holiday_bundle import default_bundle_path
+from services.holiday_store import DEFAULT_REGION
+
+EXPORT_FORMATS = ("pdf", "xlsx", "csv")
+
+
+def _add_holiday_args(parser: argparse.ArgumentParser):
+    parser.add_argument("--cache-dir", default=".", help="Directory holding the holiday cache (default: .)")
+    parser.add_argument("--region", default=DEFAULT_REGION, help=f"Holiday region (default: {DEFAULT_REGION})")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--offline", action="store_true", help="Use cached holidays only, never hit the network")
+    group.add_argument("--refresh", action="store_true", help="Ignore the cache and fetch holidays again")
+    parser.add_argument("--no-bundle", action="store_true", help="Don't fall back to the bundled holiday dataset")
+
+
+def _add_period_args(parser: argparse.ArgumentParser, with_grade: bool = True):
+    today = dt.date.today()
+    parser.add_argument("--year", type=int, default=today.year)
+    parser.add_argument("--month", type=int, default=today.month, choices=range(1, 13), metavar="MONTH")
+    if with_grade:
+        parser.add_argument("--grade", default="JG6", type=str.upper, choices=list(GRADE_RATES.keys()))
+        parser.add_argument("--leave", default="", help="Leave dates separated by ',' or ';'")
+
+
+def _holiday_service(args) -> HolidayService:
+    bundle_path = None if args.no_bundle else str(default_bundle_path())
+    return HolidayService(args.cache_dir, bundle_path=bundle_path, region=args.region)
+
+
+def _load_holidays(args, service: Optional[HolidayService] = None) -> Tuple[Dict[dt.date, str], str]:
+    service = service or _holiday_service(args)
+    return service.get_holidays_sync(args.year, force_refresh=args.refresh, offline=args.offline)
+
+
+def _calculate(args) -> Tuple[CalculationResult, str]:
+    holidays, source = _load_holidays(args)
+    result = calculate_period(args.year, args.month, args.grade, holidays, parse_dates(args.leave))
+    return result, source
+
+
+def _result_summary(res: CalculationResult, source: str) -> Dict:
+    return {
+        "period": res.period_label,
+        "grade": res.grade,
+        "rate": res.rate,
+        "total_days": res.total_days_in_month,
+        "working_days": res.working_days_count,
+        "weekends": res.weekend_days_count,
+        "public_holidays": res.public_holidays_count,
+        "personal_leave": res.personal_leave_count,
+        "ignored_leave": res.ignored_leave_count,
+        "total_reimbursement": res.total_reimbursement,
+        "holiday_source": source,
+    }
+
+
+def cmd_calculate(args) -> int:
+    res, source = _calculate(args)
+    summary = _result_summary(res, source)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+
+    print(f"Report for {res.period_label}")
+    print("-" * 40)
+    for key, value in summary.items():
+        print(f"  {key.replace('_', ' ').title():<20} {value}")
+    return 0
+
+
+def export_result(res: CalculationResult, fmt: str, path: str, holiday_source: str = ""):
+    """Write a result in the given format, importing only that exporter."""
+    from services.export_service import export_file
+    export_file(res, fmt, path, holiday_source)
+
+
+def _output_format(args) -> str:
+    return getattr(args, "format", None) or (args.output.rsplit(".", 1)[-1].lower() if "." in args.output else "")
+
+
+def cmd_export(args) -> int:
+    fmt = _output_format(args)
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Cannot infer export format from '{args.output}', use --format")
+    if args.all_months:
+        if fmt != "pdf":
+            raise ValueError("--all-months is only supported for PDF")
+        from exporters.pdf_exporter import BatchPdfExporter
+        holidays, source = _load_holidays(args)
+        leave = parse_dates(args.leave)
+        results = calculate_periods([(args.year, m, args.grade, leave) for m in range(1, 13)], holidays)
+        pages = BatchPdfExporter(results, source).export(args.output)
+        print(f"Saved {pages}-page PDF to {args.output}")
+        return 0
+
+    res, source = _calculate(args)
+    export_result(res, fmt, args.output, source)
+    print(f"Saved {fmt.upper()} to {args.output}")
+    return 0
+
+
+def cmd_fetch_holidays(args) -> int:
+    holidays, source = _load_holidays(args)
+    if args.json:
+        print(json.dumps({d.isoformat(): n for d, n in sorted(holidays.items())}, indent=2))
+        return 0
+
+    print(f"Holidays for {args.region} {args.year} ({source})")
+    for d, name in sorted(holidays.items()):
+        print(f"  {d.strftime('%d/%m/%Y')}  {name}")
+    return 0
+
+
+def cmd_batch(args) -> int:
+    from services.roster_service import RosterService, load_roster, write_roster_summary
+
+    holiday_service = _holiday_service(args)
+    holidays, source = _load_holidays(args, holiday_service)
+    roster = load_roster(args.roster)
+
+    # Every other region in the roster is loaded once, concurrently
+    regions = sorted({e.region for e in roster if e.region})
+    region_holidays = {}
+    if regions:
+        import asyncio
+        region_holidays = asyncio.run(holiday_service.get_region_calendars(regions, [args.year], offline=args.offline))
+
+    service = RosterService(holidays, max_workers=args.workers, chunk_size=args.chunk_size, region_holidays=region_holidays)
+    results = service.calculate(roster, args.year, args.month)
+    if args.export_dir:
+        # Per-employee files are written after the summary, so keep the results
+        results = list(results)
+    as_pdf = _output_format(args) == "pdf"
+    if as_pdf:
+        # One page per employee, streamed as chunks complete
+        from exporters.pdf_exporter import BatchPdfExporter
+        count = BatchPdfExporter(((r.employee_id, r.result) for r in results), source).export(args.output)
+    else:
+        count = write_roster_summary(results, args.output)
+
+    stats = service.stats
+    print(f"Calculated {count} employees in {stats.elapsed:.2f}s "
+          f"({stats.employees_per_second:,.0f} employees/s, holidays: {source})")
+    print(f"Saved {'PDF' if as_pdf else 'summary'} to {args.output}")
+
+    if args.export_dir:
+        return _export_roster_files(args, results, source)
+    return 0
+
+
+def _export_roster_files(args, results, source: str) -> int:
+    from services.export_service import ExportJob, ExportService
+
+    formats = [f.strip().lower() for f in args.formats.split(",") if f.strip()]
+    exporter = ExportService(args.export_dir, formats, source, max_workers=args.workers)
+
+    def progress(done, total, outcome):
+        if not outcome.ok:
+            print(f"  Failed {os.path.basename(outcome.path)}: {outcome.error}", file=sys.stderr)
+        if done == total or done % 100 == 0:
+            print(f"  Exported {done}/{total}")
+
+    jobs = [ExportJob(r.employee_id, r.result) for r in results]
+    report = exporter.export(jobs, merge=args.merge, merge_name=f"roster_{args.year}_{args.month:02d}", on_progress=progress)
+    print(f"Exported {report.summary()} to {args.export_dir}")
+    if report.outcomes:
+        slowest = max(report.outcomes, key=lambda o: o.elapsed)
+        print(f"  Per file: {sum(o.elapsed for o in report.outcomes) / len(report.outcomes) * 1000:.1f} ms avg, "
+              f"slowest {os.path.basename(slowest.path)} {slowest.elapsed * 1000:.1f} ms")
+    if report.merged is not None and report.merged.ok:
+        print(f"Merged into {report.merged.path}")
+    return 1 if report.failures else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m cli", description="TLRS Working Day Calculator (headless)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("calculate", help="Calculate one month for one grade")
+    _add_period_args(p)
+    _add_holiday_args(p)
+    p.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    p.set_defaults(func=cmd_calculate)
+
+    p = sub.add_parser("export", help="Calculate and export to PDF, Excel or CSV")
+    _add_period_args(p)
+    _add_holiday_args(p)
+    p.add_argument("-o", "--output", required=True)
+    p.add_argument("--format", choices=EXPORT_FORMATS, help="Defaults to the output file extension")
+    p.add_argument("--all-months", action="store_true", help="PDF only: one page per month of --year")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("fetch-holidays", help="Load (and cache) the holiday list for a year")
+    p.add_argument("--year", type=int, default=dt.date.today().year)
+    _add_holiday_args(p)
+    p.add_argument("--json", action="store_true")
+    p.set_defaults(func=cmd_fetch_holidays)
+
+    p = sub.add_parser("batch", help="Calculate a whole roster (CSV/XLSX)")
+    _add_period_args(p, with_grade=False)
+    _add_holiday_args(p)
+    p.add_argument("--roster", required=True, help="CSV/XLSX with employee_id, grade, leave_dates, region columns")
+    p.add_argument("-o", "--output", required=True, help="Summary CSV path, or a .pdf for one page per employee")
+    p.add_argument("--workers", type=int, default=None)
+    p.add_argument("--chunk-size", type=int, default=500)
+    p.add_argument("--export-dir", help="Also write one file per employee (per format) into this directory")
+    p.add_argument("--formats", default="pdf", help="With --export-dir: comma separated pdf,xlsx,csv (default: pdf)")
+    p.add_argument("--merge", choices=("pdf", "zip"), help="With --export-dir: also merge into one PDF or ZIP")
+    p.set_defaults(func=cmd_batch)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
@@ -0,0 +1,156 @@
+import calendar
+import datetime as dt
+from array import array
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from domain.models import Holiday
+from domain.calculator import expand_observed_holidays
+
+# Per-day flags packed into one byte each
+FLAG_WEEKEND = 1
+FLAG_HOLIDAY = 2
+
+
+class MonthView(NamedTuple):
+    """Employee-independent facts about one month."""
+    days: Tuple[dt.date, ...]
+    weekend_count: int
+    holidays: Tuple[Holiday, ...]
+    open_days: Tuple[dt.date, ...]  # weekdays that are not public holidays
+
+
+class BusinessCalendar:
+    """
+    Precomputed working-day index for a range of whole years.
+
+    Built once from a raw holiday map (the observed rule is applied here),
+    it keeps one flag byte per day plus a prefix sum of working days, so
+    range counts and "Nth working day after" are constant-time lookups.
+    """
+
+    def __init__(self, start_year: int, end_year: int, holidays_map: Dict[dt.date, str]):
+        if end_year < start_year:
+            raise ValueError("end_year must not be before start_year")
+
+        self.start_year = start_year
+        self.end_year = end_year
+        self.first_date = dt.date(start_year, 1, 1)
+        self.last_date = dt.date(end_year, 12, 31)
+        self._origin = self.first_date.toordinal()
+        size = self.last_date.toordinal() - self._origin + 1
+
+        processed = expand_observed_holidays(holidays_map).by_date
+        self._holidays: Dict[dt.date, Holiday] = {
+            d: h for d, h in processed.items() if self.first_date <= d <= self.last_date
+        }
+
+        # 1. Flags: weekday() of the first date, then step through
+        flags = bytearray(size)
+        weekday = self.first_date.weekday()
+        for i in range(size):
+            if weekday >= 5:
+                flags[i] = FLAG_WEEKEND
+            weekday = 0 if weekday == 6 else weekday + 1
+        for d in self._holidays:
+            flags[d.toordinal() - self._origin] |= FLAG_HOLIDAY
+        self._flags = flags
+
+        # 2. Prefix sums (prefix[i] = working days before offset i) and
+        #    the offsets of every working day, for O(1) Nth-day lookups
+        prefix = array("l", [0]) * (size + 1)
+        working_offsets = array("l")
+        count = 0
+        for i, f in enumerate(flags):
+            if not f:
+                working_offsets.append(i)
+                count += 1
+            prefix[i + 1] = count
+        self._prefix = prefix
+        self._working_offsets = working_offsets
+
+        self._month_views: Dict[Tuple[int, int], MonthView] = {}
+
+    @classmethod
+    def for_years(cls, years: Iterable[int], holidays_map: Dict[dt.date, str]) -> "BusinessCalendar":
+        """Build a calendar spanning every year in `years`."""
+        years = list(years)
+        if not years:
+            raise ValueError("At least one year is required")
+        return cls(min(years), max(years), holidays_map)
+
+    # --- Lookups ---
+
+    def _offset(self, d: dt.date) -> int:
+        offset = d.toordinal() - self._origin
+        if offset < 0 or offset >= len(self._flags):
+            raise ValueError(f"{d.isoformat()} is outside calendar range {self.start_year}-{self.end_year}")
+        return offset
+
+    def covers(self, year: int) -> bool:
+        return self.start_year <= year <= self.end_year
+
+    def is_working_day(self, d: dt.date) -> bool:
+        return self._flags[self._offset(d)] == 0
+
+    def is_holiday(self, d: dt.date) -> bool:
+        return bool(self._flags[self._offset(d)] & FLAG_HOLIDAY)
+
+    def holiday(self, d: dt.date) -> Optional[Holiday]:
+        return self._holidays.get(d)
+
+    def working_days_between(self, start: dt.date, end: dt.date) -> int:
+        """Number of working days from start to end, both inclusive."""
+        if end < start:
+            return 0
+        return self._prefix[self._offset(end) + 1] - self._prefix[self._offset(start)]
+
+    def add_working_days(self, d: dt.date, n: int) -> dt.date:
+        """Return the Nth working day strictly after d (n >= 1)."""
+        if n < 1:
+            raise ValueError("n must be at least 1")
+        index = self._prefix[self._offset(d) + 1] + n - 1
+        if index >= len(self._working_offsets):
+            raise ValueError(f"Not enough working days after {d.isoformat()} in calendar range")
+        return dt.date.fromordinal(self._origin + self._working_offsets[index])
+
+    def working_days_in_range(self, start: dt.date, end: dt.date) -> List[dt.date]:
+        """All working days from start to end, both inclusive."""
+        if end < start:
+            return []
+        lo = self._prefix[self._offset(start)]
+        hi = self._prefix[self._offset(end) + 1]
+        return [dt.date.fromordinal(self._origin + o) for o in self._working_offsets[lo:hi]]
+
+    def iter_days(self, start: dt.date, end: dt.date) -> Iterator[Tuple[dt.date, int]]:
+        """Yield (date, flags) for every day from start to end, both inclusive."""
+        if end < start:
+            return
+        lo = self._offset(start)
+        hi = self._offset(end)
+        flags = self._flags
+        for i in range(lo, hi + 1):
+            yield dt.date.fromordinal(self._origin + i), flags[i]
+
+    def month_view(self, year: int, month: int) -> MonthView:
+        """Cached per-month view used by calculate_period/calculate_periods."""
+        key = (year, month)
+        view = self._month_views.get(key)
+        if view is not None:
+            return view
+
+        num_days = calendar.monthrange(year, month)[1]
+        first = dt.date(year, month, 1)
+        last = dt.date(year, month, num_days)
+        start = self._offset(first)
+        flags = self._flags[start:start + num_days]
+
+        view = MonthView(
+            days=tuple(dt.date(year, month, day) for day in range(1, num_days + 1)),
+            weekend_count=sum(1 for f in flags if f & FLAG_WEEKEND),
+            holidays=tuple(sorted(
+                (h for d, h in self._holidays.items() if d.year == year and d.month == month),
+                key=lambda h: h.date
+            )),
+            open_days=tuple(self.working_days_in_range(first, last)),
+        )
+        self._month_views[key] = view
+        return view
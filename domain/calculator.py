@@ -1,8 +1,14 @@
 
 import calendar
 import datetime as dt
-from typing import List, Set, Dict, Optional
-from domain.models import CalculationResult, Holiday
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import List, Set, Dict, Optional, Iterable, Tuple, Mapping, NamedTuple, FrozenSet, TYPE_CHECKING
+from domain.models import CalculationResult, Holiday, MonthSubtotal, RangeCalculationResult
+
+if TYPE_CHECKING:
+    from domain.business_calendar import BusinessCalendar, MonthView
 
 GRADE_RATES = {
     "JG5": 50,
@@ -59,25 +65,120 @@ def apply_observed_rule(holidays_map: Dict[dt.date, str]) -> Dict[dt.date, Holid
             
     return final_holidays
 
+class ObservedHolidays(NamedTuple):
+    """
+    Read-only result of apply_observed_rule, bucketed by (year, month).
+    Instances are shared between callers, so treat the Holiday objects
+    as immutable.
+    """
+    by_date: Mapping[dt.date, Holiday]
+    by_month: Mapping[Tuple[int, int], Tuple[Holiday, ...]]
+
+    def for_month(self, year: int, month: int) -> Tuple[Holiday, ...]:
+        return self.by_month.get((year, month), ())
+
+# Bounded LRU of expansions keyed by the holiday map fingerprint.
+# A changed map has a new fingerprint, so its old entry simply ages out.
+OBSERVED_CACHE_SIZE = 32
+_observed_cache: "OrderedDict[FrozenSet, ObservedHolidays]" = OrderedDict()
+_observed_lock = threading.Lock()
+_observed_stats = {"hits": 0, "misses": 0}
+
+def holiday_fingerprint(holidays_map: Dict[dt.date, str]) -> FrozenSet:
+    """Hashable, order-independent identity of a holiday map."""
+    return frozenset(holidays_map.items())
+
+def expand_observed_holidays(holidays_map: Dict[dt.date, str]) -> ObservedHolidays:
+    """Memoized apply_observed_rule with per-month buckets."""
+    key = holiday_fingerprint(holidays_map)
+    with _observed_lock:
+        cached = _observed_cache.get(key)
+        if cached is not None:
+            _observed_cache.move_to_end(key)
+            _observed_stats["hits"] += 1
+            return cached
+        _observed_stats["misses"] += 1
+
+    processed = apply_observed_rule(holidays_map)
+    buckets: Dict[Tuple[int, int], List[Holiday]] = {}
+    for d in sorted(processed):
+        buckets.setdefault((d.year, d.month), []).append(processed[d])
+
+    expansion = ObservedHolidays(
+        by_date=MappingProxyType(processed),
+        by_month=MappingProxyType({k: tuple(v) for k, v in buckets.items()})
+    )
+
+    with _observed_lock:
+        _observed_cache[key] = expansion
+        _observed_cache.move_to_end(key)
+        while len(_observed_cache) > OBSERVED_CACHE_SIZE:
+            _observed_cache.popitem(last=False)
+    return expansion
+
+def invalidate_observed_months(
+    months: Iterable[Tuple[int, int]],
+    previous: Optional[Dict[dt.date, str]] = None
+) -> int:
+    """
+    Drop cached expansions of any map with a holiday in one of `months`
+    ((year, month) pairs, e.g. HolidayDiff.affected_months). Expansions of
+    maps that don't touch those months stay cached. Returns entries dropped.
+
+    `previous` (one region's holidays before the change) narrows this to
+    maps built from that copy, i.e. maps holding all of its holidays; other
+    regions' calendars are kept even where they share the months.
+    """
+    months = set(months)
+    built_from = holiday_fingerprint(previous) if previous else None
+    with _observed_lock:
+        stale = [key for key, expansion in _observed_cache.items()
+                 if any(m in months for m in expansion.by_month)
+                 and (built_from is None or built_from <= key)]
+        for key in stale:
+            del _observed_cache[key]
+    return len(stale)
+
+def clear_observed_cache():
+    with _observed_lock:
+        _observed_cache.clear()
+        _observed_stats["hits"] = 0
+        _observed_stats["misses"] = 0
+
+def observed_cache_info() -> Dict[str, int]:
+    with _observed_lock:
+        return {**_observed_stats, "size": len(_observed_cache), "max_size": OBSERVED_CACHE_SIZE}
+
 def calculate_period(
     year: int, 
     month: int, 
     grade: str, 
     holidays_map: Dict[dt.date, str], 
-    leave_dates: Set[dt.date]
+    leave_dates: Set[dt.date],
+    business_calendar: Optional["BusinessCalendar"] = None,
+    region: Optional[str] = None,
+    region_holidays: Optional[Dict[str, Dict[dt.date, str]]] = None
 ) -> CalculationResult:
     
+    # A named region uses its own calendar from region_holidays; holidays_map
+    # (and business_calendar, built from it) is the default region's.
+    if region:
+        if region not in (region_holidays or {}):
+            raise ValueError(f"No holidays loaded for region: {region}")
+        holidays_map, business_calendar = region_holidays[region], None
+    
+    # 0. Fast path: a prebuilt calendar already holds the observed holidays
+    #    and working days for this month, so holidays_map is not rescanned.
+    if business_calendar is not None and business_calendar.covers(year):
+        return _build_result(year, month, grade, leave_dates, business_calendar.month_view(year, month))
+    
     # 1. Get all days
     all_days = get_days_in_month(year, month)
     
     # 2. Process holidays (apply observation rules)
-    # We apply rules to the whole year context usually, but here we might only have month data?
     # Ideally holidays_map should cover at least this month + overlapping range.
-    # For now, we assume holidays_map is sufficient.
-    processed_holidays = apply_observed_rule(holidays_map)
-    
-    # Filter holidays to this month only
-    month_holidays = [h for d, h in processed_holidays.items() if d.year == year and d.month == month]
+    # The expansion is memoized per map, so repeat calls only pay for the lookup.
+    month_holidays = list(expand_observed_holidays(holidays_map).for_month(year, month))
     month_holiday_dates = {h.date for h in month_holidays}
     
     working_days = []
@@ -129,3 +230,166 @@ def calculate_period(
         ignored_leave_dates=sorted(ignored_leave),
         total_reimbursement=len(working_days) * rate
     )
+
+
+def calculate_periods(
+    periods: Iterable[Tuple[int, int, str, Set[dt.date]]],
+    holidays_map: Dict[dt.date, str],
+    business_calendar: Optional["BusinessCalendar"] = None
+) -> List[CalculationResult]:
+    """
+    Batch version of calculate_period.
+
+    `periods` is an iterable of (year, month, grade, leave_dates) tuples.
+    The observed rule is applied once (via a BusinessCalendar) and each
+    distinct month is only built once, so the per-row cost is just the
+    leave lookup. Results are returned in input order and are equal to
+    calling calculate_period for each row.
+    """
+    periods = list(periods)
+    if not periods:
+        return []
+
+    if business_calendar is None or not all(business_calendar.covers(p[0]) for p in periods):
+        from domain.business_calendar import BusinessCalendar
+        business_calendar = BusinessCalendar.for_years({p[0] for p in periods}, holidays_map)
+
+    return [
+        _build_result(year, month, grade, leave_dates, business_calendar.month_view(year, month))
+        for year, month, grade, leave_dates in periods
+    ]
+
+
+def _build_result(
+    year: int,
+    month: int,
+    grade: str,
+    leave_dates: Set[dt.date],
+    view: "MonthView"
+) -> CalculationResult:
+    # Only leave inside this month matters for the counts
+    month_leave = {d for d in leave_dates if d.year == year and d.month == month}
+
+    if month_leave:
+        working_days = []
+        applied_leave = []
+        for day in view.open_days:
+            if day in month_leave:
+                applied_leave.append(day)
+            else:
+                working_days.append(day)
+        ignored_leave = sorted(month_leave.difference(applied_leave))
+    else:
+        working_days = list(view.open_days)
+        applied_leave = []
+        ignored_leave = []
+
+    rate = GRADE_RATES.get(grade, 0)
+
+    return CalculationResult(
+        grade=grade,
+        rate=rate,
+        year=year,
+        month=month,
+        total_days_in_month=len(view.days),
+        working_days_count=len(working_days),
+        weekend_days_count=view.weekend_count,
+        public_holidays_count=len(view.holidays),
+        personal_leave_count=len(applied_leave),
+        holidays=list(view.holidays),
+        working_days=working_days,
+        leave_days=applied_leave,
+        ignored_leave_dates=ignored_leave,
+        total_reimbursement=len(working_days) * rate
+    )
+
+
+def calculate_range(
+    start_date: dt.date,
+    end_date: dt.date,
+    grade: str,
+    holidays_map: Dict[dt.date, str],
+    leave_dates: Set[dt.date],
+    business_calendar: Optional["BusinessCalendar"] = None
+) -> RangeCalculationResult:
+    """
+    Calculate any date range (e.g. a 16th-to-15th cycle or a quarter) in
+    one pass, with per-month subtotals.
+
+    The observed rule runs once over the whole holiday map, so a Sunday
+    holiday on the 31st is observed in the next month (or year) as long
+    as holidays_map contains it, even if the range starts after it.
+    """
+    if end_date < start_date:
+        raise ValueError("end_date must not be before start_date")
+
+    if business_calendar is None or not (
+        business_calendar.covers(start_date.year) and business_calendar.covers(end_date.year)
+    ):
+        from domain.business_calendar import BusinessCalendar
+        business_calendar = BusinessCalendar(start_date.year, end_date.year, holidays_map)
+
+    from domain.business_calendar import FLAG_WEEKEND, FLAG_HOLIDAY
+
+    rate = GRADE_RATES.get(grade, 0)
+    holidays = []
+    working_days = []
+    applied_leave = []
+    months: List[MonthSubtotal] = []
+    sub = None
+
+    for day, flags in business_calendar.iter_days(start_date, end_date):
+        # Start a new subtotal whenever the month changes
+        if sub is None or day.month != sub.month:
+            sub = MonthSubtotal(
+                year=day.year, month=day.month, start_date=day, end_date=day,
+                total_days=0, working_days_count=0, weekend_days_count=0,
+                public_holidays_count=0, personal_leave_count=0
+            )
+            months.append(sub)
+
+        sub.end_date = day
+        sub.total_days += 1
+
+        if flags & FLAG_HOLIDAY:
+            holidays.append(business_calendar.holiday(day))
+            sub.public_holidays_count += 1
+        if flags & FLAG_WEEKEND:
+            sub.weekend_days_count += 1
+        if flags:
+            continue
+
+        if day in leave_dates:
+            applied_leave.append(day)
+            sub.personal_leave_count += 1
+            continue
+
+        working_days.append(day)
+        sub.working_days_count += 1
+
+    for sub in months:
+        sub.total_reimbursement = sub.working_days_count * rate
+
+    applied_set = set(applied_leave)
+    ignored_leave = sorted(
+        ld for ld in leave_dates
+        if start_date <= ld <= end_date and ld not in applied_set
+    )
+
+    return RangeCalculationResult(
+        grade=grade,
+        rate=rate,
+        start_date=start_date,
+        end_date=end_date,
+        total_days=(end_date - start_date).days + 1,
+        working_days_count=len(working_days),
+        weekend_days_count=sum(m.weekend_days_count for m in months),
+        public_holidays_count=len(holidays),
+        personal_leave_count=len(applied_leave),
+        holidays=holidays,
+        working_days=working_days,
+        leave_days=applied_leave,
+        ignored_leave_dates=ignored_leave,
+        months=months,
+        total_reimbursement=len(working_days) * rate
+    )
@@ -0,0 +1,27 @@
+import re
+import datetime as dt
+from typing import Optional, Set
+
+# Accepted leave formats, tried in order (ISO first)
+DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y")
+
+_SEPARATORS = re.compile(r'[,;\n]')
+
+def parse_date(text: str) -> Optional[dt.date]:
+    """Parse a single date in any of DATE_FORMATS. Returns None if invalid."""
+    text = text.strip()
+    for fmt in DATE_FORMATS:
+        try:
+            return dt.datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+def parse_dates(text: str) -> Set[dt.date]:
+    """Parse a comma, semicolon or newline separated list, skipping invalid entries."""
+    dates = set()
+    for part in _SEPARATORS.split(text or ""):
+        d = parse_date(part)
+        if d:
+            dates.add(d)
+    return dates
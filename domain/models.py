@@ -1,7 +1,7 @@
 
 from dataclasses import dataclass, field
-from datetime import date
-from typing import List, Optional
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Set, Tuple
 
 @dataclass
 class Holiday:
@@ -41,3 +41,114 @@ class CalculationResult:
     @property
     def ignored_leave_count(self) -> int:
         return len(self.ignored_leave_dates)
+
+    def fingerprint(self) -> str:
+        """Stable hash of everything that ends up on the page. Two results with the
+        same fingerprint render identically, so it can key preview caches."""
+        import hashlib
+        from dataclasses import astuple
+        return hashlib.sha1(repr(astuple(self)).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class MonthSubtotal:
+    """Counts for the part of a month that falls inside a date range."""
+    year: int
+    month: int
+    start_date: date
+    end_date: date
+    total_days: int
+    working_days_count: int
+    weekend_days_count: int
+    public_holidays_count: int
+    personal_leave_count: int
+    total_reimbursement: int = 0
+
+    @property
+    def period_label(self) -> str:
+        import calendar
+        return f"{calendar.month_name[self.month]} {self.year}"
+
+@dataclass
+class RangeCalculationResult:
+    grade: str
+    rate: int
+    start_date: date
+    end_date: date
+    
+    # Counts
+    total_days: int
+    working_days_count: int
+    weekend_days_count: int
+    public_holidays_count: int
+    personal_leave_count: int
+    
+    # Details
+    holidays: List[Holiday] = field(default_factory=list)
+    working_days: List[date] = field(default_factory=list)
+    leave_days: List[date] = field(default_factory=list)
+    ignored_leave_dates: List[date] = field(default_factory=list)
+    months: List[MonthSubtotal] = field(default_factory=list)
+    
+    # Money
+    total_reimbursement: int = 0
+    
+    @property
+    def period_label(self) -> str:
+        fmt = "%d %b %Y"
+        return f"{self.start_date.strftime(fmt)} - {self.end_date.strftime(fmt)}"
+
+    @property
+    def ignored_leave_count(self) -> int:
+        return len(self.ignored_leave_dates)
+
+@dataclass
+class RosterEntry:
+    employee_id: str
+    grade: str
+    leave_dates: Set[date] = field(default_factory=set)
+    region: Optional[str] = None # None: the roster run's default region
+
+@dataclass
+class HolidayDiff:
+    """What changed between two holiday maps ({date: name})."""
+    added: Dict[date, str] = field(default_factory=dict)
+    removed: Dict[date, str] = field(default_factory=dict)
+    renamed: Dict[date, Tuple[str, str]] = field(default_factory=dict) # date -> (old, new)
+
+    @classmethod
+    def between(cls, old: Dict[date, str], new: Dict[date, str]) -> "HolidayDiff":
+        return cls(
+            added={d: n for d, n in new.items() if d not in old},
+            removed={d: n for d, n in old.items() if d not in new},
+            renamed={d: (old[d], n) for d, n in new.items() if d in old and old[d] != n}
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.renamed)
+
+    @property
+    def dates(self) -> Set[date]:
+        return set(self.added) | set(self.removed) | set(self.renamed)
+
+    @property
+    def months(self) -> Set[Tuple[int, int]]:
+        """(year, month) of every changed date."""
+        return {(d.year, d.month) for d in self.dates}
+
+    @property
+    def affected_months(self) -> Set[Tuple[int, int]]:
+        """
+        Months whose calculations may change. Renames only change labels,
+        but added/removed Sunday holidays also move an observed day, which
+        can spill into the next month.
+        """
+        months = self.months
+        for d in set(self.added) | set(self.removed):
+            if d.weekday() == 6:
+                spill = d + timedelta(days=7)
+                months.add((spill.year, spill.month))
+        return months
+
+    def summary(self) -> str:
+        return f"{len(self.added)} added, {len(self.removed)} removed, {len(self.renamed)} renamed"
@@ -0,0 +1,48 @@
+import unittest
+import random
+from datetime import date, timedelta
+from domain.calculator import calculate_period, calculate_periods, GRADE_RATES
+
+class TestBatchCalculator(unittest.TestCase):
+
+    def setUp(self):
+        # Mix of weekday, Saturday and chained Sunday holidays across two years
+        self.holidays_map = {
+            date(2025, 12, 25): "Christmas",
+            date(2026, 1, 1): "New Year",
+            date(2026, 2, 1): "Holiday A",   # Sun -> observed Tue (Mon taken)
+            date(2026, 2, 2): "Holiday B",   # Mon
+            date(2026, 3, 23): "Hari Raya Aidilfitri",
+            date(2026, 3, 24): "Hari Raya Aidilfitri Day 2",
+            date(2026, 5, 30): "Harvest Festival",  # Sat
+            date(2026, 5, 31): "Harvest Festival Day 2",  # Sun
+        }
+
+    def test_matches_single_period(self):
+        rng = random.Random(42)
+        grades = list(GRADE_RATES.keys()) + ["UNKNOWN"]
+        periods = []
+        for _ in range(300):
+            year = rng.choice([2025, 2026])
+            month = rng.randint(1, 12)
+            start = date(year, month, 1) - timedelta(days=5)
+            leave = {start + timedelta(days=rng.randint(0, 40)) for _ in range(rng.randint(0, 6))}
+            periods.append((year, month, rng.choice(grades), leave))
+
+        batch = calculate_periods(periods, self.holidays_map)
+
+        self.assertEqual(len(batch), len(periods))
+        for (year, month, grade, leave), res in zip(periods, batch):
+            self.assertEqual(res, calculate_period(year, month, grade, self.holidays_map, leave))
+
+    def test_results_do_not_share_lists(self):
+        periods = [(2026, 3, "JG6", set()), (2026, 3, "JG7", set())]
+        first, second = calculate_periods(periods, self.holidays_map)
+
+        first.working_days.pop()
+        first.holidays.pop()
+        self.assertEqual(second.working_days_count, len(second.working_days))
+        self.assertEqual(second.public_holidays_count, len(second.holidays))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import random
+from datetime import date, timedelta
+from domain.business_calendar import BusinessCalendar
+from domain.calculator import calculate_period, is_weekend, apply_observed_rule
+
+class TestBusinessCalendar(unittest.TestCase):
+
+    def setUp(self):
+        self.holidays_map = {
+            date(2026, 1, 1): "New Year",
+            date(2026, 2, 1): "Holiday A",   # Sun -> observed Tue 3rd
+            date(2026, 2, 2): "Holiday B",   # Mon
+            date(2026, 5, 30): "Harvest Festival",  # Sat
+            date(2026, 12, 25): "Christmas",
+            date(2027, 1, 1): "New Year",
+        }
+        self.cal = BusinessCalendar(2026, 2027, self.holidays_map)
+        self.observed = apply_observed_rule(self.holidays_map)
+
+    def _brute_count(self, start, end):
+        count = 0
+        d = start
+        while d <= end:
+            if not is_weekend(d) and d not in self.observed:
+                count += 1
+            d += timedelta(days=1)
+        return count
+
+    def test_flags(self):
+        self.assertFalse(self.cal.is_working_day(date(2026, 2, 3)))  # observed
+        self.assertTrue(self.cal.is_holiday(date(2026, 2, 3)))
+        self.assertTrue(self.cal.holiday(date(2026, 2, 3)).is_observed)
+        self.assertFalse(self.cal.is_working_day(date(2026, 2, 7)))  # Sat
+        self.assertTrue(self.cal.is_working_day(date(2026, 2, 4)))
+
+    def test_range_counts_match_brute_force(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            a = date(2026, 1, 1) + timedelta(days=rng.randint(0, 729))
+            b = date(2026, 1, 1) + timedelta(days=rng.randint(0, 729))
+            start, end = min(a, b), max(a, b)
+            self.assertEqual(self.cal.working_days_between(start, end), self._brute_count(start, end))
+
+        self.assertEqual(self.cal.working_days_between(date(2026, 3, 5), date(2026, 3, 1)), 0)
+
+    def test_add_working_days(self):
+        # Fri 30 Jan 2026 -> Mon 2nd and Tue 3rd are holidays -> Wed 4th
+        self.assertEqual(self.cal.add_working_days(date(2026, 1, 30), 1), date(2026, 2, 4))
+        self.assertEqual(self.cal.add_working_days(date(2026, 2, 4), 2), date(2026, 2, 6))
+        with self.assertRaises(ValueError):
+            self.cal.add_working_days(date(2027, 12, 31), 1)
+
+    def test_out_of_range(self):
+        with self.assertRaises(ValueError):
+            self.cal.is_working_day(date(2025, 12, 31))
+
+    def test_calculate_period_with_calendar(self):
+        leave = {date(2026, 2, 4), date(2026, 2, 7)}
+        for month in range(1, 13):
+            expected = calculate_period(2026, month, "JG6", self.holidays_map, leave)
+            actual = calculate_period(2026, month, "JG6", {}, leave, business_calendar=self.cal)
+            self.assertEqual(actual, expected)
+
+if __name__ == '__main__':
+    unittest.main()
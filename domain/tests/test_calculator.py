@@ -1,7 +1,11 @@
 
 import unittest
 from datetime import date
-from domain.calculator import calculate_period, apply_observed_rule, is_weekend, get_days_in_month
+from domain import calculator
+from domain.calculator import (
+    calculate_period, apply_observed_rule, is_weekend, get_days_in_month,
+    expand_observed_holidays, clear_observed_cache, observed_cache_info
+)
 
 class TestCalculator(unittest.TestCase):
     
@@ -107,5 +111,43 @@ class TestCalculator(unittest.TestCase):
         self.assertEqual(result.personal_leave_count, 1)
         self.assertIn(date(2026, 3, 7), result.ignored_leave_dates)
 
+    def test_region_uses_its_own_holidays(self):
+        sabah = {date(2026, 5, 29): "Pesta Kaamatan"}
+        selangor = {date(2026, 3, 20): "Hari Raya Aidilfitri"}
+        regions = {"Selangor": selangor}
+
+        result = calculate_period(2026, 3, "JG6", sabah, set(), region="Selangor", region_holidays=regions)
+        self.assertEqual(result, calculate_period(2026, 3, "JG6", selangor, set()))
+        # No region (or a blank one) is the default calendar
+        self.assertEqual(calculate_period(2026, 3, "JG6", sabah, set(), region="", region_holidays=regions).public_holidays_count, 0)
+        with self.assertRaises(ValueError):
+            calculate_period(2026, 3, "JG6", sabah, set(), region="Johor", region_holidays=regions)
+
+    def test_observed_expansion_is_memoized(self):
+        clear_observed_cache()
+        holidays_map = {date(2026, 2, 1): "Test Holiday"}
+        
+        first = expand_observed_holidays(holidays_map)
+        second = expand_observed_holidays(dict(holidays_map))  # equal map, new object
+        self.assertIs(first, second)
+        self.assertEqual(observed_cache_info()["hits"], 1)
+        self.assertEqual([h.date for h in first.for_month(2026, 2)], [date(2026, 2, 1), date(2026, 2, 2)])
+        
+        # A changed map must not reuse the old expansion
+        holidays_map[date(2026, 2, 2)] = "Other Holiday"
+        third = expand_observed_holidays(holidays_map)
+        self.assertIsNot(first, third)
+        self.assertIn(date(2026, 2, 3), third.by_date)
+        
+        # calculate_period sees the change too
+        result = calculate_period(2026, 2, "JG6", holidays_map, set())
+        self.assertEqual(result.public_holidays_count, 3)
+
+    def test_observed_cache_is_bounded(self):
+        clear_observed_cache()
+        for i in range(calculator.OBSERVED_CACHE_SIZE + 5):
+            expand_observed_holidays({date(2026, 1, 1 + i % 28): f"Holiday {i}"})
+        self.assertEqual(observed_cache_info()["size"], calculator.OBSERVED_CACHE_SIZE)
+
 if __name__ == '__main__':
     unittest.main()
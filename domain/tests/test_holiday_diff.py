@@ -0,0 +1,67 @@
+import unittest
+from datetime import date
+from domain import calculator
+from domain.models import HolidayDiff
+
+class TestHolidayDiff(unittest.TestCase):
+
+    def setUp(self):
+        self.old = {
+            date(2026, 1, 1): "New Year",
+            date(2026, 5, 1): "Labour Day",
+            date(2026, 12, 25): "Christmas",
+        }
+
+    def test_between(self):
+        new = {
+            date(2026, 1, 1): "Tahun Baru",      # renamed
+            date(2026, 5, 1): "Labour Day",      # unchanged
+            date(2026, 8, 31): "National Day",   # added
+        }                                        # Christmas removed
+        diff = HolidayDiff.between(self.old, new)
+
+        self.assertEqual(diff.added, {date(2026, 8, 31): "National Day"})
+        self.assertEqual(diff.removed, {date(2026, 12, 25): "Christmas"})
+        self.assertEqual(diff.renamed, {date(2026, 1, 1): ("New Year", "Tahun Baru")})
+        self.assertEqual(diff.months, {(2026, 1), (2026, 8), (2026, 12)})
+        self.assertEqual(diff.summary(), "1 added, 1 removed, 1 renamed")
+        self.assertTrue(diff)
+
+    def test_no_change(self):
+        diff = HolidayDiff.between(self.old, dict(self.old))
+        self.assertFalse(diff)
+        self.assertEqual(diff.affected_months, set())
+
+    def test_sunday_change_reaches_next_month(self):
+        # 31 May 2026 is a Sunday: its observed day is 1 June
+        diff = HolidayDiff.between(self.old, {**self.old, date(2026, 5, 31): "Wesak"})
+        self.assertEqual(diff.months, {(2026, 5)})
+        self.assertEqual(diff.affected_months, {(2026, 5), (2026, 6)})
+
+    def test_invalidate_observed_months(self):
+        calculator.clear_observed_cache()
+        calculator.expand_observed_holidays(self.old)
+        calculator.expand_observed_holidays({date(2026, 3, 1): "Other map"})
+
+        dropped = calculator.invalidate_observed_months({(2026, 12)})
+
+        self.assertEqual(dropped, 1)
+        self.assertEqual(calculator.observed_cache_info()["size"], 1)
+
+    def test_invalidate_observed_months_of_one_region(self):
+        calculator.clear_observed_cache()
+        other_region = {date(2026, 12, 25): "Hari Krismas"} # Shares the month
+        calculator.expand_observed_holidays(self.old)
+        calculator.expand_observed_holidays({**self.old, date(2027, 1, 1): "New Year"}) # Built from it
+        calculator.expand_observed_holidays(other_region)
+
+        dropped = calculator.invalidate_observed_months({(2026, 12)}, previous=self.old)
+
+        self.assertEqual(dropped, 2)
+        self.assertEqual(calculator.observed_cache_info()["size"], 1)
+        self.assertEqual(calculator.observed_cache_info()["misses"], 3)
+        calculator.expand_observed_holidays(other_region)
+        self.assertEqual(calculator.observed_cache_info()["hits"], 1) # Still cached
+
+if __name__ == '__main__':
+    unittest.main()
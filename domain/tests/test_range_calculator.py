@@ -0,0 +1,59 @@
+import unittest
+from datetime import date
+from domain.calculator import calculate_period, calculate_range
+
+class TestRangeCalculator(unittest.TestCase):
+
+    def setUp(self):
+        self.holidays_map = {
+            date(2023, 12, 25): "Christmas",
+            date(2023, 12, 31): "Year End",     # Sun -> observed Mon 1 Jan 2024
+            date(2024, 2, 10): "CNY Day 1",     # Sat
+            date(2024, 2, 11): "CNY Day 2",     # Sun -> observed Mon 12th
+        }
+
+    def test_full_month_matches_calculate_period(self):
+        leave = {date(2024, 2, 5), date(2024, 2, 10)}
+        expected = calculate_period(2024, 2, "JG6", self.holidays_map, leave)
+        res = calculate_range(date(2024, 2, 1), date(2024, 2, 29), "JG6", self.holidays_map, leave)
+
+        self.assertEqual(res.total_days, expected.total_days_in_month)
+        self.assertEqual(res.working_days, expected.working_days)
+        self.assertEqual(res.holidays, expected.holidays)
+        self.assertEqual(res.leave_days, expected.leave_days)
+        self.assertEqual(res.ignored_leave_dates, expected.ignored_leave_dates)
+        self.assertEqual(res.weekend_days_count, expected.weekend_days_count)
+        self.assertEqual(res.total_reimbursement, expected.total_reimbursement)
+        self.assertEqual(len(res.months), 1)
+
+    def test_cross_year_cycle(self):
+        # 16 Dec 2023 - 15 Jan 2024
+        res = calculate_range(date(2023, 12, 16), date(2024, 1, 15), "JG6", self.holidays_map, set())
+
+        self.assertEqual(res.total_days, 31)
+        self.assertEqual([(m.year, m.month) for m in res.months], [(2023, 12), (2024, 1)])
+        self.assertEqual(res.months[0].start_date, date(2023, 12, 16))
+        self.assertEqual(res.months[1].end_date, date(2024, 1, 15))
+
+        # Observed day crosses the year boundary
+        observed = [h for h in res.holidays if h.is_observed]
+        self.assertEqual([h.date for h in observed], [date(2024, 1, 1)])
+        self.assertNotIn(date(2024, 1, 1), res.working_days)
+
+        # Dec 16-31: 10 weekdays - 25th = 9; Jan 1-15: 11 weekdays - 1st = 10
+        self.assertEqual(res.months[0].working_days_count, 9)
+        self.assertEqual(res.months[1].working_days_count, 10)
+        self.assertEqual(res.working_days_count, 19)
+        self.assertEqual(res.total_reimbursement, sum(m.total_reimbursement for m in res.months))
+
+    def test_observed_spill_in_before_range_start(self):
+        res = calculate_range(date(2024, 1, 1), date(2024, 1, 5), "JG5", self.holidays_map, set())
+        self.assertEqual(res.public_holidays_count, 1)
+        self.assertEqual(res.working_days_count, 4)
+
+    def test_invalid_range(self):
+        with self.assertRaises(ValueError):
+            calculate_range(date(2024, 2, 1), date(2024, 1, 1), "JG6", {}, set())
+
+if __name__ == '__main__':
+    unittest.main()
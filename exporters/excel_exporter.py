@@ -223,6 +223,11 @@ class ExcelExporter:
         ws = self.wb.create_sheet('Details', 1)
         ws.append(["Date", "Day", "Status", "Note"])
         
+        # Lookups built once, not per day
+        holidays_map = {h.date: h.name for h in self.result.holidays}
+        leave_set = set(self.result.leave_days)
+        working_set = set(self.result.working_days)
+        
         # We need to iterate all days
         cal = calendar.Calendar()
         for day in cal.itermonthdates(self.result.year, self.result.month):
@@ -232,16 +237,14 @@ class ExcelExporter:
             status = "Working Day"
             note = ""
             
-            holidays_map = {h.date: h.name for h in self.result.holidays}
-            
             if day in holidays_map:
                 status = "Public Holiday"
                 note = holidays_map[day]
-            elif day in self.result.leave_days:
+            elif day in leave_set:
                 status = "Personal Leave"
             elif day.weekday() >= 5:
                 status = "Weekend"
-            elif day not in self.result.working_days:
+            elif day not in working_set:
                  status = "Excluded"
             
             ws.append([day, day.strftime("%A"), status, note])
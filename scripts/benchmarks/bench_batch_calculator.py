@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Compare per-result cost of calculate_period vs calculate_periods."""
+
+import os
+import random
+import sys
+import time
+import datetime as dt
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from domain.calculator import calculate_period, calculate_periods, GRADE_RATES
+
+HOLIDAYS = {
+    dt.date(2026, 1, 1): "New Year",
+    dt.date(2026, 2, 17): "Chinese New Year",
+    dt.date(2026, 2, 18): "Chinese New Year Day 2",
+    dt.date(2026, 3, 21): "Hari Raya Aidilfitri",
+    dt.date(2026, 3, 22): "Hari Raya Aidilfitri Day 2",
+    dt.date(2026, 5, 1): "Labour Day",
+    dt.date(2026, 5, 30): "Harvest Festival",
+    dt.date(2026, 5, 31): "Harvest Festival Day 2",
+    dt.date(2026, 8, 31): "National Day",
+    dt.date(2026, 9, 16): "Malaysia Day",
+    dt.date(2026, 12, 25): "Christmas",
+}
+
+
+def make_periods(n: int, seed: int = 1):
+    rng = random.Random(seed)
+    grades = list(GRADE_RATES.keys())
+    periods = []
+    for _ in range(n):
+        month = rng.randint(1, 12)
+        leave = set()
+        # Roughly a third of staff take some leave in a given month
+        if rng.random() < 0.33:
+            leave = {dt.date(2026, month, rng.randint(1, 28)) for _ in range(rng.randint(1, 3))}
+        periods.append((2026, month, rng.choice(grades), leave))
+    return periods
+
+
+def bench(n: int):
+    periods = make_periods(n)
+
+    t0 = time.perf_counter()
+    for year, month, grade, leave in periods:
+        calculate_period(year, month, grade, HOLIDAYS, leave)
+    single = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    calculate_periods(periods, HOLIDAYS)
+    batch = time.perf_counter() - t0
+
+    print(f"{n:>7} employee-months | "
+          f"calculate_period: {single / n * 1e6:7.2f} us/result ({single:6.2f}s) | "
+          f"calculate_periods: {batch / n * 1e6:7.2f} us/result ({batch:6.2f}s) | "
+          f"x{single / batch:.1f}")
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [10_000, 100_000]
+    for n in sizes:
+        bench(n)
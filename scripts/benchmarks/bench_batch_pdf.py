@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Pages per second for N single-page PDFs (PdfExporter, one document per
+result) vs one N-page document (BatchPdfExporter, shared page template).
+Also reports output size and the peak memory of each path.
+
+Timings run untraced. Peak memory is measured in a fresh child process per
+path (peak RSS, so PyMuPDF's native allocations count too), so neither the
+measurement nor the other path's garbage skews it.
+
+    python scripts/benchmarks/bench_batch_pdf.py [N ...]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from domain.calculator import calculate_periods
+from exporters.pdf_exporter import BatchPdfExporter, PdfExporter
+from bench_batch_calculator import HOLIDAYS, make_periods
+
+
+def pages(n: int):
+    # Lazily, like a roster run streaming results in
+    for i, result in enumerate(calculate_periods(make_periods(n), HOLIDAYS)):
+        yield f"EMP{i:06d}", result
+
+
+def run_single(n: int, tmp: str) -> int:
+    size = 0
+    for i, (_label, result) in enumerate(pages(n)):
+        path = os.path.join(tmp, f"single_{i}.pdf")
+        PdfExporter(result).export(path)
+        size += os.path.getsize(path)
+        os.unlink(path)
+    return size
+
+
+def run_batch(n: int, tmp: str) -> int:
+    path = os.path.join(tmp, "batch.pdf")
+    BatchPdfExporter(pages(n)).export(path, fsync="none")
+    return os.path.getsize(path)
+
+
+PATHS = {"single": run_single, "batch": run_batch}
+
+
+def peak_memory(path: str, n: int) -> float:
+    """Peak RSS in MB of a child process running one path."""
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--peak", path, str(n)],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return float(out.strip().splitlines()[-1])
+
+
+def bench(n: int):
+    timings = {}
+    sizes = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, run in PATHS.items():
+            t0 = time.perf_counter()
+            sizes[name] = run(n, tmp)
+            timings[name] = time.perf_counter() - t0
+    peaks = {name: peak_memory(name, n) for name in PATHS}
+
+    print(f"{n:>6} pages | " + " | ".join(
+        f"{name}: {n / timings[name]:7.1f} pages/s {sizes[name] / n / 1024:6.1f} KB/page peak {peaks[name]:6.1f} MB"
+        for name in PATHS
+    ) + f" | batch x{timings['single'] / timings['batch']:.1f}")
+
+
+def _child_peak(path: str, n: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        PATHS[path](n, tmp)
+    print(_peak_rss_mb())
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss survives fork+exec on Linux (it would report the parent's
+    # peak), so prefer this process's own high-water mark
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError: # Windows
+        return float("nan")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--peak"]:
+        _child_peak(sys.argv[2], int(sys.argv[3]))
+    else:
+        sizes = [int(a) for a in sys.argv[1:]] or [100, 1000]
+        for n in sizes:
+            bench(n)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Measure cold-start cost of each CLI subcommand in a fresh interpreter,
+and compare with importing the desktop window module.
+
+Each run reports wall time (median of N) and which heavy modules ended up
+imported (tkinter, openpyxl, reportlab, fitz).
+"""
+
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+HEAVY = ("tkinter", "openpyxl", "reportlab", "fitz", "PIL")
+
+RUNNER = r"""
+import runpy, sys, time
+t0 = time.perf_counter()
+sys.argv = ["cli"] + {args!r}
+try:
+    runpy.run_module("cli", run_name="__main__")
+except SystemExit:
+    pass
+elapsed = time.perf_counter() - t0
+heavy = [m for m in {heavy!r} if m in sys.modules]
+sys.stderr.write("@@%f %s\n" % (elapsed, ",".join(heavy) or "-"))
+"""
+
+IMPORT_RUNNER = r"""
+import sys, time
+t0 = time.perf_counter()
+try:
+    import ui.main_window
+    status = "ok"
+except Exception as e:
+    status = "failed (%s)" % e.__class__.__name__
+elapsed = time.perf_counter() - t0
+heavy = [m for m in {heavy!r} if m in sys.modules]
+sys.stderr.write("@@%f %s %s\n" % (elapsed, ",".join(heavy) or "-", status))
+"""
+
+
+def run(code: str, repeat: int):
+    times = []
+    extra = ""
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+        line = [l for l in proc.stderr.splitlines() if l.startswith("@@")][-1]
+        elapsed, extra = line[2:].split(" ", 1)
+        times.append(float(elapsed))
+    return statistics.median(times), extra
+
+
+def seed_cache(cache_dir: str):
+    sys.path.insert(0, ROOT)
+    import datetime as dt
+    from services.holiday_service import HolidayService
+    HolidayService(cache_dir).save_to_cache(2026, {dt.date(2026, 3, 23): "Hari Raya Aidilfitri"})
+    with open(os.path.join(cache_dir, "roster.csv"), "w", encoding="utf-8") as f:
+        f.write("employee_id,grade,leave_dates\n")
+        for i in range(1000):
+            f.write(f"E{i},JG6,\n")
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    tmp = tempfile.mkdtemp()
+    try:
+        seed_cache(tmp)
+        common = ["--year", "2026", "--cache-dir", tmp, "--offline"]
+        cases = {
+            "calculate": ["calculate", "--month", "3"] + common,
+            "fetch-holidays": ["fetch-holidays"] + common,
+            "batch": ["batch", "--month", "3", "--roster", os.path.join(tmp, "roster.csv"),
+                      "-o", os.path.join(tmp, "out.csv"), "--workers", "1"] + common,
+            "export csv": ["export", "--month", "3", "-o", os.path.join(tmp, "out.csv")] + common,
+            "export xlsx": ["export", "--month", "3", "-o", os.path.join(tmp, "out.xlsx")] + common,
+            "export pdf": ["export", "--month", "3", "-o", os.path.join(tmp, "out.pdf")] + common,
+        }
+
+        print(f"{'command':<16} {'median':>9}  heavy modules loaded")
+        for name, args in cases.items():
+            elapsed, heavy = run(RUNNER.format(args=args, heavy=HEAVY), repeat)
+            print(f"{name:<16} {elapsed * 1000:7.1f}ms  {heavy}")
+
+        elapsed, extra = run(IMPORT_RUNNER.format(heavy=HEAVY), repeat)
+        print(f"{'GUI import':<16} {elapsed * 1000:7.1f}ms  {extra}")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
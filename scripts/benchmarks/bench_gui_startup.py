@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Time-to-first-interactive-window for the desktop app.
+
+Runs each mode in a fresh interpreter (in a scratch working directory so
+settings/cache files are not touched) and reports the median time from
+interpreter start of the measurement to the first idle callback after
+MainWindow is built:
+
+  eager  - imports exporters, PyMuPDF and PIL up front (old behaviour)
+  lazy   - current behaviour, heavy modules deferred until first use
+
+Needs a display; on a headless box run it under xvfb-run.
+"""
+
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+RUNNER = r"""
+import sys, time
+t0 = time.perf_counter()
+sys.path.insert(0, {root!r})
+if {eager!r}:
+    for name in ("exporters.pdf_exporter", "exporters.excel_exporter", "exporters.csv_exporter",
+                 "fitz", "PIL.Image", "PIL.ImageTk"):
+        try:
+            __import__(name)
+        except Exception:
+            pass
+import tkinter as tk
+from ui.main_window import MainWindow
+root = tk.Tk()
+app = MainWindow(root)
+def done():
+    sys.stderr.write("@@%f\n" % (time.perf_counter() - t0))
+    root.destroy()
+root.after_idle(done)
+root.mainloop()
+"""
+
+
+def run(eager: bool, repeat: int, cwd: str):
+    times = []
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-c", RUNNER.format(root=ROOT, eager=eager)],
+            cwd=cwd, capture_output=True, text=True
+        )
+        lines = [l for l in proc.stderr.splitlines() if l.startswith("@@")]
+        if not lines:
+            raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "no output")
+        times.append(float(lines[-1][2:]))
+    return statistics.median(times)
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    cwd = tempfile.mkdtemp()
+    try:
+        for label, eager in (("eager (before)", True), ("lazy (after)", False)):
+            try:
+                print(f"{label:<16} {run(eager, repeat, cwd) * 1000:7.1f}ms to first idle window")
+            except RuntimeError as e:
+                print(f"{label:<16} failed: {e}")
+    finally:
+        shutil.rmtree(cwd, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
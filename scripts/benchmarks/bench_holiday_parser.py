@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Compare the legacy regex/lookback holiday parser with the streaming
+HolidayPageParser on a saved copy of the holiday page at 1x, 10x and 100x.
+
+The larger sizes repeat the page body, which is how the real page grows
+when more years are listed. Both parsers must return the same dict.
+
+    python scripts/benchmarks/bench_holiday_parser.py [saved_page.html]
+"""
+
+import os
+import re
+import sys
+import time
+import tracemalloc
+import datetime as dt
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, ROOT)
+
+from services.holiday_parser import HolidayPageParser
+
+DEFAULT_PAGE = os.path.join(ROOT, "tests", "fixtures", "sabah_public_holidays.html")
+CHUNK = 16 * 1024
+
+
+def legacy_parse(body: str, year: int):
+    """The parser HolidayService used before the streaming rewrite (verbatim logic)."""
+    holidays_dict = {}
+    body = re.sub(r'<script[^>]*>.*?</script>', '', body, flags=re.DOTALL | re.IGNORECASE)
+    body = re.sub(r'<style[^>]*>.*?</style>', '', body, flags=re.DOTALL | re.IGNORECASE)
+    date_pattern = r'(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})'
+    lines = body.split('\n')
+    for i, line in enumerate(lines):
+        date_match = re.search(date_pattern, line)
+        if date_match:
+            date_str = date_match.group(0)
+            try:
+                parsed_date = dt.datetime.strptime(date_str, "%d %B %Y").date()
+            except ValueError:
+                continue
+            if parsed_date.year == year:
+                holiday_name = "Public Holiday"
+                for j in range(max(0, i - 5), i + 1):
+                    clean_line = re.sub(r'<[^>]+>', '', lines[j])
+                    clean_line = re.sub(r'\s+', ' ', clean_line).strip()
+                    if date_str in clean_line: continue
+                    if re.search(r'\d{1,2}\s+[A-Za-z]+', clean_line): continue
+                    if len(clean_line) < 5 or clean_line.isdigit(): continue
+                    if clean_line.lower() in ['cuti', 'tarikh', 'edit', 'holiday', 'date']: continue
+                    if clean_line:
+                        holiday_name = clean_line
+                        break
+                holiday_name = re.sub(r'\s+\d{4}$', '', holiday_name).strip()
+                holiday_name = re.sub(r'^\d{1,2}\s+[A-Za-z]+\s*', '', holiday_name)
+                if parsed_date in holidays_dict:
+                    if holiday_name not in holidays_dict[parsed_date]:
+                        holidays_dict[parsed_date] += f" / {holiday_name}"
+                else:
+                    holidays_dict[parsed_date] = holiday_name
+    return holidays_dict
+
+
+def streaming_parse(body: str, year: int):
+    # Feed in network-sized chunks, as fetch_holidays_sync does
+    parser = HolidayPageParser(year)
+    for i in range(0, len(body), CHUNK):
+        parser.feed(body[i:i + CHUNK])
+    return parser.close()
+
+
+def scale_page(page: str, factor: int) -> str:
+    start = page.find("<body")
+    end = page.rfind("</body>")
+    if start == -1 or end == -1:
+        return page * factor
+    return page[:start] + page[start:end] * factor + page[end:]
+
+
+def measure(fn, body, year, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn(body, year)
+        best = min(best, time.perf_counter() - t0)
+    # Peak allocation excludes the input string itself
+    tracemalloc.start()
+    fn(body, year)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, best, peak
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PAGE
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        page = f.read()
+    year = 2026
+
+    print(f"page: {path} ({len(page) / 1024:.1f} KiB)")
+    print(f"{'size':>5} {'bytes':>10} | {'legacy':>10} {'peak':>9} | {'streaming':>10} {'peak':>9} | speedup")
+    for factor in (1, 10, 100):
+        body = scale_page(page, factor)
+        repeat = 20 if factor < 100 else 3
+        old, old_t, old_mem = measure(legacy_parse, body, year, repeat)
+        new, new_t, new_mem = measure(streaming_parse, body, year, repeat)
+        assert old == new, f"Parsers disagree at {factor}x"
+        print(f"{factor:>4}x {len(body):>10,} | {old_t * 1000:8.2f}ms {old_mem / 1024:7.0f}K | "
+              f"{new_t * 1000:8.2f}ms {new_mem / 1024:7.0f}K | x{old_t / new_t:.1f}")
+
+
+if __name__ == "__main__":
+    main()
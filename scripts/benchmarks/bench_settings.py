@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Cost of N rapid SettingsService.set() calls, as the settings tab makes them
+(combobox changes, checkbox toggles), with write-through persistence (the
+old behaviour) and with debounced background flushes.
+
+    python scripts/benchmarks/bench_settings.py [N]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, ROOT)
+
+from services.settings_service import SettingsService
+
+GRADES = ["JG5", "JG6", "JG7", "JG8", "JGA"]
+
+
+def run(label: str, n: int, **kwargs):
+    with tempfile.TemporaryDirectory() as tmp:
+        service = SettingsService(os.path.join(tmp, "settings.json"), **kwargs)
+        start = time.perf_counter()
+        for i in range(n):
+            service.set("default_grade", GRADES[i % len(GRADES)])
+            service.set("auto_open_export", i % 2 == 0)
+        elapsed = time.perf_counter() - start
+        service.close()
+        calls = n * 2
+        print(f"{label:<14} {calls:>6} sets  {elapsed * 1000:9.2f} ms  "
+              f"{elapsed / calls * 1e6:8.1f} us/set  {service.writes:>6} writes")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    run("write-through", n, flush_delay=None)
+    run("debounced", n)
+
+
+if __name__ == "__main__":
+    main()
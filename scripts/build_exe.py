@@ -30,6 +30,7 @@ def main():
         "--name", APP_NAME,
         "--hidden-import", "babel.numbers", # Often missed
         "--collect-all", "reportlab",       # Ensure reportlab resources are there
+        "--add-data", f"data/holidays.bin{os.pathsep}data", # Offline holiday dataset
         MAIN_SCRIPT
     ]
     
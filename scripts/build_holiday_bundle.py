@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Regenerate the bundled offline holiday dataset (data/holidays.bin) from a
+holiday cache store.
+
+    python scripts/build_holiday_bundle.py --db holidays.db
+    python scripts/build_holiday_bundle.py --db holidays.db --fetch 2025 2026 2027
+    python scripts/build_holiday_bundle.py --db holidays.db --national-from Sabah
+
+--fetch refreshes those years from the live source into the store first.
+--national-from derives the "Malaysia" region (the federal public holidays
+only, which fall on the same dates in every state) from one state's rows,
+so states without a registered source still get a baseline calendar.
+The dataset version defaults to today's date (YYYYMMDD); bump it whenever
+the shipped data changes so the app reports which snapshot it is using.
+"""
+
+import argparse
+import os
+import re
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from services.holiday_bundle import HolidayBundle, build_bundle
+from services.holiday_store import HolidayStore, DB_FILENAME
+
+NATIONAL_REGION = "Malaysia"
+
+# Federal public holidays (Holidays Act 1951), matched against state page
+# names in Malay or English. New Year's Day is left out: several states
+# don't observe it.
+NATIONAL_PATTERNS = [
+    r"tahun (baru|baharu) cina|chinese new year",
+    r"hari raya (aidilfitri|puasa)",
+    r"hari pekerja|labou?r day",
+    r"wesak",
+    r"agong|king'?s birthday",
+    r"hari raya (haji|qurban|aidiladha)",
+    r"awal muharram|maal hijrah",
+    r"maulidur rasul",
+    r"hari kebangsaan|national day",
+    r"hari malaysia|malaysia day",
+    r"deepavali",
+    r"hari krismas|christmas day",
+]
+_NATIONAL = re.compile("|".join(f"(?:{p})" for p in NATIONAL_PATTERNS), re.IGNORECASE)
+
+
+def national_holidays(holidays):
+    """
+    The federal subset of one state's {date: name}. Merged names such as
+    "Hari Wesak / Wesak Day / Pesta Kaamatan (Hari Kedua) / ..." keep only
+    their federal parts.
+    """
+    national = {}
+    for day, name in holidays.items():
+        parts = [part for part in name.split(" / ") if _NATIONAL.search(part)]
+        if parts:
+            national[day] = " / ".join(parts)
+    return national
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", default=DB_FILENAME, help="Holiday store to read (default: ./holidays.db)")
+    parser.add_argument("--out", default=os.path.join(ROOT, "data", "holidays.bin"))
+    parser.add_argument("--version", type=int, help="Dataset version (default: today as YYYYMMDD)")
+    parser.add_argument("--region", action="append", help="Only bundle these regions (repeatable)")
+    parser.add_argument("--fetch", type=int, nargs="*", default=[], metavar="YEAR")
+    parser.add_argument("--national-from", metavar="REGION", help=f"Derive the {NATIONAL_REGION} region from this state")
+    args = parser.parse_args()
+
+    if args.fetch:
+        from services.holiday_service import HolidayService
+        service = HolidayService(os.path.dirname(os.path.abspath(args.db)))
+        for year in args.fetch:
+            holidays, _ = service.get_holidays_sync(year, force_refresh=True)
+            print(f">>> Fetched {year}: {len(holidays)} holidays")
+
+    store = HolidayStore(args.db)
+    extra = []
+    if args.national_from:
+        for year in store.years(args.national_from):
+            holidays, _ = store.load_year(year, args.national_from)
+            extra.append((NATIONAL_REGION, year, national_holidays(holidays)))
+    count = build_bundle(store, args.out, version=args.version, regions=args.region, extra=extra)
+
+    bundle = HolidayBundle.open(args.out)
+    print(f">>> Wrote {args.out} (v{bundle.version}, {os.path.getsize(args.out)} bytes, {count} years)")
+    for region in bundle.regions():
+        years = ", ".join(str(y) for y in bundle.years(region))
+        print(f"    {region}: {years}")
+
+
+if __name__ == "__main__":
+    main()
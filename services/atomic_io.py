@@ -0,0 +1,245 @@
+"""
+Crash-safe file replacement with advisory locking.
+
+atomic_write() writes to a temp file in the target's directory and then
+os.replace()s it over the target, so readers see either the old file or
+the new one, never a partial write. atomic_open() does the same for output
+written incrementally, and atomic_path() for writers that need a filename.
+file_lock() serialises writers (in any process) through a sidecar
+"<name>.lock" file, which is removed again once the lock is released.
+The new file keeps the mode of the file it replaces (a new file gets the
+usual 0o666 minus umask), not the owner-only mode of the temp file.
+
+fsync policy:
+    "none"  rely on the OS to flush eventually (fastest)
+    "file"  fsync the temp file before the rename (default): after a crash
+            the target holds the old or the new content, never garbage
+    "full"  also fsync the directory so the rename itself is durable
+"""
+import os
+import stat
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Union
+
+FSYNC_POLICIES = ("none", "file", "full")
+DEFAULT_FSYNC = "file"
+LOCK_TIMEOUT = 10.0
+
+# Read once: the only way to query the umask is to set it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@contextmanager
+def file_lock(path: Union[str, Path], timeout: float = LOCK_TIMEOUT):
+    """Exclusive advisory lock on `path` (via path + '.lock'). Raises TimeoutError."""
+    lock_path = str(path) + ".lock"
+    deadline = time.monotonic() + timeout
+    while True:
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            while True:
+                try:
+                    _lock(fd)
+                    break
+                except OSError:
+                    if time.monotonic() >= deadline:
+                        raise TimeoutError(f"Timed out waiting for lock on {path}")
+                    time.sleep(0.01)
+        except BaseException:
+            os.close(fd)
+            raise
+        if _is_current(fd, lock_path):
+            break
+        # The previous holder removed the file after we opened it
+        _unlock(fd)
+        os.close(fd)
+
+    try:
+        yield
+    finally:
+        if os.name == "nt":
+            _unlock(fd)
+            os.close(fd)
+            # Fails while another process has it open; that one removes it
+            _remove(lock_path)
+        else:
+            # Removed while still held, so a waiter on it notices and retries
+            _remove(lock_path)
+            _unlock(fd)
+            os.close(fd)
+
+
+def _is_current(fd: int, lock_path: str) -> bool:
+    if os.name == "nt":
+        return True # An open file can't be removed there
+    try:
+        on_disk = os.stat(lock_path)
+    except FileNotFoundError:
+        return False
+    held = os.fstat(fd)
+    return (on_disk.st_dev, on_disk.st_ino) == (held.st_dev, held.st_ino)
+
+
+def _remove(path: str):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+if os.name == "nt":
+    import msvcrt
+
+    def _lock(fd):
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+
+    def _unlock(fd):
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock(fd):
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def _unlock(fd):
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def atomic_write(
+    path: Union[str, Path],
+    data: Union[str, bytes],
+    fsync: str = DEFAULT_FSYNC,
+    lock: bool = True,
+    encoding: str = "utf-8"
+):
+    """Replace `path` with `data` atomically (see module docstring)."""
+    if fsync not in FSYNC_POLICIES:
+        raise ValueError(f"Unknown fsync policy: {fsync}")
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(data, str):
+        data = data.encode(encoding)
+
+    if lock:
+        with file_lock(path):
+            _replace(path, data, fsync)
+    else:
+        _replace(path, data, fsync)
+
+
+@contextmanager
+def atomic_open(path: Union[str, Path], fsync: str = DEFAULT_FSYNC, lock: bool = True):
+    """
+    Streaming version of atomic_write(): yields a binary file to write into.
+    The target is only replaced if the block finishes without an exception,
+    so large outputs (batch PDFs) never have to be held in memory.
+    """
+    if fsync not in FSYNC_POLICIES:
+        raise ValueError(f"Unknown fsync policy: {fsync}")
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+            if fsync != "none":
+                f.flush()
+                os.fsync(f.fileno())
+        if lock:
+            with file_lock(path):
+                _replace_file(tmp, path)
+        else:
+            _replace_file(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    _sync_dir(path, fsync)
+
+
+@contextmanager
+def atomic_path(path: Union[str, Path], fsync: str = DEFAULT_FSYNC, lock: bool = True):
+    """
+    For writers that insist on a filename (openpyxl, csv, reportlab): yields a
+    temp path next to `path` to write to, which replaces `path` if the block
+    finishes without an exception and is removed otherwise.
+    """
+    if fsync not in FSYNC_POLICIES:
+        raise ValueError(f"Unknown fsync policy: {fsync}")
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        yield tmp
+        if fsync != "none":
+            with open(tmp, "rb+") as f:
+                os.fsync(f.fileno())
+        if lock:
+            with file_lock(path):
+                _replace_file(tmp, path)
+        else:
+            _replace_file(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    _sync_dir(path, fsync)
+
+
+def _replace(path: Path, data: bytes, fsync: str):
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if fsync != "none":
+                f.flush()
+                os.fsync(f.fileno())
+        _replace_file(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    _sync_dir(path, fsync)
+
+
+def _sync_dir(path: Path, fsync: str):
+    if fsync == "full" and os.name != "nt":
+        dir_fd = os.open(str(path.parent), os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def _replace_file(src: str, dst: Path, attempts: int = 20):
+    # mkstemp creates the temp file 0600; give it the target's mode instead
+    try:
+        mode = stat.S_IMODE(os.stat(dst).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    os.chmod(src, mode)
+    # Windows refuses to replace a file another process has open for
+    # reading; such readers are brief, so retry for a moment
+    for attempt in range(attempts):
+        try:
+            os.replace(src, dst)
+            return
+        except PermissionError:
+            if os.name != "nt" or attempt == attempts - 1:
+                raise
+            time.sleep(0.01)
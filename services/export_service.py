@@ -0,0 +1,254 @@
+import os
+import re
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from domain.models import CalculationResult
+from services.atomic_io import DEFAULT_FSYNC, atomic_open, atomic_path
+
+EXPORT_FORMATS = ("pdf", "xlsx", "csv")
+MERGE_MODES = ("pdf", "zip")
+
+# Files per task sent to a worker. Small enough that progress moves and one
+# bad chunk doesn't hold up much, big enough to amortise the pickling.
+DEFAULT_CHUNK_SIZE = 25
+
+
+@dataclass
+class ExportJob:
+    name: str # Output file stem, e.g. the employee ID
+    result: CalculationResult
+
+
+@dataclass
+class ExportOutcome:
+    name: str
+    fmt: str
+    path: str
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class ExportReport:
+    outcomes: List[ExportOutcome] = field(default_factory=list)
+    merged: Optional[ExportOutcome] = None
+    elapsed: float = 0.0
+
+    @property
+    def failures(self) -> List[ExportOutcome]:
+        failed = [o for o in self.outcomes if not o.ok]
+        if self.merged is not None and not self.merged.ok:
+            failed.append(self.merged)
+        return failed
+
+    @property
+    def files_per_second(self) -> float:
+        written = sum(1 for o in self.outcomes if o.ok)
+        return written / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        written = sum(1 for o in self.outcomes if o.ok)
+        text = f"{written}/{len(self.outcomes)} files in {self.elapsed:.2f}s ({self.files_per_second:,.1f} files/s)"
+        if self.failures:
+            text += f", {len(self.failures)} failed"
+        return text
+
+
+def safe_name(name: str) -> str:
+    """File-system safe version of a job name (employee IDs can hold anything)."""
+    cleaned = re.sub(r"[^A-Za-z0-9._-]+", "_", str(name)).strip("._")
+    return cleaned or "unnamed"
+
+
+def export_file(result: CalculationResult, fmt: str, path: str, holiday_source: str = "", label: Optional[str] = None):
+    """Write a result in the given format, importing only that exporter."""
+    if fmt == "pdf":
+        from exporters.pdf_exporter import PdfExporter
+        PdfExporter(result, holiday_source, label).export(path)
+    elif fmt == "xlsx":
+        from exporters.excel_exporter import ExcelExporter
+        ExcelExporter(result, holiday_source).export(path)
+    elif fmt == "csv":
+        from exporters.csv_exporter import CsvExporter
+        CsvExporter(result).export(path)
+    else:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+
+def _unique_stems(jobs: List[ExportJob], reserved: Iterable[str] = ()) -> List[str]:
+    # Different IDs can clean up to the same name ("A/1", "A 1"); keep both
+    seen = {name.lower(): 1 for name in reserved}
+    stems = []
+    for job in jobs:
+        stem = safe_name(job.name)
+        count = seen.get(stem.lower(), 0) + 1
+        seen[stem.lower()] = count
+        stems.append(stem if count == 1 else f"{stem}-{count}")
+    return stems
+
+
+def _export_chunk(
+    chunk: List[Tuple[str, ExportJob]],
+    formats: Tuple[str, ...],
+    out_dir: str,
+    holiday_source: str,
+    fsync: str
+) -> List[ExportOutcome]:
+    # Runs in a worker process. A failing file is recorded, never raised,
+    # so the rest of the chunk still gets written.
+    outcomes = []
+    for stem, job in chunk:
+        for fmt in formats:
+            path = os.path.join(out_dir, f"{stem}.{fmt}")
+            started = time.perf_counter()
+            error = None
+            try:
+                # Each output file is unique to its job, no cross-process lock needed
+                with atomic_path(path, fsync=fsync, lock=False) as tmp:
+                    export_file(job.result, fmt, tmp, holiday_source, label=job.name)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            outcomes.append(ExportOutcome(job.name, fmt, path, time.perf_counter() - started, error))
+    return outcomes
+
+
+def _export_merged_pdf(jobs: List[ExportJob], path: str, holiday_source: str, fsync: str) -> ExportOutcome:
+    # Runs in a worker alongside the shards
+    from exporters.pdf_exporter import BatchPdfExporter
+    started = time.perf_counter()
+    error = None
+    try:
+        BatchPdfExporter(((j.name, j.result) for j in jobs), holiday_source).export(path, fsync=fsync)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    return ExportOutcome("merged", "pdf", path, time.perf_counter() - started, error)
+
+
+class ExportService:
+    """
+    Writes one file per (job, format) into out_dir, in parallel.
+
+    Jobs are split into chunks and fanned out over a process pool (the
+    exporters are CPU bound, so threads would not help). Every file is
+    written through a temp file and renamed into place, so a crash never
+    leaves a half-written export behind. Failures are collected in the
+    report instead of aborting the batch.
+
+    merge="pdf" also writes every job into one multi-page PDF (rendered
+    by a worker next to the shards, using the shared page template);
+    merge="zip" packs all written files into one archive afterwards.
+    """
+
+    def __init__(
+        self,
+        out_dir: str,
+        formats: Iterable[str] = ("pdf",),
+        holiday_source: str = "",
+        max_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        fsync: str = DEFAULT_FSYNC
+    ):
+        self.formats = tuple(formats)
+        unknown = [f for f in self.formats if f not in EXPORT_FORMATS]
+        if unknown or not self.formats:
+            raise ValueError(f"Unknown export format(s): {', '.join(unknown) or '(none)'}")
+        self.out_dir = str(out_dir)
+        self.holiday_source = holiday_source
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self.fsync = fsync
+
+    def export(
+        self,
+        jobs: Iterable[ExportJob],
+        merge: Optional[str] = None,
+        merge_name: str = "export",
+        on_progress: Optional[Callable[[int, int, ExportOutcome], None]] = None
+    ) -> ExportReport:
+        """
+        Export every job. on_progress(done, total, outcome) is called in the
+        calling process as each file finishes (chunk by chunk).
+        Returns an ExportReport; the report's outcomes follow job order.
+        """
+        if merge is not None and merge not in MERGE_MODES:
+            raise ValueError(f"Unknown merge mode: {merge}")
+        jobs = list(jobs)
+        Path(self.out_dir).mkdir(parents=True, exist_ok=True)
+        started = time.perf_counter()
+
+        named = list(zip(_unique_stems(jobs, [safe_name(merge_name)] if merge else []), jobs))
+        chunks = [named[i:i + self.chunk_size] for i in range(0, len(named), self.chunk_size)]
+        total = len(jobs) * len(self.formats)
+        results: List[Optional[List[ExportOutcome]]] = [None] * len(chunks)
+        merged = None
+        done = 0
+
+        def record(index: int, outcomes: List[ExportOutcome]):
+            nonlocal done
+            results[index] = outcomes
+            for outcome in outcomes:
+                done += 1
+                if on_progress:
+                    on_progress(done, total, outcome)
+
+        merged_path = os.path.join(self.out_dir, f"{safe_name(merge_name)}.{merge}") if merge else None
+        args = (self.formats, self.out_dir, self.holiday_source, self.fsync)
+
+        # Small batches are not worth the process start-up cost
+        if self.max_workers <= 1 or len(chunks) <= 1:
+            for i, chunk in enumerate(chunks):
+                record(i, _export_chunk(chunk, *args))
+            if merge == "pdf" and jobs:
+                merged = _export_merged_pdf(jobs, merged_path, self.holiday_source, self.fsync)
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, len(chunks) + (merge == "pdf"))) as pool:
+                merged_future = None
+                if merge == "pdf":
+                    merged_future = pool.submit(_export_merged_pdf, jobs, merged_path, self.holiday_source, self.fsync)
+                futures = {pool.submit(_export_chunk, chunk, *args): i for i, chunk in enumerate(chunks)}
+                for future in as_completed(futures):
+                    i = futures[future]
+                    try:
+                        outcomes = future.result()
+                    except Exception as e:
+                        # The worker itself died (BrokenProcessPool) or the chunk
+                        # would not pickle: fail just this chunk's files
+                        outcomes = [
+                            ExportOutcome(job.name, fmt, os.path.join(self.out_dir, f"{stem}.{fmt}"),
+                                          error=f"{type(e).__name__}: {e}")
+                            for stem, job in chunks[i] for fmt in self.formats
+                        ]
+                    record(i, outcomes)
+                if merged_future is not None:
+                    try:
+                        merged = merged_future.result()
+                    except Exception as e:
+                        merged = ExportOutcome("merged", "pdf", merged_path, error=f"{type(e).__name__}: {e}")
+
+        report = ExportReport([o for chunk in results for o in chunk], merged)
+        if merge == "zip":
+            report.merged = self._zip(report.outcomes, merged_path)
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    def _zip(self, outcomes: List[ExportOutcome], path: str) -> ExportOutcome:
+        started = time.perf_counter()
+        error = None
+        try:
+            with atomic_open(path, fsync=self.fsync, lock=False) as f:
+                with zipfile.ZipFile(f, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+                    for outcome in outcomes:
+                        if outcome.ok:
+                            zf.write(outcome.path, arcname=os.path.basename(outcome.path))
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        return ExportOutcome("merged", "zip", path, time.perf_counter() - started, error)
@@ -0,0 +1,91 @@
+"""
+Retry and circuit-breaker policy for holiday fetches.
+
+Transient failures (timeouts, connection errors, 5xx, truncated bodies)
+are retried with jittered exponential backoff. Repeated failures open a
+per-region circuit: further fetches fail fast (callers fall back to the
+cache) while a background probe checks, with growing intervals, whether
+the source has recovered.
+"""
+import random
+import threading
+import time
+from dataclasses import dataclass
+
+
+class FetchError(RuntimeError):
+    """A failed fetch. retryable is True when the source itself misbehaved."""
+
+    def __init__(self, message: str, retryable: bool = False):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class CircuitOpenError(FetchError):
+    """Raised without contacting the source while its circuit is open."""
+
+
+def source_unavailable(error: BaseException) -> bool:
+    return isinstance(error, CircuitOpenError) or getattr(error, "retryable", False)
+
+
+@dataclass
+class RetryPolicy:
+    attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 4.0
+    timeout: float = 5.0 # Per attempt
+    # All attempts and waits of one call: keeps a dead source from blocking
+    # a caller longer than the single 10 s request this replaced
+    total_timeout: float = 8.0
+
+    def delay(self, attempt: int) -> float:
+        """Sleep before retry number `attempt` (1-based): full jitter."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0, max_reset_timeout: float = 300.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        # Time until the next probe; doubles while probes keep failing
+        self.probe_delay = reset_timeout
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            return self.state == self.CLOSED
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.probe_delay = self.reset_timeout
+
+    def record_failure(self) -> bool:
+        """Returns True if this failure opened the circuit (schedule a probe)."""
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN:
+                self.probe_delay = min(self.probe_delay * 2, self.max_reset_timeout)
+            elif self.state == self.OPEN or self.failures < self.failure_threshold:
+                return False
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            return True
+
+    def start_probe(self) -> bool:
+        """Move an open circuit to half-open. Returns False if there's nothing to probe."""
+        with self._lock:
+            if self.state != self.OPEN:
+                return False
+            self.state = self.HALF_OPEN
+            return True
@@ -0,0 +1,194 @@
+"""
+Pre-built holiday dataset shipped with the app (data/holidays.bin).
+
+Used when neither memory nor the local store has a year, so a first run
+without network still works. Live fetches are layered on top as updates.
+
+File layout (little-endian):
+    header   MAGIC, format version, dataset version, #regions, #years, #names
+    regions  per region: u8 length + UTF-8 name
+    years    per (region, year): u16 region index, u16 year, u32 first record, u16 count
+    records  per holiday: u16 day of year (1-based), u16 name index
+    names    u32 offsets (#names + 1) into a UTF-8 blob
+
+Opening only reads the header and the tables above; a year's records and
+names are decoded the first time that year is asked for.
+"""
+import datetime as dt
+import mmap
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from services.atomic_io import atomic_write
+
+MAGIC = b"QSBH"
+FORMAT_VERSION = 1
+BUNDLE_FILENAME = "holidays.bin"
+
+_HEADER = struct.Struct("<4sHIHHH")
+_YEAR_ENTRY = struct.Struct("<HHIH")
+_RECORD = struct.Struct("<HH")
+_OFFSET = struct.Struct("<I")
+
+def default_bundle_path() -> Path:
+    # PyInstaller unpacks data files under sys._MEIPASS
+    base = Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parent.parent))
+    return base / "data" / BUNDLE_FILENAME
+
+
+class HolidayBundle:
+    def __init__(self, data, version: int, regions: List[str], index: Dict[Tuple[str, int], Tuple[int, int]], records_at: int, names_at: int, name_count: int):
+        self._data = data
+        self.version = version
+        self._regions = regions
+        self._index = index
+        self._records_at = records_at
+        self._names_at = names_at
+        self._name_count = name_count
+        self._names: Dict[int, str] = {}
+        self._years: Dict[Tuple[str, int], Dict[dt.date, str]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, path: Optional[str] = None) -> Optional["HolidayBundle"]:
+        """Map the bundle file. Returns None if it is missing or unreadable."""
+        path = Path(path) if path else default_bundle_path()
+        try:
+            with open(path, "rb") as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return cls.from_bytes(data)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Failed to open holiday bundle {path}: {e}")
+            return None
+
+    @classmethod
+    def from_bytes(cls, data) -> "HolidayBundle":
+        magic, fmt, version, n_regions, n_years, n_names = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError("not a holiday bundle")
+        if fmt != FORMAT_VERSION:
+            raise ValueError(f"unsupported bundle format {fmt}")
+
+        pos = _HEADER.size
+        regions = []
+        for _ in range(n_regions):
+            length = data[pos]
+            regions.append(bytes(data[pos + 1:pos + 1 + length]).decode("utf-8"))
+            pos += 1 + length
+
+        index = {}
+        total = 0
+        for _ in range(n_years):
+            region_idx, year, first, count = _YEAR_ENTRY.unpack_from(data, pos)
+            index[(regions[region_idx], year)] = (first, count)
+            total += count
+            pos += _YEAR_ENTRY.size
+
+        names_at = pos + total * _RECORD.size
+        return cls(data, version, regions, index, pos, names_at, n_names)
+
+    # --- Reads ---
+
+    def regions(self) -> List[str]:
+        return list(self._regions)
+
+    def years(self, region: str) -> List[int]:
+        return sorted(year for r, year in self._index if r == region)
+
+    def has_year(self, year: int, region: str) -> bool:
+        return (region, year) in self._index
+
+    def load_year(self, year: int, region: str) -> Optional[Dict[dt.date, str]]:
+        key = (region, year)
+        if key not in self._index:
+            return None
+        with self._lock:
+            holidays = self._years.get(key)
+            if holidays is None:
+                holidays = self._years[key] = self._decode_year(year, *self._index[key])
+        return dict(holidays)
+
+    def _decode_year(self, year: int, first: int, count: int) -> Dict[dt.date, str]:
+        start = self._records_at + first * _RECORD.size
+        jan1 = dt.date(year, 1, 1).toordinal() - 1
+        records = _RECORD.iter_unpack(self._data[start:start + count * _RECORD.size])
+        return {dt.date.fromordinal(jan1 + day): self._name(idx) for day, idx in records}
+
+    def _name(self, idx: int) -> str:
+        name = self._names.get(idx)
+        if name is None:
+            blob_at = self._names_at + (self._name_count + 1) * _OFFSET.size
+            begin, = _OFFSET.unpack_from(self._data, self._names_at + idx * _OFFSET.size)
+            end, = _OFFSET.unpack_from(self._data, self._names_at + (idx + 1) * _OFFSET.size)
+            name = self._names[idx] = bytes(self._data[blob_at + begin:blob_at + end]).decode("utf-8")
+        return name
+
+
+def encode_bundle(years: Iterable[Tuple[str, int, Dict[dt.date, str]]], version: int) -> bytes:
+    """Serialise (region, year, holidays) entries into the bundle format."""
+    regions: List[str] = []
+    names: Dict[str, int] = {}
+    index = []
+    records = []
+
+    for region, year, holidays in sorted(years, key=lambda e: (e[0], e[1])):
+        if region not in regions:
+            regions.append(region)
+        first = len(records)
+        jan1 = dt.date(year, 1, 1).toordinal() - 1
+        for day in sorted(holidays):
+            if day.year != year:
+                continue
+            name_idx = names.setdefault(holidays[day], len(names))
+            records.append((day.toordinal() - jan1, name_idx))
+        index.append((regions.index(region), year, first, len(records) - first))
+
+    out = bytearray(_HEADER.pack(MAGIC, FORMAT_VERSION, version, len(regions), len(index), len(names)))
+    for region in regions:
+        encoded = region.encode("utf-8")
+        out += bytes([len(encoded)]) + encoded
+    for entry in index:
+        out += _YEAR_ENTRY.pack(*entry)
+    for record in records:
+        out += _RECORD.pack(*record)
+
+    blob = bytearray()
+    offsets = [0]
+    for name in names: # Insertion order == index order
+        blob += name.encode("utf-8")
+        offsets.append(len(blob))
+    for offset in offsets:
+        out += _OFFSET.pack(offset)
+    out += blob
+    return bytes(out)
+
+
+def build_bundle(
+    store,
+    path: str,
+    version: Optional[int] = None,
+    regions: Optional[List[str]] = None,
+    extra: Iterable[Tuple[str, int, Dict[dt.date, str]]] = ()
+) -> int:
+    """
+    Write every cached year in `store` (a HolidayStore) to a bundle file,
+    plus any `extra` (region, year, holidays) entries not in the store.
+    version defaults to today's date as YYYYMMDD. Returns years written.
+    """
+    if version is None:
+        version = int(dt.date.today().strftime("%Y%m%d"))
+    entries = []
+    for region in regions or store.regions():
+        for year in store.years(region):
+            holidays, _ = store.load_year(year, region)
+            entries.append((region, year, holidays))
+    entries.extend(extra)
+
+    # The running app may have the old bundle mapped; replace, never rewrite in place
+    atomic_write(path, encode_bundle(entries, version))
+    return len(entries)
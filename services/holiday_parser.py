@@ -0,0 +1,187 @@
+import re
+import datetime as dt
+from collections import deque
+from typing import Dict, Optional
+
+# Precompiled once; the old parser re-compiled these per line
+DATE_RE = re.compile(
+    r'(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})'
+)
+TAG_RE = re.compile(r'<[^>]+>')
+WS_RE = re.compile(r'\s+')
+DAY_WORD_RE = re.compile(r'\d{1,2}\s+[A-Za-z]+')  # "30 May", "1 May"
+TRAILING_YEAR_RE = re.compile(r'\s+\d{4}$')
+LEADING_DATE_RE = re.compile(r'^\d{1,2}\s+[A-Za-z]+\s*')
+SKIP_OPEN_RE = re.compile(r'<(script|style)[^>]*>', re.IGNORECASE)
+# Line ends: a newline, or the end of a cell/row/block with more text after
+# it on the same line (minified pages have no newlines at all)
+BREAK_RE = re.compile(r'\n|</(?:td|th|tr|p|li|div|h[1-6])\s*>|<br\s*/?>', re.IGNORECASE)
+ROW_START_RE = re.compile(r'<tr[\s>]', re.IGNORECASE)
+
+MONTHS = {name: i for i, name in enumerate(
+    ["January", "February", "March", "April", "May", "June", "July",
+     "August", "September", "October", "November", "December"], 1)}
+IGNORED_NAMES = {'cuti', 'tarikh', 'edit', 'holiday', 'date'}
+
+_UNSET = object()
+
+# How many lines before a date are searched for the holiday name
+LOOKBACK_LINES = 5
+# Longest partial tag held back between chunks before it is treated as text
+MAX_PENDING_TAG = 1024
+# Longest line held before it is processed anyway (text with no breaks)
+MAX_LINE = 64 * 1024
+
+
+def _name_candidate(line: str) -> Optional[str]:
+    """Cleaned line text if it could be a holiday name, else None."""
+    clean = WS_RE.sub(' ', TAG_RE.sub('', line)).strip()
+    if DAY_WORD_RE.search(clean):
+        return None
+    if len(clean) < 5 or clean.isdigit():
+        return None
+    if clean.lower() in IGNORED_NAMES:
+        return None
+    return clean
+
+
+class HolidayPageParser:
+    """
+    Incremental parser for the public-holiday page.
+
+    feed() text chunks as they are read, then close() to get the
+    {date: name} dict. Work is a single forward pass. Memory is bounded
+    by one line (at most MAX_LINE) plus a LOOKBACK_LINES window, whatever
+    the page size.
+
+    Matches the original line-based heuristic: <script>/<style> blocks are
+    removed first, and a date's name is the earliest usable line in the
+    window from LOOKBACK_LINES before the date line up to the date line.
+    Cell and row ends also end a line, and a table row starts a fresh
+    window, so a minified page parses like a pretty-printed one.
+    """
+
+    def __init__(self, year: int):
+        self.year = year
+        self.holidays: Dict[dt.date, str] = {}
+        self._raw = ""          # Unprocessed input (may end in a partial tag)
+        self._skip_close = None # Closing tag we are skipping to, e.g. "</script>"
+        self._line = ""         # Current line of script-free text
+        self._window = deque(maxlen=LOOKBACK_LINES + 1)
+
+    def feed(self, chunk: str):
+        self._raw += chunk
+        self._strip_blocks(final=False)
+
+    def close(self) -> Dict[dt.date, str]:
+        self._strip_blocks(final=True)
+        self._emit("", final=True)
+        return self.holidays
+
+    # --- Stage 1: drop <script>/<style> blocks ---
+
+    def _strip_blocks(self, final: bool):
+        raw = self._raw
+        while raw:
+            if self._skip_close:
+                end = raw.lower().find(self._skip_close)
+                if end == -1:
+                    # Keep just enough to recognise a split closing tag
+                    raw = raw[-(len(self._skip_close) - 1):] if not final else ""
+                    break
+                raw = raw[end + len(self._skip_close):]
+                self._skip_close = None
+                continue
+
+            m = SKIP_OPEN_RE.search(raw)
+            if m:
+                self._emit(raw[:m.start()])
+                self._skip_close = f"</{m.group(1).lower()}>"
+                raw = raw[m.end():]
+                continue
+
+            # No complete opening tag; hold back a trailing partial tag
+            lt = raw.rfind('<')
+            if not final and lt != -1 and '>' not in raw[lt:] and len(raw) - lt < MAX_PENDING_TAG:
+                self._emit(raw[:lt])
+                raw = raw[lt:]
+            else:
+                self._emit(raw)
+                raw = ""
+            break
+        self._raw = raw
+
+    # --- Stage 2: split into lines ---
+
+    def _emit(self, text: str, final: bool = False):
+        buf = self._line + text
+        start = 0
+        for m in BREAK_RE.finditer(buf):
+            if m.group() == '\n':
+                self._process_line(buf[start:m.start()])
+                start = m.end()
+            elif m.end() < len(buf) and buf[m.end()] not in '\r\n':
+                # A tag at the very end waits: a newline may follow in the next chunk
+                self._process_line(buf[start:m.end()])
+                start = m.end()
+        line = buf[start:]
+        while len(line) > MAX_LINE:
+            # No breaks at all: cut after the last tag that fits
+            cut = line.rfind('>', 0, MAX_LINE) + 1 or MAX_LINE
+            self._process_line(line[:cut])
+            line = line[cut:]
+        if final and line:
+            self._process_line(line)
+            line = ""
+        self._line = line
+
+    # --- Stage 3: per-line matching ---
+
+    def _process_line(self, line: str):
+        # Window slots are [raw_line, candidate]; candidates are only worked
+        # out for lines that end up near a date, and then reused.
+        row = None
+        for row in ROW_START_RE.finditer(line):
+            pass
+        if row is not None:
+            # A new row: earlier rows' (and the page header's) text is not its name
+            self._window.clear()
+            line = line[row.start():]
+        slot = [line, _UNSET]
+        self._window.append(slot)
+
+        m = DATE_RE.search(line)
+        if not m:
+            return
+        try:
+            parsed_date = dt.date(int(m.group(3)), MONTHS[m.group(2)], int(m.group(1)))
+        except ValueError:
+            return
+        if parsed_date.year != self.year:
+            return
+
+        holiday_name = "Public Holiday" # Default
+        for slot in self._window:
+            if slot[1] is _UNSET:
+                slot[1] = _name_candidate(slot[0])
+            if slot[1]:
+                holiday_name = slot[1]
+                break
+
+        # Clean name
+        holiday_name = TRAILING_YEAR_RE.sub('', holiday_name).strip()
+        # Remove any remaining date-like prefixes
+        holiday_name = LEADING_DATE_RE.sub('', holiday_name)
+
+        if parsed_date in self.holidays:
+            if holiday_name not in self.holidays[parsed_date]:
+                self.holidays[parsed_date] += f" / {holiday_name}"
+        else:
+            self.holidays[parsed_date] = holiday_name
+
+
+def parse_holiday_page(html: str, year: int) -> Dict[dt.date, str]:
+    """Parse a whole page already in memory."""
+    parser = HolidayPageParser(year)
+    parser.feed(html)
+    return parser.close()
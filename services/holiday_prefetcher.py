@@ -0,0 +1,100 @@
+import itertools
+import queue
+import threading
+from typing import Callable, List, Optional
+
+from services.holiday_service import HolidayService
+
+DEFAULT_RADIUS = 1
+DEFAULT_WORKERS = 2
+
+# on_progress(done, total, year, ok)
+ProgressCallback = Callable[[int, int, int, bool], None]
+
+
+class _Batch:
+    """Progress of one prefetch() call."""
+
+    def __init__(self, total: int, on_progress: Optional[ProgressCallback]):
+        self.total = total
+        self.done = 0
+        self.on_progress = on_progress
+        self._lock = threading.Lock()
+
+    def report(self, year: int, ok: bool):
+        with self._lock:
+            self.done += 1
+            done = self.done
+        if self.on_progress:
+            try:
+                self.on_progress(done, self.total, year, ok)
+            except Exception as e:
+                print(f"Prefetch progress callback failed: {e}")
+
+
+class HolidayPrefetcher:
+    """
+    Loads a year plus `radius` years either side into the HolidayService
+    memory cache ahead of need, so navigation and cross-year calculations
+    can use HolidayService.peek() without waiting.
+
+    Years are worked nearest-first on a small pool of worker threads. A new
+    prefetch() supersedes the previous one: queued years from an older
+    request are skipped rather than fetched.
+    """
+
+    def __init__(self, service: HolidayService, radius: int = DEFAULT_RADIUS, max_workers: int = DEFAULT_WORKERS):
+        self.service = service
+        self.radius = radius
+        self.max_workers = max(1, max_workers)
+        self._queue: "queue.PriorityQueue" = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._workers: List[threading.Thread] = []
+
+    def prefetch(self, center_year: int, radius: Optional[int] = None, on_progress: Optional[ProgressCallback] = None) -> List[int]:
+        """Queue center_year and its neighbours. Returns the years in priority order."""
+        radius = self.radius if radius is None else radius
+        years = sorted(range(center_year - radius, center_year + radius + 1),
+                       key=lambda y: (abs(y - center_year), y))
+        batch = _Batch(len(years), on_progress)
+
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            for year in years:
+                # Priority: distance from the year the user is looking at
+                self._queue.put((abs(year - center_year), next(self._seq), year, generation, batch))
+            self._ensure_workers()
+        return years
+
+    def close(self):
+        """Stop the worker threads (queued work is dropped)."""
+        with self._lock:
+            self._generation += 1
+            for _ in self._workers:
+                self._queue.put((float("inf"), next(self._seq), None, None, None))
+            self._workers = []
+
+    def _ensure_workers(self):
+        while len(self._workers) < self.max_workers:
+            t = threading.Thread(target=self._worker, name="holiday-prefetch", daemon=True)
+            self._workers.append(t)
+            t.start()
+
+    def _worker(self):
+        while True:
+            _, _, year, generation, batch = self._queue.get()
+            if year is None:
+                return
+            if generation != self._generation:
+                continue # Superseded by a newer prefetch()
+
+            ok = True
+            if self.service.peek(year) is None:
+                try:
+                    self.service.get_holidays_sync(year)
+                except Exception:
+                    ok = False
+            batch.report(year, ok)
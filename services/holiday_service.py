@@ -1,167 +1,712 @@
 
-import json
+import asyncio
+import codecs
+import functools
+import hashlib
 import threading
+import time
 import queue
-import urllib.request
-import re
+import tempfile
 import datetime as dt
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Dict, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Tuple
 
-# Define cache schema version
+from domain.models import HolidayDiff
+from services.holiday_store import HolidayStore, Validators, DB_FILENAME, DEFAULT_REGION
+from services.holiday_bundle import HolidayBundle
+from services.holiday_sources import get_source
+from services.fetch_policy import CircuitBreaker, CircuitOpenError, FetchError, RetryPolicy, source_unavailable
+
+READ_CHUNK_SIZE = 16 * 1024
+# A body that may match the cached hash is spooled until the hash is known;
+# past this size the spool moves from memory to a temp file
+SPOOL_MEMORY_SIZE = 256 * 1024
+
+# Schema version of the legacy per-year JSON caches (migrated into the store)
 CACHE_VERSION = 1
 
+# In-memory cache: years kept, and how long data counts as fresh before a
+# background revalidation is started (stale data is still served meanwhile)
+MEMORY_CACHE_SIZE = 8
+DEFAULT_TTL = dt.timedelta(days=7)
+
+# Shared by every HolidayService so concurrent work never spawns more than
+# this many fetch threads in total
+FETCH_POOL_SIZE = 4
+
+# Failures in a row before a region's source is considered down, and the
+# first wait before probing it again (doubles while it stays down)
+BREAKER_THRESHOLD = 3
+BREAKER_RESET = 30.0
+_fetch_pool: Optional[ThreadPoolExecutor] = None
+_fetch_pool_lock = threading.Lock()
+
+def get_fetch_pool() -> ThreadPoolExecutor:
+    global _fetch_pool
+    with _fetch_pool_lock:
+        if _fetch_pool is None:
+            _fetch_pool = ThreadPoolExecutor(max_workers=FETCH_POOL_SIZE, thread_name_prefix="holiday-fetch")
+        return _fetch_pool
+
+# Event loop behind the callback API (fetch_holidays_async), run on a daemon
+# thread so Tk and other synchronous callers can use the async API
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _fetch_pool_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="holiday-loop", daemon=True).start()
+        return _loop
+
+# listener(year, holidays_dict, source, diff), registered per region. diff is
+# what changed against the copy that was in memory, or None if there was none.
+HolidayListener = Callable[[int, Dict[dt.date, str], str, Optional[HolidayDiff]], None]
+
+@dataclass
+class _MemoryEntry:
+    holidays: Dict[dt.date, str]
+    source: str
+    fetched_at: dt.datetime
+
+class FetchedHolidays(dict):
+    """
+    Result of fetch_holidays_sync: a plain {date: name} dict that also
+    carries the page validators. not_modified is True when the source
+    confirmed the cached copy (304 or identical body); the dict then holds
+    the cached holidays and nothing was parsed.
+    """
+    def __init__(self, holidays: Dict[dt.date, str], validators: Validators, not_modified: bool = False):
+        super().__init__(holidays)
+        self.validators = validators
+        self.not_modified = not_modified
+
+def _parse_fetched_at(value: str) -> dt.datetime:
+    try:
+        return dt.datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return dt.datetime.min # Unknown age, treat as stale
+
 class HolidayService:
-    def __init__(self, cache_dir: str = "."):
+    def __init__(
+        self,
+        cache_dir: str = ".",
+        memory_size: int = MEMORY_CACHE_SIZE,
+        ttl: dt.timedelta = DEFAULT_TTL,
+        bundle_path: Optional[str] = None,
+        region: str = DEFAULT_REGION,
+        fsync: str = "file",
+        retry_policy: Optional[RetryPolicy] = None,
+        breaker_threshold: int = BREAKER_THRESHOLD,
+        breaker_reset: float = BREAKER_RESET
+    ):
         self.cache_dir = Path(cache_dir)
-        self.base_url = "https://sabah.gov.my/ms/public-holidays"
+        # Default region for every call that doesn't name one
+        self.region = region
+        source = get_source(region)
+        self.base_url = source.url if source else None
+        
+        # The store (holidays.db) is opened on first use, see `store`
+        self.fsync = fsync
+        self._store: Optional[HolidayStore] = None
+        self._store_lock = threading.Lock()
+        # Shipped dataset, the last resort before the network (see holiday_bundle)
+        self.bundle = HolidayBundle.open(bundle_path) if bundle_path else None
         
-    def get_cache_path(self, year: int) -> Path:
-        return self.cache_dir / f"holiday_cache_{year}.json"
+        # In-memory LRU ((region, year) -> entry), guarded by _lock
+        self.memory_size = memory_size
+        self.ttl = ttl
+        self._memory: "OrderedDict[Tuple[str, int], _MemoryEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: Dict[Tuple[str, int], Future] = {}
+        self._listeners: List[Tuple[HolidayListener, str]] = []
+        self._stats = {
+            "hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0,
+            "refresh_failures": 0, "evictions": 0, "coalesced": 0,
+            "not_modified": 0, "retries": 0, "fast_failures": 0, "probes": 0
+        }
+        
+        # Retry and one circuit breaker per region (see fetch_policy)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset = breaker_reset
+        self._breakers: Dict[str, CircuitBreaker] = {}
 
-    def load_from_cache(self, year: int) -> Optional[Dict[str, Any]]:
-        path = self.get_cache_path(year)
-        if not path.exists():
-            return None
-            
+    @property
+    def store(self) -> HolidayStore:
+        """
+        The SQLite holiday store, created in cache_dir the first time it is
+        needed, so constructing a service (or serving only memory/bundle
+        lookups) never writes a database file.
+        """
+        if self._store is None:
+            with self._store_lock:
+                if self._store is None:
+                    store = HolidayStore(str(self.cache_dir / DB_FILENAME), fsync=self.fsync)
+                    # One-off import of holiday_cache_{year}.json files from older versions
+                    store.migrate_json_caches(str(self.cache_dir), json_version=CACHE_VERSION)
+                    self._store = store
+        return self._store
+
+    # --- In-memory cache ---
+
+    def add_listener(self, listener: HolidayListener, region: Optional[str] = None):
+        """Called (from a worker thread) when a background refresh brings newer data."""
+        self._listeners.append((listener, region or self.region))
+
+    def remove_listener(self, listener: HolidayListener):
+        self._listeners = [(l, r) for l, r in self._listeners if l != listener]
+
+    def peek(self, year: int, region: Optional[str] = None) -> Optional[Dict[dt.date, str]]:
+        """Holidays for a year if already in memory. Never blocks on disk or network."""
+        entry = self._memory_get(year, region or self.region)
+        return dict(entry.holidays) if entry is not None else None
+
+    def cache_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, "size": len(self._memory), "max_size": self.memory_size}
+
+    def _memory_get(self, year: int, region: str) -> Optional[_MemoryEntry]:
+        key = (region, year)
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+            return entry
+
+    def _memory_put(self, year: int, region: str, holidays: Dict[dt.date, str], source: str, fetched_at: dt.datetime):
+        key = (region, year)
+        with self._lock:
+            self._memory[key] = _MemoryEntry(dict(holidays), source, fetched_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def _is_stale(self, entry: _MemoryEntry, region: str) -> bool:
+        source = get_source(region)
+        ttl = source.ttl if source and source.ttl is not None else self.ttl
+        return dt.datetime.now() - entry.fetched_at > ttl
+
+    def breaker(self, region: Optional[str] = None) -> CircuitBreaker:
+        region = region or self.region
+        with self._lock:
+            breaker = self._breakers.get(region)
+            if breaker is None:
+                breaker = self._breakers[region] = CircuitBreaker(self.breaker_threshold, self.breaker_reset)
+            return breaker
+
+    def _fetch_with_retry(self, year: int, region: str, probe: bool = False) -> FetchedHolidays:
+        """
+        fetch_holidays_sync with jittered retries, behind the region's
+        circuit breaker. Every failed attempt counts toward the breaker, and
+        a call's attempts and waits together stay within the policy's
+        total_timeout. A probe is a single attempt through a half-open
+        circuit; whatever it hits ends in record_success/record_failure,
+        and the probe's caller schedules the next one while it stays open.
+        """
+        breaker = self.breaker(region)
+        if probe:
+            # Half-open only now that the attempt is certain to be made
+            if breaker.start_probe():
+                with self._lock:
+                    self._stats["probes"] += 1
+            elif not breaker.allow():
+                raise CircuitOpenError(f"Holiday source for {region} is unavailable (retrying in the background).")
+        elif not breaker.allow():
+            with self._lock:
+                self._stats["fast_failures"] += 1
+            raise CircuitOpenError(f"Holiday source for {region} is unavailable (retrying in the background).")
+        
+        policy = self.retry_policy
+        attempts = 1 if probe else max(1, policy.attempts)
+        deadline = time.monotonic() + policy.total_timeout
+        attempt = 0
+        while True:
+            attempt += 1
+            timeout = policy.timeout if probe else max(0.1, min(policy.timeout, deadline - time.monotonic()))
+            try:
+                fetched = self.fetch_holidays_sync(year, region=region, timeout=timeout)
+            except Exception as e:
+                if probe:
+                    # Any failure, even a parse error, reopens the circuit
+                    breaker.record_failure()
+                    raise
+                if not source_unavailable(e):
+                    raise # Our problem (parsing, 404...), retrying won't help
+                # Every failed attempt counts, so a dead source opens the
+                # circuit within one call instead of after several
+                if breaker.record_failure():
+                    self._schedule_probe(year, region)
+                    raise
+                delay = policy.delay(attempt)
+                if attempt >= attempts or time.monotonic() + delay >= deadline:
+                    raise
+                with self._lock:
+                    self._stats["retries"] += 1
+                time.sleep(delay)
+                continue
+            breaker.record_success()
+            return fetched
+
+    def _schedule_probe(self, year: int, region: str):
+        """After the breaker's delay, try the source once in the background."""
+        def probe():
+            if self.breaker(region).allow():
+                return # Closed again meanwhile
+            self._revalidate_in_background(year, region, probe=True)
+
+        timer = threading.Timer(self.breaker(region).probe_delay, probe)
+        timer.daemon = True
+        timer.start()
+
+    def _fetch_shared(self, year: int, region: str, probe: bool = False) -> Dict[dt.date, str]:
+        """
+        Single-flight network fetch for (region, year).
+        The first caller fetches, stores and caches; callers arriving while
+        it runs wait for the same result (or exception) instead of issuing
+        their own request.
+        """
+        key = (region, year)
+        with self._lock:
+            pending = self._inflight.get(key)
+            leader = pending is None
+            if leader:
+                pending = self._inflight[key] = Future()
+            else:
+                self._stats["coalesced"] += 1
+        
+        if not leader:
+            return dict(pending.result())
+        
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                
-            # Validate schema
-            if data.get("version") != CACHE_VERSION:
-                return None
-            if data.get("year") != year:
-                return None
-                
-            return data
+            fetched = self._fetch_with_retry(year, region, probe=probe)
+            holidays = dict(fetched)
+            validators = getattr(fetched, "validators", None)
+            if getattr(fetched, "not_modified", False):
+                # Source confirmed the cached copy: only bump fetched_at
+                self.store.touch(year, region, validators)
+                with self._lock:
+                    self._stats["not_modified"] += 1
+            else:
+                self._store_changes(year, region, holidays, validators)
+            self._memory_put(year, region, holidays, "Live Fetch", dt.datetime.now())
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        else:
+            pending.set_result(holidays)
+            return dict(holidays)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _store_changes(self, year: int, region: str, holidays: Dict[dt.date, str], validators: Optional[Validators]):
+        """
+        Persist a fetched year. With a cached copy only the changed rows are
+        written, and cached observed-rule expansions of this region's old copy
+        are dropped just for the months the change reaches.
+        """
+        previous = self.load_cached_holidays(year, region)
+        if previous is None:
+            self.save_to_cache(year, holidays, validators, region=region)
+            return
+        
+        diff = HolidayDiff.between(previous[0], holidays)
+        try:
+            if diff:
+                self.store.apply_diff(year, diff, region, validators=validators)
+            else:
+                self.store.touch(year, region, validators)
+        except Exception as e:
+            print(f"Failed to save cache: {e}")
+        if diff:
+            from domain.calculator import invalidate_observed_months
+            invalidate_observed_months(diff.affected_months, previous=previous[0])
+
+    def _revalidate_in_background(self, year: int, region: str, probe: bool = False):
+        with self._lock:
+            busy = (region, year) in self._inflight
+        if busy:
+            # A fetch for this year is already running. A probe can't piggyback
+            # on it (that fetch fails fast on the open circuit), so try later.
+            if probe:
+                self._schedule_probe(year, region)
+            return
+
+        def worker():
+            old = self._memory_get(year, region)
+            try:
+                holidays = self._fetch_shared(year, region, probe=probe)
+            except Exception:
+                with self._lock:
+                    self._stats["refresh_failures"] += 1
+                if probe and not self.breaker(region).allow():
+                    self._schedule_probe(year, region)
+                return
+            with self._lock:
+                self._stats["refreshes"] += 1
+
+            if old is None or old.holidays != holidays:
+                # Against the memory copy: that's what callers have been served
+                diff = HolidayDiff.between(old.holidays, holidays) if old is not None else None
+                for listener, listener_region in list(self._listeners):
+                    if listener_region != region:
+                        continue
+                    try:
+                        listener(year, dict(holidays), "Live Fetch", diff)
+                    except Exception as e:
+                        print(f"Holiday listener failed: {e}")
+
+        get_fetch_pool().submit(worker)
+
+    def load_cached_holidays(self, year: int, region: Optional[str] = None) -> Optional[Tuple[Dict[dt.date, str], str]]:
+        """Returns (holidays, fetched_at) from the store, or None if not cached."""
+        try:
+            return self.store.load_year(year, region or self.region)
         except Exception:
             return None
 
-    def save_to_cache(self, year: int, holidays_dict: Dict[dt.date, str]):
-        path = self.get_cache_path(year)
-        data = {
+    def load_from_cache(self, year: int, region: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Cached year in the legacy JSON cache layout (ISO date keys)."""
+        region = region or self.region
+        cached = self.load_cached_holidays(year, region)
+        if cached is None:
+            return None
+        holidays, fetched_at = cached
+        return {
             "version": CACHE_VERSION,
             "year": year,
-            "state": "Sabah",
-            "fetched_at": dt.datetime.now().isoformat(),
-            "holidays": {d.isoformat(): name for d, name in holidays_dict.items()}
+            "state": region,
+            "fetched_at": fetched_at,
+            "holidays": {d.isoformat(): name for d, name in holidays.items()}
         }
+
+    def load_month_from_cache(self, year: int, month: int, region: Optional[str] = None) -> Dict[dt.date, str]:
+        """One month's cached holidays, without loading the whole year."""
+        return self.store.load_month(year, month, region or self.region)
+
+    def save_to_cache(
+        self,
+        year: int,
+        holidays_dict: Dict[dt.date, str],
+        validators: Optional[Validators] = None,
+        region: Optional[str] = None
+    ):
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            self.store.save_year(year, holidays_dict, region or self.region, validators=validators)
         except Exception as e:
             print(f"Failed to save cache: {e}")
 
-    def fetch_holidays_sync(self, year: int) -> Dict[dt.date, str]:
-        """Blocking fetch from URL."""
-        # This logic parses the Sabah gov website
-        # Reusing the parsing logic from tlrs.py (adapted slightly)
+    def clear_cache(self, region: Optional[str] = None) -> int:
+        """Drop cached years (every region by default). Returns the number removed."""
+        with self._lock:
+            for key in [k for k in self._memory if region is None or k[0] == region]:
+                del self._memory[key]
+        return self.store.clear(region)
+
+    def fetch_holidays_sync(
+        self,
+        year: int,
+        conditional: bool = True,
+        region: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> FetchedHolidays:
+        """
+        Blocking fetch from the region's registered source.
+        
+        With conditional=True and a cached copy of the year, the request
+        carries If-None-Match / If-Modified-Since. A 304, or a body whose
+        hash matches the stored one, returns the cached holidays with
+        not_modified=True and skips parsing. The body is hashed as it
+        streams in and is never held in memory whole: without a stored hash
+        it is parsed chunk by chunk, otherwise it is spooled (to a temp file
+        past SPOOL_MEMORY_SIZE) and parsed only if the hash differs.
+        `timeout` defaults to the retry policy's per-attempt timeout.
+        """
+        # Imported here: urllib.request pulls in http/email/ssl, which
+        # cached and offline lookups never need.
+        import urllib.error
+        import urllib.request
+        
+        region = region or self.region
+        source = get_source(region)
+        if source is None:
+            raise RuntimeError(f"No holiday source registered for {region}.")
+        # base_url can be pointed elsewhere for the default region (tests, mirrors)
+        if region == self.region and self.base_url != source.url:
+            source = replace(source, url=self.base_url)
+        url = source.url_for(year)
+        
+        cached = None
+        validators = self.store.validators(year, region) if conditional else None
+        if validators:
+            cached = self.load_cached_holidays(year, region)
+        if cached is None:
+            validators = None
+        
+        headers = {}
+        if validators and validators.etag:
+            headers["If-None-Match"] = validators.etag
+        if validators and validators.last_modified:
+            headers["If-Modified-Since"] = validators.last_modified
         
+        hasher = hashlib.sha256()
+        parser = None # Created on the first chunk, so a 304 never builds one
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        
+        def feed(chunk: bytes, final: bool = False):
+            nonlocal parser
+            if parser is None:
+                parser = source.parser_factory(year)
+            parser.feed(decoder.decode(chunk, final))
+        
+        # With a stored hash the body may turn out unchanged: hold it back
+        # (bounded) until the hash is known instead of parsing it right away
+        spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY_SIZE) if cached and validators.content_hash else None
         try:
-            with urllib.request.urlopen(self.base_url, timeout=10) as resp:
-                body = resp.read().decode("utf-8", errors="ignore")
-        except Exception as e:
-            raise RuntimeError(f"Network error: {e}")
-
-        # Parsing logic (Same as original but more robust if needed)
-        holidays_dict = {}
-        
-        # Remove script/style
-        body = re.sub(r'<script[^>]*>.*?</script>', '', body, flags=re.DOTALL | re.IGNORECASE)
-        body = re.sub(r'<style[^>]*>.*?</style>', '', body, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Date Pattern: 1 January 2026
-        date_pattern = r'(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})'
-        
-        lines = body.split('\n')
-        for i, line in enumerate(lines):
-            date_match = re.search(date_pattern, line)
-            if date_match:
-                date_str = date_match.group(0)
-                try:
-                    parsed_date = dt.datetime.strptime(date_str, "%d %B %Y").date()
-                except ValueError:
-                    continue
-                
-                if parsed_date.year == year:
-                    # Find name (look back 5 lines)
-                    holiday_name = "Public Holiday" # Default
-                    for j in range(max(0, i - 5), i + 1):
-                        check_line = lines[j]
-                        clean_line = re.sub(r'<[^>]+>', '', check_line)
-                        clean_line = re.sub(r'\s+', ' ', clean_line).strip()
-                        
-                        # Exclude date strings
-                        if date_str in clean_line: continue
-                        if re.search(r'\d{1,2}\s+[A-Za-z]+', clean_line): continue # Ignore "30 May", "1 May"
-                        
-                        if len(clean_line) < 5 or clean_line.isdigit(): continue
-                        if clean_line.lower() in ['cuti', 'tarikh', 'edit', 'holiday', 'date']: continue
-                        
-                        if clean_line:
-                            holiday_name = clean_line
+            try:
+                request = urllib.request.Request(url, headers=headers)
+                with urllib.request.urlopen(request, timeout=self.retry_policy.timeout if timeout is None else timeout) as resp:
+                    size = 0
+                    while True:
+                        chunk = resp.read(READ_CHUNK_SIZE)
+                        if not chunk:
                             break
-                    
-                    # Clean name
-                    holiday_name = re.sub(r'\s+\d{4}$', '', holiday_name).strip()
-                    # Remove any remaining date-like prefixes
-                    holiday_name = re.sub(r'^\d{1,2}\s+[A-Za-z]+\s*', '', holiday_name)
-                    
-                    if parsed_date in holidays_dict:
-                        if holiday_name not in holidays_dict[parsed_date]:
-                            holidays_dict[parsed_date] += f" / {holiday_name}"
-                    else:
-                        holidays_dict[parsed_date] = holiday_name
-                        
+                        hasher.update(chunk)
+                        if spool is not None:
+                            spool.write(chunk)
+                        else:
+                            feed(chunk)
+                        size += len(chunk)
+                    # urllib doesn't notice a connection dropped mid-body
+                    expected = resp.headers.get("Content-Length")
+                    if expected and expected.isdigit() and size < int(expected):
+                        raise FetchError(f"Network error: truncated response ({size} of {expected} bytes)", retryable=True)
+                    received = Validators(resp.headers.get("ETag"), resp.headers.get("Last-Modified"), hasher.hexdigest())
+            except urllib.error.HTTPError as e:
+                if e.code == 304 and cached:
+                    refreshed = Validators(e.headers.get("ETag"), e.headers.get("Last-Modified"))
+                    return FetchedHolidays(cached[0], refreshed, not_modified=True)
+                raise FetchError(f"Network error: {e}", retryable=e.code >= 500 or e.code == 429)
+            except FetchError:
+                raise
+            except Exception as e:
+                # Timeouts, refused/reset connections, DNS failures...
+                raise FetchError(f"Network error: {e}", retryable=True)
+            
+            if cached and validators.content_hash == received.content_hash:
+                return FetchedHolidays(cached[0], received, not_modified=True)
+            
+            if spool is not None:
+                # Changed after all: parse what was held back
+                spool.seek(0)
+                for chunk in iter(lambda: spool.read(READ_CHUNK_SIZE), b""):
+                    feed(chunk)
+        finally:
+            if spool is not None:
+                spool.close()
+        
+        feed(b"", final=True)
+        holidays_dict = parser.close()
         if not holidays_dict:
             raise RuntimeError("No holidays found for this year (parsing failed or no data).")
             
-        return holidays_dict
+        return FetchedHolidays(holidays_dict, received)
+
+
+    def get_holidays_sync(
+        self,
+        year: int,
+        force_refresh: bool = False,
+        offline: bool = False,
+        region: Optional[str] = None
+    ) -> Tuple[Dict[dt.date, str], str]:
+        """
+        Blocking cache-then-network lookup for one region (default: self.region).
+        Returns (holidays_dict, source). Raises RuntimeError on failure.
+        """
+        region = region or self.region
+        if not force_refresh:
+            # 1. Memory (stale entries are served while a refresh runs)
+            entry = self._memory_get(year, region)
+            if entry is not None:
+                stale = self._is_stale(entry, region)
+                with self._lock:
+                    self._stats["stale_hits" if stale else "hits"] += 1
+                if stale and not offline:
+                    self._revalidate_in_background(year, region)
+                return dict(entry.holidays), entry.source
+            
+            with self._lock:
+                self._stats["misses"] += 1
+            
+            # 2. Persistent cache
+            cached = self.load_cached_holidays(year, region)
+            if cached:
+                holidays, fetched_at = cached
+                source = f"Cache ({fetched_at})"
+                entry = _MemoryEntry(holidays, source, _parse_fetched_at(fetched_at))
+                self._memory_put(year, region, holidays, source, entry.fetched_at)
+                if not offline and self._is_stale(entry, region):
+                    self._revalidate_in_background(year, region)
+                return holidays, source
 
+            # 3. Bundled dataset; served at once, then updated from the network
+            bundled = self.bundle.load_year(year, region) if self.bundle else None
+            if bundled is not None:
+                source = f"Bundled dataset (v{self.bundle.version})"
+                self._memory_put(year, region, bundled, source, dt.datetime.min)
+                if not offline and get_source(region):
+                    self._revalidate_in_background(year, region)
+                return bundled, source
+
+        if offline:
+            raise RuntimeError(f"No cached holidays for {region} {year} (offline mode).")
+
+        # 4. Fetch from Network (shared with any concurrent fetch of this year)
+        try:
+            return self._fetch_shared(year, region), "Live Fetch"
+        except Exception as e:
+            # Source down: a refresh falls back to whatever copy we have
+            fallback = self._cached_copy(year, region) if source_unavailable(e) else None
+            if fallback is None:
+                raise
+            holidays, source = fallback
+            return holidays, f"{source}, source unavailable"
+
+    def _cached_copy(self, year: int, region: str) -> Optional[Tuple[Dict[dt.date, str], str]]:
+        """Any local copy of a year (memory, store, bundle), however old."""
+        entry = self._memory_get(year, region)
+        if entry is not None:
+            return dict(entry.holidays), entry.source
+        cached = self.load_cached_holidays(year, region)
+        if cached:
+            return cached[0], f"Cache ({cached[1]})"
+        bundled = self.bundle.load_year(year, region) if self.bundle else None
+        if bundled is not None:
+            return bundled, f"Bundled dataset (v{self.bundle.version})"
+        return None
+
+    # --- Async API ---
+
+    async def get_holidays(
+        self,
+        year: int,
+        force_refresh: bool = False,
+        offline: bool = False,
+        timeout: Optional[float] = None,
+        region: Optional[str] = None
+    ) -> Tuple[Dict[dt.date, str], str]:
+        """
+        Awaitable get_holidays_sync. Returns (holidays_dict, source).
+        
+        Memory hits are answered without leaving the event loop; anything
+        else runs on the shared fetch pool. Raises asyncio.TimeoutError
+        after `timeout` seconds. Cancelling (or timing out) a request that
+        has not started yet drops it; one already fetching is left to finish
+        in the background so it still lands in the cache for other callers.
+        """
+        region = region or self.region
+        if not force_refresh and self._memory_get(year, region) is not None:
+            return self.get_holidays_sync(year, offline=offline, region=region)
+        
+        loop = asyncio.get_running_loop()
+        call = functools.partial(self.get_holidays_sync, year, force_refresh=force_refresh, offline=offline, region=region)
+        return await asyncio.wait_for(loop.run_in_executor(get_fetch_pool(), call), timeout)
+
+    async def get_holidays_many(
+        self,
+        years: List[int],
+        offline: bool = False,
+        timeout: Optional[float] = None,
+        region: Optional[str] = None
+    ) -> Dict[int, Tuple[Dict[dt.date, str], str]]:
+        """
+        Several years concurrently. `timeout` applies to each year.
+        Years that fail are left out of the result (the error is logged).
+        """
+        years = list(dict.fromkeys(years))
+        results = await asyncio.gather(
+            *(self.get_holidays(year, offline=offline, timeout=timeout, region=region) for year in years),
+            return_exceptions=True
+        )
+        found = {}
+        for year, result in zip(years, results):
+            if isinstance(result, BaseException):
+                print(f"Failed to load holidays for {year}: {result!r}")
+            else:
+                found[year] = result
+        return found
+
+    async def get_region_calendars(
+        self,
+        regions: List[str],
+        years: List[int],
+        offline: bool = False,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Dict[dt.date, str]]:
+        """
+        Holidays for every (region, year) pair, loaded concurrently and
+        merged per region: {region: {date: name}}. Unlike get_holidays_many
+        a failure is raised, since a region with missing years would
+        silently overpay.
+        """
+        regions = list(dict.fromkeys(regions))
+        years = list(dict.fromkeys(years))
+        pairs = [(region, year) for region in regions for year in years]
+        results = await asyncio.gather(
+            *(self.get_holidays(year, offline=offline, timeout=timeout, region=region) for region, year in pairs)
+        )
+        calendars: Dict[str, Dict[dt.date, str]] = {region: {} for region in regions}
+        for (region, _), (holidays, _) in zip(pairs, results):
+            calendars[region].update(holidays)
+        return calendars
 
     def fetch_holidays_async(
         self, 
         year: int, 
         on_success: Callable[[Dict[dt.date, str], str], None], 
         on_error: Callable[[str], None],
-        force_refresh: bool = False
-    ):
+        force_refresh: bool = False,
+        timeout: Optional[float] = None
+    ) -> Optional[Future]:
         """
-        Starts a thread to fetch holidays.
+        Callback adapter over get_holidays() for non-async callers.
         on_success(holidays_dict, source)
         on_error(error_message)
+        
+        A year already held in memory is answered straight away on the
+        calling thread. Otherwise the request runs on the background event
+        loop and the callbacks fire there; the returned Future can be
+        cancelled if the result is no longer wanted (no callback fires).
         """
-        def worker():
-            # 1. Try Cache first (unless forced)
-            if not force_refresh:
-                cached = self.load_from_cache(year)
-                if cached:
-                    holidays = {dt.date.fromisoformat(d): n for d, n in cached["holidays"].items()}
-                    fetched_at = cached.get("fetched_at", "Unknown")
-                    # Post to main thread (simulated via direct callback for now, 
-                    # but caller should ensure thread safety or use root.after)
-                    # Ideally we pass a queue, but here we just call the callback 
-                    # and let the UI handle the "call from thread" issue via queue or after_idle
-                    # best practice: just run logic here, UI wrapper handles the dispatch
-                    
-                    # We will return data, caller handles threading context
-                    return ("success", holidays, f"Cache ({fetched_at})")
-
-            # 2. Fetch from Network
-            try:
-                holidays = self.fetch_holidays_sync(year)
-                self.save_to_cache(year, holidays)
-                return ("success", holidays, "Live Fetch")
-            except Exception as e:
-                return ("error", str(e))
-
-        def thread_target():
-            status, *args = worker()
-            if status == "success":
-                on_success(args[0], args[1])
+        if not force_refresh and self._memory_get(year, self.region) is not None:
+            holidays, source = self.get_holidays_sync(year)
+            on_success(holidays, source)
+            return None
+        
+        future = asyncio.run_coroutine_threadsafe(
+            self.get_holidays(year, force_refresh=force_refresh, timeout=timeout),
+            get_background_loop()
+        )
+        
+        def done(f: Future):
+            # The UI wrapper is responsible for handing results back to
+            # the Tk main loop.
+            if f.cancelled():
+                return
+            error = f.exception()
+            if error is None:
+                on_success(*f.result())
+            elif isinstance(error, asyncio.TimeoutError):
+                on_error(f"Timed out fetching holidays for {year}.")
             else:
-                on_error(args[0])
-
-        threading.Thread(target=thread_target, daemon=True).start()
+                on_error(str(error))
 
+        future.add_done_callback(done)
+        return future
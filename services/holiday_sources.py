@@ -0,0 +1,54 @@
+"""
+Registry of holiday sources, one per region (state).
+
+Each source says where a region's holidays are published, how to parse
+that page and how long fetched data stays fresh. Cached data is already
+namespaced by region in the store, memory cache and bundle, so adding a
+region is a matter of registering its source:
+
+    register_source(HolidaySource("Selangor", "https://example.gov.my/cuti-{year}", MyParser))
+"""
+import datetime as dt
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from services.holiday_parser import HolidayPageParser
+from services.holiday_store import DEFAULT_REGION
+
+
+@dataclass(frozen=True)
+class HolidaySource:
+    region: str
+    # May contain {year} for sources that publish one page per year
+    url: str
+    # parser_factory(year) -> object with feed(text) and close() -> {date: name}
+    parser_factory: Callable[[int], Any] = HolidayPageParser
+    # How long fetched data counts as fresh; None uses the service default
+    ttl: Optional[dt.timedelta] = None
+
+    def url_for(self, year: int) -> str:
+        return self.url.format(year=year)
+
+
+_REGISTRY: Dict[str, HolidaySource] = {}
+
+
+def register_source(source: HolidaySource, replace: bool = False):
+    if source.region in _REGISTRY and not replace:
+        raise ValueError(f"A holiday source for {source.region} is already registered")
+    _REGISTRY[source.region] = source
+
+
+def unregister_source(region: str):
+    _REGISTRY.pop(region, None)
+
+
+def get_source(region: str) -> Optional[HolidaySource]:
+    return _REGISTRY.get(region)
+
+
+def available_regions() -> List[str]:
+    return sorted(_REGISTRY)
+
+
+register_source(HolidaySource(DEFAULT_REGION, "https://sabah.gov.my/ms/public-holidays"))
@@ -0,0 +1,276 @@
+import json
+import sqlite3
+import datetime as dt
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from domain.models import HolidayDiff
+
+DB_FILENAME = "holidays.db"
+DEFAULT_REGION = "Sabah"
+
+# atomic_io fsync policy -> PRAGMA synchronous. SQLite's journal already
+# makes every transaction atomic; this only trades durability for speed.
+SYNCHRONOUS = {"none": "OFF", "file": "NORMAL", "full": "FULL"}
+
+# Bump and append to MIGRATIONS when the schema changes.
+# Stored in PRAGMA user_version.
+SCHEMA_VERSION = 2
+
+MIGRATIONS = {
+    1: [
+        """CREATE TABLE IF NOT EXISTS holidays (
+               region TEXT NOT NULL,
+               day    TEXT NOT NULL,  -- ISO date, sorts chronologically
+               name   TEXT NOT NULL,
+               PRIMARY KEY (region, day)
+           ) WITHOUT ROWID""",
+        """CREATE TABLE IF NOT EXISTS fetches (
+               region     TEXT NOT NULL,
+               year       INTEGER NOT NULL,
+               fetched_at TEXT NOT NULL,
+               source     TEXT NOT NULL DEFAULT 'fetched',
+               PRIMARY KEY (region, year)
+           )""",
+    ],
+    # HTTP validators for conditional revalidation
+    2: [
+        "ALTER TABLE fetches ADD COLUMN etag TEXT",
+        "ALTER TABLE fetches ADD COLUMN last_modified TEXT",
+        "ALTER TABLE fetches ADD COLUMN content_hash TEXT",
+    ],
+}
+
+
+@dataclass
+class Validators:
+    """What the source told us about the page a year was parsed from."""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_hash: Optional[str] = None  # sha256 of the raw body
+
+
+class HolidayStore:
+    """
+    SQLite-backed holiday cache (WAL mode) for many years and regions.
+
+    A year only counts as cached once it has a row in `fetches`, so a year
+    with no holidays is still distinguishable from one never fetched.
+    Each call opens its own short-lived connection, so one store can be
+    shared between threads; other processes may use the same file too.
+    """
+
+    def __init__(self, db_path: str, fsync: str = "file"):
+        if fsync not in SYNCHRONOUS:
+            raise ValueError(f"Unknown fsync policy: {fsync}")
+        self.synchronous = SYNCHRONOUS[fsync]
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._migrate(conn)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        return conn
+
+    def _migrate(self, conn: sqlite3.Connection):
+        # Take the write lock before reading the version, so two processes
+        # opening a new store don't both run the same migrations
+        conn.execute("BEGIN IMMEDIATE")
+        current = conn.execute("PRAGMA user_version").fetchone()[0]
+        if current > SCHEMA_VERSION:
+            conn.rollback()
+            raise RuntimeError(
+                f"Holiday store {self.db_path} has schema v{current}, this build supports v{SCHEMA_VERSION}"
+            )
+        with conn:
+            for version in range(current + 1, SCHEMA_VERSION + 1):
+                for statement in MIGRATIONS[version]:
+                    conn.execute(statement)
+            # PRAGMA does not accept bound parameters
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @property
+    def schema_version(self) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute("PRAGMA user_version").fetchone()[0]
+
+    # --- Writes ---
+
+    def save_year(
+        self,
+        year: int,
+        holidays: Dict[dt.date, str],
+        region: str = DEFAULT_REGION,
+        fetched_at: Optional[str] = None,
+        source: str = "fetched",
+        validators: Optional[Validators] = None
+    ):
+        """Replace one year's holidays for a region in a single transaction."""
+        fetched_at = fetched_at or dt.datetime.now().isoformat()
+        validators = validators or Validators()
+        rows = [(region, d.isoformat(), name) for d, name in holidays.items() if d.year == year]
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "DELETE FROM holidays WHERE region = ? AND day BETWEEN ? AND ?",
+                (region, f"{year:04d}-01-01", f"{year:04d}-12-31")
+            )
+            conn.executemany("INSERT INTO holidays (region, day, name) VALUES (?, ?, ?)", rows)
+            conn.execute(
+                "INSERT OR REPLACE INTO fetches "
+                "(region, year, fetched_at, source, etag, last_modified, content_hash) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (region, year, fetched_at, source,
+                 validators.etag, validators.last_modified, validators.content_hash)
+            )
+
+    def apply_diff(
+        self,
+        year: int,
+        diff: "HolidayDiff",
+        region: str = DEFAULT_REGION,
+        fetched_at: Optional[str] = None,
+        source: str = "fetched",
+        validators: Optional[Validators] = None
+    ):
+        """
+        Bring a stored year up to date by writing only the changed rows
+        (see HolidayDiff.between), in a single transaction.
+        """
+        fetched_at = fetched_at or dt.datetime.now().isoformat()
+        validators = validators or Validators()
+        upserts = {**diff.added, **{d: new for d, (_, new) in diff.renamed.items()}}
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "DELETE FROM holidays WHERE region = ? AND day = ?",
+                [(region, d.isoformat()) for d in diff.removed if d.year == year]
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO holidays (region, day, name) VALUES (?, ?, ?)",
+                [(region, d.isoformat(), name) for d, name in upserts.items() if d.year == year]
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO fetches "
+                "(region, year, fetched_at, source, etag, last_modified, content_hash) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (region, year, fetched_at, source,
+                 validators.etag, validators.last_modified, validators.content_hash)
+            )
+
+    def touch(
+        self,
+        year: int,
+        region: str = DEFAULT_REGION,
+        validators: Optional[Validators] = None,
+        fetched_at: Optional[str] = None
+    ) -> bool:
+        """
+        Mark a cached year as confirmed by the source without rewriting its
+        holidays. Validators given are updated. Returns False if not cached.
+        """
+        fetched_at = fetched_at or dt.datetime.now().isoformat()
+        with closing(self._connect()) as conn, conn:
+            if validators is None:
+                cur = conn.execute(
+                    "UPDATE fetches SET fetched_at = ? WHERE region = ? AND year = ?",
+                    (fetched_at, region, year)
+                )
+            else:
+                cur = conn.execute(
+                    "UPDATE fetches SET fetched_at = ?, "
+                    "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified), "
+                    "content_hash = COALESCE(?, content_hash) "
+                    "WHERE region = ? AND year = ?",
+                    (fetched_at, validators.etag, validators.last_modified, validators.content_hash, region, year)
+                )
+        return cur.rowcount > 0
+
+    def clear(self, region: Optional[str] = None) -> int:
+        """Delete cached years (all regions by default). Returns years removed."""
+        with closing(self._connect()) as conn, conn:
+            if region is None:
+                count = conn.execute("DELETE FROM fetches").rowcount
+                conn.execute("DELETE FROM holidays")
+            else:
+                count = conn.execute("DELETE FROM fetches WHERE region = ?", (region,)).rowcount
+                conn.execute("DELETE FROM holidays WHERE region = ?", (region,))
+        return count
+
+    # --- Reads ---
+
+    def fetched_at(self, year: int, region: str = DEFAULT_REGION) -> Optional[str]:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT fetched_at FROM fetches WHERE region = ? AND year = ?", (region, year)
+            ).fetchone()
+        return row[0] if row else None
+
+    def validators(self, year: int, region: str = DEFAULT_REGION) -> Optional[Validators]:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT etag, last_modified, content_hash FROM fetches WHERE region = ? AND year = ?",
+                (region, year)
+            ).fetchone()
+        return Validators(*row) if row else None
+
+    def regions(self) -> List[str]:
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT DISTINCT region FROM fetches ORDER BY region").fetchall()
+        return [r[0] for r in rows]
+
+    def years(self, region: str = DEFAULT_REGION) -> List[int]:
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT year FROM fetches WHERE region = ? ORDER BY year", (region,)).fetchall()
+        return [r[0] for r in rows]
+
+    def load_range(self, start: dt.date, end: dt.date, region: str = DEFAULT_REGION) -> Dict[dt.date, str]:
+        """Holidays between start and end (inclusive), via the primary-key index."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT day, name FROM holidays WHERE region = ? AND day BETWEEN ? AND ? ORDER BY day",
+                (region, start.isoformat(), end.isoformat())
+            ).fetchall()
+        return {dt.date.fromisoformat(day): name for day, name in rows}
+
+    def load_month(self, year: int, month: int, region: str = DEFAULT_REGION) -> Dict[dt.date, str]:
+        start = dt.date(year, month, 1)
+        end = dt.date(year + 1, 1, 1) if month == 12 else dt.date(year, month + 1, 1)
+        return self.load_range(start, end - dt.timedelta(days=1), region)
+
+    def load_year(self, year: int, region: str = DEFAULT_REGION) -> Optional[Tuple[Dict[dt.date, str], str]]:
+        """Returns (holidays, fetched_at), or None if the year was never stored."""
+        fetched_at = self.fetched_at(year, region)
+        if fetched_at is None:
+            return None
+        return self.load_range(dt.date(year, 1, 1), dt.date(year, 12, 31), region), fetched_at
+
+    # --- Legacy JSON caches ---
+
+    def migrate_json_caches(self, cache_dir: str, json_version: int = 1) -> List[int]:
+        """
+        Import holiday_cache_{year}.json files from cache_dir and rename them
+        to *.json.migrated so they are not imported again.
+        Years already in the store are kept as-is. Returns imported years.
+        """
+        imported = []
+        for path in sorted(Path(cache_dir).glob("holiday_cache_*.json")):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") != json_version:
+                    continue
+                year = int(data["year"])
+                region = data.get("state") or DEFAULT_REGION
+                if self.fetched_at(year, region) is None:
+                    holidays = {dt.date.fromisoformat(d): n for d, n in data.get("holidays", {}).items()}
+                    self.save_year(year, holidays, region, data.get("fetched_at"), source="json-migration")
+                    imported.append(year)
+                path.replace(path.with_name(path.name + ".migrated"))
+            except Exception as e:
+                print(f"Skipping cache file {path.name}: {e}")
+        return imported
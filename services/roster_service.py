@@ -0,0 +1,234 @@
+import csv
+import os
+import time
+import datetime as dt
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from domain.models import CalculationResult, RosterEntry
+from domain.calculator import calculate_periods
+from domain.dates import parse_dates
+
+# Accepted header names (lower-cased) for each roster column
+ID_COLUMNS = ("employee_id", "employee id", "staff_id", "id")
+GRADE_COLUMNS = ("grade",)
+LEAVE_COLUMNS = ("leave_dates", "leave dates", "leave")
+REGION_COLUMNS = ("region", "state")
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+@dataclass
+class RosterResult:
+    employee_id: str
+    result: CalculationResult
+
+
+@dataclass
+class RosterStats:
+    employees: int = 0
+    chunks: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def employees_per_second(self) -> float:
+        return self.employees / self.elapsed if self.elapsed else 0.0
+
+
+def _find_column(header: List[str], names: Tuple[str, ...], required: bool = True) -> Optional[int]:
+    normalized = [str(h or "").strip().lower() for h in header]
+    for name in names:
+        if name in normalized:
+            return normalized.index(name)
+    if required:
+        raise ValueError(f"Roster is missing a '{names[0]}' column")
+    return None
+
+
+def _rows_to_entries(rows: Iterable[List]) -> List[RosterEntry]:
+    rows = iter(rows)
+    try:
+        header = list(next(rows))
+    except StopIteration:
+        return []
+
+    id_col = _find_column(header, ID_COLUMNS)
+    grade_col = _find_column(header, GRADE_COLUMNS)
+    leave_col = _find_column(header, LEAVE_COLUMNS, required=False)
+    region_col = _find_column(header, REGION_COLUMNS, required=False)
+
+    entries = []
+    # Row 1 is the header
+    for line, row in enumerate(rows, start=2):
+        if not row or all(cell in (None, "") for cell in row):
+            continue
+        if max(id_col, grade_col) >= len(row):
+            raise ValueError(f"Roster row {line} is missing columns")
+        if row[id_col] in (None, ""):
+            continue
+        grade = str(row[grade_col] or "").strip().upper()
+        if not grade:
+            raise ValueError(f"Roster row {line} has no grade")
+        leave = set()
+        if leave_col is not None and leave_col < len(row) and row[leave_col]:
+            cell = row[leave_col]
+            # openpyxl returns a datetime for single-date cells
+            if isinstance(cell, dt.datetime):
+                leave = {cell.date()}
+            elif isinstance(cell, dt.date):
+                leave = {cell}
+            else:
+                leave = parse_dates(str(cell))
+        region = None
+        if region_col is not None and region_col < len(row) and row[region_col]:
+            region = str(row[region_col]).strip()
+        entries.append(RosterEntry(
+            employee_id=str(row[id_col]).strip(),
+            grade=grade,
+            leave_dates=leave,
+            region=region
+        ))
+    return entries
+
+
+def load_roster(path: str) -> List[RosterEntry]:
+    """
+    Read a roster from CSV or XLSX.
+    Expected columns: employee_id, grade and (optionally) leave_dates and
+    region, where leave dates are separated by ';' or ',' in any format
+    parse_dates accepts. A blank region means the run's default region.
+    """
+    path = Path(path)
+    if path.suffix.lower() in (".xlsx", ".xlsm"):
+        from openpyxl import load_workbook
+        wb = load_workbook(path, read_only=True, data_only=True)
+        try:
+            return _rows_to_entries(wb.active.iter_rows(values_only=True))
+        finally:
+            wb.close()
+
+    with open(path, "r", newline="", encoding="utf-8-sig") as f:
+        return _rows_to_entries(csv.reader(f))
+
+
+# --- Worker side (module level so it pickles under spawn on Windows) ---
+
+# region -> BusinessCalendar; None is the default region
+_worker_calendars: Dict[Optional[str], object] = {}
+
+
+def _init_worker(
+    years: List[int],
+    holidays_map: Dict[dt.date, str],
+    region_holidays: Optional[Dict[str, Dict[dt.date, str]]] = None
+):
+    """Build each region's holiday calendar once per worker process."""
+    global _worker_calendars
+    from domain.business_calendar import BusinessCalendar
+    _worker_calendars = {None: BusinessCalendar.for_years(years, holidays_map)}
+    for region, holidays in (region_holidays or {}).items():
+        _worker_calendars[region] = BusinessCalendar.for_years(years, holidays)
+
+
+def _calculate_chunk(
+    chunk: List[RosterEntry], year: int, month: int
+) -> List[Tuple[str, CalculationResult]]:
+    # One calculate_periods call per region, then back into roster order
+    by_region: Dict[Optional[str], List[int]] = {}
+    for i, e in enumerate(chunk):
+        by_region.setdefault(e.region if e.region in _worker_calendars else None, []).append(i)
+
+    results: List[Optional[CalculationResult]] = [None] * len(chunk)
+    for region, indexes in by_region.items():
+        calculated = calculate_periods(
+            [(year, month, chunk[i].grade, chunk[i].leave_dates) for i in indexes],
+            {},
+            business_calendar=_worker_calendars[region]
+        )
+        for i, r in zip(indexes, calculated):
+            results[i] = r
+    return [(e.employee_id, r) for e, r in zip(chunk, results)]
+
+
+class RosterService:
+    """
+    Headless roster calculation.
+
+    Splits the roster into chunks and fans them out over a process pool.
+    Each worker builds one BusinessCalendar per region at start-up and
+    reuses them for every chunk. Results are yielded as each chunk
+    completes, so output order follows completion order, not roster order.
+
+    holidays_map is used for employees without a region; region_holidays
+    ({region: holidays}) must cover every other region in the roster.
+    """
+
+    def __init__(
+        self,
+        holidays_map: Dict[dt.date, str],
+        max_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        region_holidays: Optional[Dict[str, Dict[dt.date, str]]] = None
+    ):
+        self.holidays_map = holidays_map
+        self.region_holidays = region_holidays or {}
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self.stats = RosterStats()
+
+    def calculate(self, roster: List[RosterEntry], year: int, month: int) -> Iterator[RosterResult]:
+        # Checked here, not in the generator, so a bad roster fails before
+        # anyone starts consuming (and e.g. truncates an output file)
+        missing = {e.region for e in roster if e.region and e.region not in self.region_holidays}
+        if missing:
+            raise ValueError(f"No holidays loaded for region(s): {', '.join(sorted(missing))}")
+        return self._calculate(roster, year, month)
+
+    def _calculate(self, roster: List[RosterEntry], year: int, month: int) -> Iterator[RosterResult]:
+        self.stats = RosterStats()
+        started = time.perf_counter()
+        chunks = [roster[i:i + self.chunk_size] for i in range(0, len(roster), self.chunk_size)]
+
+        # Small rosters are not worth the process start-up cost
+        if self.max_workers <= 1 or len(chunks) <= 1:
+            _init_worker([year], self.holidays_map, self.region_holidays)
+            for chunk in chunks:
+                yield from self._record(_calculate_chunk(chunk, year, month), started)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(chunks)),
+            initializer=_init_worker,
+            initargs=([year], self.holidays_map, self.region_holidays)
+        ) as pool:
+            futures = [pool.submit(_calculate_chunk, chunk, year, month) for chunk in chunks]
+            for future in as_completed(futures):
+                yield from self._record(future.result(), started)
+
+    def _record(self, chunk_results: List[Tuple[str, CalculationResult]], started: float) -> Iterator[RosterResult]:
+        self.stats.chunks += 1
+        self.stats.employees += len(chunk_results)
+        self.stats.elapsed = time.perf_counter() - started
+        for employee_id, result in chunk_results:
+            yield RosterResult(employee_id, result)
+
+
+def write_roster_summary(results: Iterable[RosterResult], path: str) -> int:
+    """Stream one summary row per employee to CSV. Returns rows written."""
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow([
+            "Employee ID", "Grade", "Period", "Rate", "Working Days",
+            "Weekends", "Public Holidays", "Personal Leave", "Total Reimbursement"
+        ])
+        for item in results:
+            r = item.result
+            writer.writerow([
+                item.employee_id, r.grade, f"{r.year}-{r.month:02d}", r.rate, r.working_days_count,
+                r.weekend_days_count, r.public_holidays_count, r.personal_leave_count, r.total_reimbursement
+            ])
+            count += 1
+    return count
@@ -1,6 +1,13 @@
+import atexit
 import json
+import threading
+import time
+import weakref
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from services.atomic_io import atomic_write, DEFAULT_FSYNC
 
 SETTINGS_FILE = "settings.json"
 
@@ -8,13 +15,76 @@ DEFAULT_SETTINGS = {
     "default_grade": "JG6",
     "auto_open_export": False,
     "developer_mode": False,
+    "warm_exporters": True, # Preload export/preview libraries after startup
     "theme": "clam" 
 }
 
+# Changes are written once the settings have been quiet for FLUSH_DELAY
+# seconds, or straight away after FLUSH_AFTER_CHANGES unsaved changes
+FLUSH_DELAY = 0.5
+FLUSH_AFTER_CHANGES = 50
+# A failed write is retried after flush_delay, doubling up to this cap
+MAX_RETRY_DELAY = 30.0
+
+@dataclass(frozen=True)
+class Settings:
+    """Typed snapshot of the known settings."""
+    default_grade: str
+    auto_open_export: bool
+    developer_mode: bool
+    warm_exporters: bool
+    theme: str
+
+def _coerce(key: str, value: Any) -> Any:
+    """Bring a value to the type of its default (settings.json may be hand-edited)."""
+    default = DEFAULT_SETTINGS.get(key)
+    if isinstance(default, bool):
+        if isinstance(value, str):
+            return value.strip().lower() in ("1", "true", "yes", "on")
+        return bool(value)
+    if isinstance(default, str) and value is not None:
+        return str(value)
+    return value
+
 class SettingsService:
-    def __init__(self):
-        self.settings_path = Path(SETTINGS_FILE)
+    """
+    Settings held in memory; get() never touches disk.
+    
+    set() only marks the settings dirty. A background thread writes them
+    out (atomically) after FLUSH_DELAY seconds without further changes, or
+    after FLUSH_AFTER_CHANGES changes, whichever comes first. Call flush()
+    or close() on shutdown; an atexit hook catches anything left over.
+    flush_delay=None writes through on every set(). After a failed write
+    the background thread backs off (flush_delay, doubling up to
+    MAX_RETRY_DELAY) instead of retrying straight away.
+    """
+
+    def __init__(
+        self,
+        settings_path: str = SETTINGS_FILE,
+        fsync: str = DEFAULT_FSYNC,
+        flush_delay: Optional[float] = FLUSH_DELAY,
+        flush_after: int = FLUSH_AFTER_CHANGES
+    ):
+        self.settings_path = Path(settings_path)
+        self.fsync = fsync
+        self.flush_delay = flush_delay
+        self.flush_after = max(1, flush_after)
         self.settings = self.load_settings()
+        self.writes = 0 # Files written, for diagnostics/benchmarks
+        self.failures = 0 # Failed writes in a row
+        
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock() # Keeps writes in order
+        self._dirty = False
+        self._pending = 0
+        self._last_change = 0.0
+        self._retry_at = 0.0
+        self._closed = False
+        self._flusher: Optional[threading.Thread] = None
+        
+        ref = weakref.ref(self)
+        atexit.register(lambda: ref() is not None and ref().flush())
 
     def load_settings(self) -> Dict[str, Any]:
         if not self.settings_path.exists():
@@ -24,20 +94,99 @@ class SettingsService:
             with open(self.settings_path, "r") as f:
                 data = json.load(f)
                 # Merge with defaults to ensure new keys exist
-                return {**DEFAULT_SETTINGS, **data}
+                return {**DEFAULT_SETTINGS, **{k: _coerce(k, v) for k, v in data.items()}}
         except:
             return DEFAULT_SETTINGS.copy()
 
     def save_settings(self):
-        try:
-            with open(self.settings_path, "w") as f:
-                json.dump(self.settings, f, indent=4)
-        except Exception as e:
-            print(f"Failed to save settings: {e}")
+        """Write the current settings now, whether or not anything changed."""
+        with self._cond:
+            self._dirty = True
+        self.flush()
+
+    def flush(self) -> bool:
+        """Write pending changes. Returns True if a file was written."""
+        with self._write_lock:
+            try:
+                with self._cond:
+                    if not self._dirty:
+                        return False
+                    # A value json can't hold fails here, like an I/O error
+                    snapshot = json.dumps(self.settings, indent=4)
+                    self._dirty = False
+                    self._pending = 0
+                # Temp file + rename under a lock: a crash or a second instance
+                # can never leave a truncated settings.json behind
+                atomic_write(self.settings_path, snapshot, fsync=self.fsync)
+            except Exception as e:
+                print(f"Failed to save settings: {e}")
+                with self._cond:
+                    self._dirty = True # Retry on a later flush
+                    self._pending = 0
+                    self.failures += 1
+                    delay = (self.flush_delay or FLUSH_DELAY) * 2 ** (self.failures - 1)
+                    self._retry_at = time.monotonic() + min(delay, MAX_RETRY_DELAY)
+                return False
+            with self._cond:
+                self.writes += 1
+                self.failures = 0
+            return True
+
+    def close(self):
+        """Flush and stop the background writer."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
 
     def get(self, key: str):
         return self.settings.get(key, DEFAULT_SETTINGS.get(key))
 
+    @property
+    def view(self) -> Settings:
+        with self._cond:
+            return Settings(**{f.name: _coerce(f.name, self.get(f.name)) for f in fields(Settings)})
+
     def set(self, key: str, value: Any):
-        self.settings[key] = value
-        self.save_settings()
+        value = _coerce(key, value)
+        with self._cond:
+            if key in self.settings and self.settings[key] == value:
+                return
+            self.settings[key] = value
+            self._dirty = True
+            self._pending += 1
+            self._last_change = time.monotonic()
+            if self.flush_delay is not None and not self._closed:
+                self._ensure_flusher()
+                self._cond.notify()
+                return
+        self.flush()
+
+    def _ensure_flusher(self):
+        # Called with _cond held
+        if self._flusher is None:
+            self._flusher = threading.Thread(target=self._flush_loop, name="settings-flush", daemon=True)
+            self._flusher.start()
+
+    def _flush_loop(self):
+        while True:
+            with self._cond:
+                while not self._dirty and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return # close() does the final flush
+                # Debounce: wait for a quiet period unless enough changes piled up
+                while self._dirty and not self._closed and self._pending < self.flush_after:
+                    remaining = self._last_change + self.flush_delay - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                # Back off after a failed write (unwritable path, bad value)
+                while self._dirty and not self._closed:
+                    remaining = self._retry_at - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+            self.flush()
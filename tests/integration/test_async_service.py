@@ -0,0 +1,133 @@
+import asyncio
+import shutil
+import threading
+import time
+import unittest
+from pathlib import Path
+from datetime import date
+
+from services.holiday_service import HolidayService
+
+
+def drain(service, gate):
+    """Let fetches left running by a timed-out/cancelled request finish."""
+    gate.set()
+    deadline = time.monotonic() + 5
+    while service._inflight and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestAsyncHolidayService(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.test_dir = Path("tests/integration_temp_async")
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+        self.test_dir.mkdir()
+        self.service = HolidayService(str(self.test_dir))
+        self.gate = threading.Event()
+        self.gate.set()
+        self.calls = []
+
+        def fake_fetch(year, **kwargs):
+            self.calls.append(year)
+            self.gate.wait(5)
+            time.sleep(0.1)
+            if year == 1999:
+                raise RuntimeError("Network error: boom")
+            return {date(year, 1, 1): "New Year"}
+
+        self.service.fetch_holidays_sync = fake_fetch
+
+    def tearDown(self):
+        drain(self.service, self.gate)
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    async def test_get_holidays_then_memory_hit(self):
+        holidays, source = await self.service.get_holidays(2026)
+        self.assertEqual(holidays, {date(2026, 1, 1): "New Year"})
+        self.assertEqual(source, "Live Fetch")
+
+        again, _ = await self.service.get_holidays(2026)
+        self.assertEqual(again, holidays)
+        self.assertEqual(self.calls, [2026])
+
+    async def test_many_years_run_concurrently(self):
+        start = time.perf_counter()
+        found = await self.service.get_holidays_many([2024, 2025, 2026, 2027, 1999])
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(sorted(found), [2024, 2025, 2026, 2027])
+        self.assertLess(elapsed, 0.4) # Sequential would take 0.5s
+
+    async def test_timeout(self):
+        self.gate.clear()
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.service.get_holidays(2026, timeout=0.05)
+
+        # The fetch that was already running still fills the cache
+        self.gate.set()
+        for _ in range(50):
+            if self.service.peek(2026) is not None:
+                break
+            await asyncio.sleep(0.02)
+        self.assertEqual(self.service.peek(2026), {date(2026, 1, 1): "New Year"})
+
+    async def test_cancellation(self):
+        self.gate.clear()
+        task = asyncio.ensure_future(self.service.get_holidays(2026))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+    async def test_offline_miss_raises(self):
+        with self.assertRaises(RuntimeError):
+            await self.service.get_holidays(2026, offline=True)
+        self.assertEqual(self.calls, [])
+
+
+class TestCallbackAdapter(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path("tests/integration_temp_async_cb")
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+        self.test_dir.mkdir()
+        self.service = HolidayService(str(self.test_dir))
+        self.gate = threading.Event()
+
+        def slow_fetch(year, **kwargs):
+            self.gate.wait(5)
+            return {date(year, 1, 1): "New Year"}
+
+        self.service.fetch_holidays_sync = slow_fetch
+
+    def tearDown(self):
+        drain(self.service, self.gate)
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_timeout_reports_error(self):
+        errors = []
+        event = threading.Event()
+
+        def on_error(message):
+            errors.append(message)
+            event.set()
+
+        self.service.fetch_holidays_async(2026, lambda h, s: event.set(), on_error, timeout=0.05)
+        self.assertTrue(event.wait(2))
+        self.assertEqual(len(errors), 1)
+        self.assertIn("Timed out", errors[0])
+
+    def test_cancelled_request_fires_no_callback(self):
+        fired = []
+        future = self.service.fetch_holidays_async(2026, lambda h, s: fired.append(h), lambda e: fired.append(e))
+        self.assertTrue(future.cancel())
+        self.gate.set()
+        time.sleep(0.2)
+        self.assertEqual(fired, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import json
+import multiprocessing
+import os
+import shutil
+import stat
+import time
+import unittest
+from pathlib import Path
+from datetime import date
+
+from services.atomic_io import atomic_open, atomic_path, atomic_write, file_lock
+from services.holiday_store import HolidayStore
+from services.settings_service import SettingsService
+
+WRITERS = 4
+ROUNDS = 40
+
+
+def _hammer(test_dir: str, worker: int):
+    """Runs in a child process: rewrite settings and holiday years in a loop."""
+    settings = SettingsService(str(Path(test_dir) / "settings.json"))
+    store = HolidayStore(str(Path(test_dir) / "holidays.db"))
+    for i in range(ROUNDS):
+        # Big enough that a torn write would show up as invalid JSON
+        settings.settings["payload"] = [worker * 1000 + i] * 2000
+        settings.save_settings()
+        store.save_year(2026, {date(2026, 1, 1 + (i % 28)): f"worker {worker} round {i}"})
+    return worker
+
+
+class TestAtomicWrites(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path("tests/integration_temp_atomic")
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+        self.test_dir.mkdir()
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_atomic_write_replaces_whole_file(self):
+        target = self.test_dir / "data.json"
+        atomic_write(target, '{"a": 1}')
+        atomic_write(target, b'{"b": 2}', fsync="full")
+        self.assertEqual(json.loads(target.read_text()), {"b": 2})
+        # Only the target remains, no stray temp or lock files
+        self.assertEqual(sorted(p.name for p in self.test_dir.iterdir()), ["data.json"])
+
+    @unittest.skipUnless(os.name == "posix", "POSIX file modes")
+    def test_file_mode_is_not_owner_only(self):
+        target = self.test_dir / "shared.json"
+        atomic_write(target, "{}")
+        umask = os.umask(0)
+        os.umask(umask)
+        self.assertEqual(stat.S_IMODE(target.stat().st_mode), 0o666 & ~umask)
+
+        # A replaced file keeps its mode, through every helper
+        os.chmod(target, 0o640)
+        atomic_write(target, "{}")
+        self.assertEqual(stat.S_IMODE(target.stat().st_mode), 0o640)
+        with atomic_open(target) as f:
+            f.write(b"{}")
+        self.assertEqual(stat.S_IMODE(target.stat().st_mode), 0o640)
+        with atomic_path(target) as tmp:
+            Path(tmp).write_text("{}")
+        self.assertEqual(stat.S_IMODE(target.stat().st_mode), 0o640)
+
+    def test_atomic_open_streams_and_replaces(self):
+        target = self.test_dir / "out.bin"
+        target.write_bytes(b"old")
+        with atomic_open(target) as f:
+            for i in range(3):
+                f.write(b"chunk%d" % i)
+            self.assertEqual(target.read_bytes(), b"old") # Not visible until the block ends
+        self.assertEqual(target.read_bytes(), b"chunk0chunk1chunk2")
+
+    def test_atomic_open_keeps_old_file_on_error(self):
+        target = self.test_dir / "out.bin"
+        target.write_bytes(b"old")
+        with self.assertRaises(RuntimeError):
+            with atomic_open(target) as f:
+                f.write(b"partial")
+                raise RuntimeError("boom")
+        self.assertEqual(target.read_bytes(), b"old")
+        self.assertEqual([p.name for p in self.test_dir.iterdir()], ["out.bin"])
+
+    def test_bad_fsync_policy(self):
+        with self.assertRaises(ValueError):
+            atomic_write(self.test_dir / "x", "x", fsync="sometimes")
+
+    def test_lock_times_out(self):
+        target = self.test_dir / "locked"
+        with file_lock(target):
+            ctx = multiprocessing.get_context("spawn")
+            with ctx.Pool(1) as pool:
+                self.assertFalse(pool.apply(_try_lock, (str(target),)))
+        self.assertFalse((self.test_dir / "locked.lock").exists())
+
+    def test_concurrent_processes(self):
+        settings_path = self.test_dir / "settings.json"
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(WRITERS) as pool:
+            pending = pool.starmap_async(_hammer, [(str(self.test_dir), w) for w in range(WRITERS)])
+            reads = 0
+            deadline = time.monotonic() + 60
+            while (not pending.ready() or reads == 0) and time.monotonic() < deadline:
+                if settings_path.exists():
+                    data = json.loads(settings_path.read_text()) # Never partial
+                    self.assertEqual(len(set(data["payload"])), 1)
+                    self.assertEqual(len(data["payload"]), 2000)
+                    reads += 1
+            self.assertGreater(reads, 0, "settings.json was never written")
+            self.assertEqual(sorted(pending.get(timeout=60)), list(range(WRITERS)))
+        self.assertFalse((self.test_dir / "settings.json.lock").exists())
+
+        store = HolidayStore(str(self.test_dir / "holidays.db"))
+        holidays, _ = store.load_year(2026)
+        self.assertEqual(len(holidays), 1)
+        self.assertEqual(store.schema_version, 2)
+
+
+def _try_lock(path: str) -> bool:
+    try:
+        with file_lock(path, timeout=0.1):
+            return True
+    except TimeoutError:
+        return False
+
+
+if __name__ == '__main__':
+    unittest.main()
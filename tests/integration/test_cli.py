@@ -0,0 +1,84 @@
+import unittest
+import shutil
+import subprocess
+import sys
+import io
+import json
+from contextlib import redirect_stdout
+from pathlib import Path
+from datetime import date
+from services.holiday_service import HolidayService
+from cli.app import main
+
+class TestCliIntegration(unittest.TestCase):
+    """
+    Integration tests for the headless CLI.
+    Uses a seeded cache directory and --offline, so no network is needed.
+    """
+
+    def setUp(self):
+        self.test_dir = Path("tests/integration_temp_cli")
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+        self.test_dir.mkdir()
+        HolidayService(str(self.test_dir)).save_to_cache(2026, {
+            date(2026, 3, 23): "Hari Raya Aidilfitri",
+            date(2026, 3, 24): "Hari Raya Aidilfitri Day 2",
+        })
+        self.common = ["--year", "2026", "--cache-dir", str(self.test_dir), "--offline"]
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def _run(self, argv):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = main(argv)
+        return code, out.getvalue()
+
+    def test_calculate_json(self):
+        code, out = self._run(["calculate", "--month", "3", "--grade", "JG6",
+                               "--leave", "2026-03-25,26/03/2026", "--json"] + self.common)
+        self.assertEqual(code, 0)
+        summary = json.loads(out)
+        self.assertEqual(summary["working_days"], 18)
+        self.assertEqual(summary["total_reimbursement"], 1800)
+
+    def test_export_csv(self):
+        target = self.test_dir / "march.csv"
+        code, _ = self._run(["export", "--month", "3", "-o", str(target)] + self.common)
+        self.assertEqual(code, 0)
+        self.assertIn("Hari Raya Aidilfitri", target.read_text(encoding="utf-8"))
+
+    def test_all_months_requires_pdf(self):
+        code, _ = self._run(["export", *self.common, "--month", "3", "--all-months", "-o", str(self.test_dir / "year.csv")])
+        self.assertEqual(code, 1)
+        self.assertFalse((self.test_dir / "year.csv").exists())
+
+    def test_batch_export_dir(self):
+        roster = self.test_dir / "roster.csv"
+        roster.write_text("employee_id,grade,leave_dates\nE1,JG5,\nE2,JG6,2026-03-10\n", encoding="utf-8")
+        out_dir = self.test_dir / "files"
+        code, out = self._run(["batch", *self.common, "--month", "3", "--roster", str(roster),
+                               "-o", str(self.test_dir / "summary.csv"), "--export-dir", str(out_dir),
+                               "--formats", "csv", "--merge", "zip", "--workers", "1"])
+        self.assertEqual(code, 0)
+        self.assertIn("Exported 2/2 files", out)
+        self.assertEqual(sorted(p.name for p in out_dir.iterdir()), ["E1.csv", "E2.csv", "roster_2026_03.zip"])
+
+    def test_offline_without_cache_fails_cleanly(self):
+        code, _ = self._run(["fetch-holidays", "--year", "2001", "--cache-dir", str(self.test_dir), "--offline"])
+        self.assertEqual(code, 1)
+
+    def test_does_not_import_gui_or_exporters(self):
+        code = (
+            "import sys; from cli.app import main; "
+            f"main({['calculate', '--month', '3'] + self.common!r}); "
+            "print('loaded=' + ','.join(m for m in ('tkinter', 'openpyxl', 'reportlab') if m in sys.modules))"
+        )
+        proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        self.assertEqual(proc.stdout.strip().splitlines()[-1], "loaded=")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import unittest
+import shutil
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from dataclasses import replace
+from datetime import date
+from unittest import mock
+from services.holiday_service import HolidayService
+from services.holiday_sources import get_source, register_source
+from services.holiday_store import DEFAULT_REGION
+
+FIXTURE = Path(__file__).resolve().parent.parent / "fixtures" / "sabah_public_holidays.html"
+
+class _HolidayPageHandler(BaseHTTPRequestHandler):
+    """Serves server.body; honours If-None-Match when server.etag is set."""
+
+    def do_GET(self):
+        srv = self.server
+        srv.requests.append(dict(self.headers))
+        if srv.etag and self.headers.get("If-None-Match") == srv.etag:
+            srv.statuses.append(304)
+            self.send_response(304)
+            self.send_header("ETag", srv.etag)
+            self.end_headers()
+            return
+        srv.statuses.append(200)
+        body = srv.body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if srv.etag:
+            self.send_header("ETag", srv.etag)
+            self.send_header("Last-Modified", "Thu, 01 Jan 2026 00:00:00 GMT")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class TestConditionalFetchIntegration(unittest.TestCase):
+    """
+    Integration tests for conditional holiday revalidation against a
+    local stand-in for the holiday site.
+    """
+
+    def setUp(self):
+        self.test_dir = Path("tests/integration_temp_http")
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+        self.test_dir.mkdir()
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _HolidayPageHandler)
+        self.server.body = FIXTURE.read_text(encoding="utf-8")
+        self.server.etag = '"v1"'
+        self.server.requests = []
+        self.server.statuses = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        self.service = HolidayService(str(self.test_dir))
+        self.service.base_url = f"http://127.0.0.1:{self.server.server_address[1]}/ms/public-holidays"
+
+        # Count parser runs
+        self.parses = 0
+        original = get_source(DEFAULT_REGION)
+        def counting_parser(year):
+            self.parses += 1
+            return original.parser_factory(year)
+        register_source(replace(original, parser_factory=counting_parser), replace=True)
+        self.addCleanup(register_source, original, replace=True)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_etag_304_skips_parsing(self):
+        holidays, source = self.service.get_holidays_sync(2026, force_refresh=True)
+        self.assertEqual(len(holidays), 18)
+        self.assertEqual(self.parses, 1)
+        first_fetched_at = self.service.store.fetched_at(2026)
+        self.assertEqual(self.service.store.validators(2026).etag, '"v1"')
+
+        again, _ = self.service.get_holidays_sync(2026, force_refresh=True)
+
+        self.assertEqual(again, holidays)
+        self.assertEqual(self.server.statuses, [200, 304])
+        self.assertEqual(self.server.requests[1].get("If-None-Match"), '"v1"')
+        self.assertEqual(self.parses, 1)
+        self.assertGreater(self.service.store.fetched_at(2026), first_fetched_at)
+        self.assertEqual(self.service.cache_stats()["not_modified"], 1)
+
+    def test_unchanged_body_hash_skips_parsing(self):
+        self.server.etag = None  # Source without validators
+        self.service.get_holidays_sync(2026, force_refresh=True)
+        self.service.get_holidays_sync(2026, force_refresh=True)
+
+        self.assertEqual(self.server.statuses, [200, 200])
+        self.assertEqual(self.parses, 1)
+        self.assertEqual(self.service.cache_stats()["not_modified"], 1)
+
+    def test_changed_body_is_parsed(self):
+        self.server.etag = None
+        self.service.get_holidays_sync(2026, force_refresh=True)
+
+        self.server.body = self.server.body.replace("Deepavali", "Hari Deepavali")
+        holidays, _ = self.service.get_holidays_sync(2026, force_refresh=True)
+
+        self.assertEqual(self.parses, 2)
+        self.assertEqual(holidays[date(2026, 11, 8)], "Hari Deepavali")
+        self.assertEqual(self.service.load_from_cache(2026)["holidays"]["2026-11-08"], "Hari Deepavali")
+
+    def test_changed_body_spooled_to_disk_is_parsed(self):
+        self.server.etag = None
+        first, _ = self.service.get_holidays_sync(2026, force_refresh=True)
+
+        self.server.body = self.server.body.replace("Deepavali", "Hari Deepavali")
+        # Far smaller than the page, so the held-back body goes to a temp file
+        with mock.patch("services.holiday_service.SPOOL_MEMORY_SIZE", 1024):
+            holidays, _ = self.service.get_holidays_sync(2026, force_refresh=True)
+
+        self.assertEqual(len(holidays), len(first))
+        self.assertEqual(holidays[date(2026, 11, 8)], "Hari Deepavali")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import importlib.util
+import os
+import stat
+import unittest
+import shutil
+import zipfile
+from pathlib import Path
+from datetime import date
+from domain.calculator import calculate_periods
+from services.export_service import ExportJob, ExportService, safe_name
+
+class TestExportServiceIntegration(unittest.TestCase):
+    """
+    Integration tests for the sharded exporter.
+    Uses CSV output so only the standard library is needed.
+    """
+
+    def setUp(self):
+        self.test_dir = Path("tests/integration_temp_export")
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+        self.test_dir.mkdir()
+        results = calculate_periods(
+            [(2026, 3, "JG6", {date(2026, 3, 10)}) for _ in range(12)],
+            {date(2026, 3, 23): "Hari Raya Aidilfitri"}
+        )
+        self.jobs = [ExportJob(f"EMP{i:03d}", r) for i, r in enumerate(results)]
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_process_pool_writes_every_file(self):
+        progress = []
+        service = ExportService(self.test_dir, ["csv"], max_workers=3, chunk_size=4)
+        report = service.export(self.jobs, on_progress=lambda done, total, o: progress.append((done, total)))
+
+        self.assertEqual(report.failures, [])
+        self.assertEqual([o.name for o in report.outcomes], [j.name for j in self.jobs]) # Job order
+        self.assertEqual(progress[-1], (12, 12))
+        self.assertEqual(sorted(p.name for p in self.test_dir.iterdir()), [f"EMP{i:03d}.csv" for i in range(12)])
+        self.assertIn("Hari Raya Aidilfitri", (self.test_dir / "EMP000.csv").read_text(encoding="utf-8"))
+
+    def test_failure_does_not_abort_batch(self):
+        # A directory where the output should go makes that one rename fail
+        (self.test_dir / "EMP005.csv").mkdir()
+        report = ExportService(self.test_dir, ["csv"], max_workers=2, chunk_size=3).export(self.jobs)
+
+        self.assertEqual([o.name for o in report.failures], ["EMP005"])
+        self.assertEqual(sum(1 for o in report.outcomes if o.ok), 11)
+        self.assertIn("1 failed", report.summary())
+        # No temp files left behind by the failed write
+        self.assertEqual([p for p in self.test_dir.iterdir() if p.name.endswith(".tmp")], [])
+
+    def test_zip_merge(self):
+        report = ExportService(self.test_dir, ["csv"], max_workers=1).export(self.jobs[:3], merge="zip", merge_name="march")
+
+        self.assertTrue(report.merged.ok)
+        with zipfile.ZipFile(report.merged.path) as zf:
+            self.assertEqual(sorted(zf.namelist()), ["EMP000.csv", "EMP001.csv", "EMP002.csv"])
+
+    def _assert_clean_output(self, expected):
+        # Exactly the requested files: no temp or lock files, and the usual
+        # permissions rather than the temp file's owner-only 0600
+        self.assertEqual(sorted(p.name for p in self.test_dir.iterdir()), sorted(expected))
+        if os.name == "posix":
+            umask = os.umask(0)
+            os.umask(umask)
+            for name in expected:
+                self.assertEqual(stat.S_IMODE((self.test_dir / name).stat().st_mode), 0o666 & ~umask, name)
+
+    def test_output_directory_is_clean(self):
+        report = ExportService(self.test_dir, ["csv"], max_workers=3, chunk_size=4).export(self.jobs, merge="zip", merge_name="all")
+        self.assertEqual(report.failures, [])
+        self._assert_clean_output([f"EMP{i:03d}.csv" for i in range(12)] + ["all.zip"])
+
+    @unittest.skipUnless(importlib.util.find_spec("reportlab"), "reportlab not installed")
+    def test_output_directory_is_clean_with_pdf_merge(self):
+        report = ExportService(self.test_dir, ["pdf", "csv"], max_workers=3, chunk_size=4).export(self.jobs, merge="pdf", merge_name="all")
+        self.assertEqual(report.failures, [])
+        self._assert_clean_output(
+            [f"EMP{i:03d}.{fmt}" for i in range(12) for fmt in ("pdf", "csv")] + ["all.pdf"]
+        )
+
+    def test_unsafe_and_duplicate_names(self):
+        self.assertEqual(safe_name("../a b/c"), "a_b_c")
+        jobs = [ExportJob("A/1", self.jobs[0].result), ExportJob("A 1", self.jobs[1].result)]
+        report = ExportService(self.test_dir, ["csv"], max_workers=1).export(jobs)
+        self.assertEqual(sorted(Path(o.path).name for o in report.outcomes), ["A_1-2.csv", "A_1.csv"])
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            ExportService(self.test_dir, ["docx"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,9 @@ from datetime import date
 from domain.models import CalculationResult, Holiday
 from exporters.excel_exporter import ExcelExporter
 from exporters.csv_exporter import CsvExporter
+import re
+from domain.calculator import calculate_periods
+from exporters.pdf_exporter import BatchPdfExporter, PdfExporter
 
 class TestExporterIntegration(unittest.TestCase):
     """
@@ -52,3 +55,48 @@ class TestExporterIntegration(unittest.TestCase):
             content = f.read()
             self.assertIn("JG6", content)
             self.assertIn("New Year", content)
+
+    def test_pdf_to_bytes_stays_in_memory(self):
+        data = PdfExporter(self.res, "Integration Test").to_bytes()
+
+        self.assertTrue(data.startswith(b"%PDF"))
+        self.assertGreater(len(data), 1000, "PDF seems too small")
+        self.assertEqual(list(self.test_dir.iterdir()), []) # Nothing written
+
+    def test_pdf_creation(self):
+        filename = self.test_dir / "test.pdf"
+        PdfExporter(self.res, "Integration Test").export(str(filename))
+
+        self.assertTrue(filename.read_bytes().startswith(b"%PDF"))
+
+    def test_batch_pdf_shares_one_template(self):
+        results = calculate_periods([(2026, m, "JG6", set()) for m in range(1, 13)], {date(2026, 1, 1): "New Year"})
+        filename = self.test_dir / "year.pdf"
+        pages = BatchPdfExporter(results, "Integration Test").export(str(filename))
+
+        data = filename.read_bytes()
+        self.assertEqual(pages, 12)
+        self.assertEqual(len(re.findall(rb"/Type /Page\b(?!s)", data)), 12)
+        self.assertEqual(data.count(b"/Subtype /Form"), 1) # Static artwork drawn once
+
+    def test_batch_pdf_in_parts(self):
+        import fitz
+        results = calculate_periods([(2026, m, "JG6", set()) for m in range(1, 13)], {date(2026, 1, 1): "New Year"})
+        filename = self.test_dir / "roster.pdf"
+        pages = BatchPdfExporter(((f"EMP{i:03d}", r) for i, r in enumerate(results)), part_size=5).export(str(filename))
+
+        self.assertEqual(pages, 12)
+        with fitz.open(str(filename)) as doc:
+            self.assertEqual(doc.page_count, 12)
+            # Parts are appended in order
+            self.assertEqual([("EMP%03d" % i) in doc[i].get_text() for i in range(12)], [True] * 12)
+        self.assertEqual([p.name for p in self.test_dir.iterdir()], ["roster.pdf"])
+
+    def test_batch_pdf_accepts_labelled_pages(self):
+        data = BatchPdfExporter(iter([("EMP001", self.res), ("EMP002", self.res)])).to_bytes()
+        self.assertTrue(data.startswith(b"%PDF"))
+
+    def test_batch_pdf_empty(self):
+        with self.assertRaises(ValueError):
+            BatchPdfExporter([]).export(str(self.test_dir / "empty.pdf"))
+        self.assertFalse((self.test_dir / "empty.pdf").exists())
@@ -0,0 +1,104 @@
+import unittest
+import shutil
+import time
+from pathlib import Path
+from datetime import date
+
+from services.holiday_bundle import HolidayBundle, build_bundle, encode_bundle, default_bundle_path
+from services.holiday_service import HolidayService
+from services.holiday_store import HolidayStore
+
+
+class TestHolidayBundle(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path("tests/integration_temp_bundle")
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+        self.test_dir.mkdir()
+        self.bundle_path = self.test_dir / "holidays.bin"
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_encode_decode_roundtrip(self):
+        data = encode_bundle([
+            ("Sabah", 2026, {date(2026, 1, 1): "Tahun Baharu", date(2026, 12, 25): "Hari Krismas"}),
+            ("Selangor", 2026, {date(2026, 1, 1): "Tahun Baharu", date(2026, 12, 11): "Hari Keputeraan Sultan Selangor"}),
+            ("Sabah", 2025, {date(2025, 12, 25): "Hari Krismas", date(2026, 1, 1): "Wrong year, dropped"}),
+        ], version=7)
+        bundle = HolidayBundle.from_bytes(data)
+
+        self.assertEqual(bundle.version, 7)
+        self.assertEqual(bundle.regions(), ["Sabah", "Selangor"])
+        self.assertEqual(bundle.years("Sabah"), [2025, 2026])
+        self.assertEqual(bundle.load_year(2025, "Sabah"), {date(2025, 12, 25): "Hari Krismas"})
+        self.assertEqual(bundle.load_year(2026, "Selangor")[date(2026, 12, 11)], "Hari Keputeraan Sultan Selangor")
+        self.assertIsNone(bundle.load_year(2024, "Sabah"))
+
+    def test_build_from_store(self):
+        store = HolidayStore(str(self.test_dir / "holidays.db"))
+        store.save_year(2026, {date(2026, 5, 30): "Pesta Kaamatan"})
+        self.assertEqual(build_bundle(store, str(self.bundle_path), version=20260101), 1)
+
+        bundle = HolidayBundle.open(str(self.bundle_path))
+        self.assertEqual(bundle.version, 20260101)
+        self.assertEqual(bundle.load_year(2026, "Sabah"), {date(2026, 5, 30): "Pesta Kaamatan"})
+
+    def test_missing_or_corrupt_bundle(self):
+        self.assertIsNone(HolidayBundle.open(str(self.test_dir / "absent.bin")))
+        self.bundle_path.write_bytes(b"not a bundle at all")
+        self.assertIsNone(HolidayBundle.open(str(self.bundle_path)))
+
+    def test_shipped_bundle(self):
+        bundle = HolidayBundle.open(str(default_bundle_path()))
+        self.assertIsNotNone(bundle)
+        self.assertIn(2026, bundle.years("Sabah"))
+        self.assertEqual(bundle.load_year(2026, "Sabah")[date(2026, 1, 1)], "Tahun Baru / New Year's Day")
+
+        # National calendar for states without a live source: federal days only
+        self.assertIn("Malaysia", bundle.regions())
+        national = bundle.load_year(2026, "Malaysia")
+        self.assertEqual(national[date(2026, 5, 31)], "Hari Wesak / Wesak Day")
+        self.assertNotIn(date(2026, 5, 30), national) # Pesta Kaamatan is Sabah only
+        self.assertNotIn(date(2026, 1, 1), national)
+        self.assertTrue(set(national) <= set(bundle.load_year(2026, "Sabah")))
+
+    def test_bundled_year_without_holidays(self):
+        self.bundle_path.write_bytes(encode_bundle([("Sabah", 2030, {})], version=4))
+        service = HolidayService(str(self.test_dir), bundle_path=str(self.bundle_path))
+
+        # An empty year is still bundled data, not a missing year
+        holidays, source = service.get_holidays_sync(2030, offline=True)
+        self.assertEqual(holidays, {})
+        self.assertEqual(source, "Bundled dataset (v4)")
+
+    def test_service_serves_bundle_then_updates(self):
+        self.bundle_path.write_bytes(encode_bundle([("Sabah", 2026, {date(2026, 1, 1): "Tahun Baharu"})], version=3))
+        service = HolidayService(str(self.test_dir), bundle_path=str(self.bundle_path))
+
+        # Offline first run: no store, no network
+        holidays, source = service.get_holidays_sync(2026, offline=True)
+        self.assertEqual(holidays, {date(2026, 1, 1): "Tahun Baharu"})
+        self.assertEqual(source, "Bundled dataset (v3)")
+
+        # Online: the bundled copy counts as stale, so a live fetch replaces it
+        updated = []
+        service.add_listener(lambda year, h, src, diff: updated.append((year, h, src, diff)))
+        service.clear_cache()
+        service.fetch_holidays_sync = lambda year, **kwargs: {date(2026, 1, 1): "Tahun Baharu", date(2026, 2, 17): "Tahun Baharu Cina"}
+        service.get_holidays_sync(2026)
+        for _ in range(100):
+            if updated:
+                break
+            time.sleep(0.02)
+
+        self.assertEqual(updated[0][0], 2026)
+        # Diffed against the bundled copy callers were served, not the (empty) store
+        self.assertEqual(updated[0][3].added, {date(2026, 2, 17): "Tahun Baharu Cina"})
+        self.assertEqual(len(service.peek(2026)), 2)
+        self.assertIn(2026, service.store.years())
+
+
+if __name__ == '__main__':
+    unittest.main()
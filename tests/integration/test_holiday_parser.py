@@ -0,0 +1,69 @@
+import unittest
+from pathlib import Path
+from datetime import date
+from services.holiday_parser import MAX_LINE, HolidayPageParser, parse_holiday_page
+
+FIXTURE = Path(__file__).resolve().parent.parent / "fixtures" / "sabah_public_holidays.html"
+
+class TestHolidayParser(unittest.TestCase):
+    """
+    Tests for the streaming holiday page parser against a saved page.
+    """
+
+    def setUp(self):
+        self.page = FIXTURE.read_text(encoding="utf-8")
+
+    def test_parse_saved_page(self):
+        holidays = parse_holiday_page(self.page, 2026)
+
+        self.assertEqual(len(holidays), 18)
+        self.assertEqual(holidays[date(2026, 1, 1)], "Tahun Baru / New Year's Day")
+        self.assertEqual(holidays[date(2026, 5, 30)], "Pesta Kaamatan / Harvest Festival")
+        # Two holidays on one date are merged
+        self.assertEqual(
+            holidays[date(2026, 5, 31)],
+            "Hari Wesak / Wesak Day / Pesta Kaamatan (Hari Kedua) / Harvest Festival (Second Day)"
+        )
+        # Other years and dates inside <script> are ignored
+        self.assertNotIn(date(2025, 12, 24), holidays)
+
+    def test_chunk_boundaries_do_not_matter(self):
+        expected = parse_holiday_page(self.page, 2026)
+        for size in (1, 7, 64, 1000):
+            parser = HolidayPageParser(2026)
+            for i in range(0, len(self.page), size):
+                parser.feed(self.page[i:i + size])
+            self.assertEqual(parser.close(), expected, f"chunk size {size}")
+
+    def test_page_without_newlines(self):
+        expected = parse_holiday_page(self.page, 2026)
+        minified = self.page.replace("\n", "")
+        self.assertEqual(parse_holiday_page(minified, 2026), expected)
+        for size in (1, 7, 64, 1000):
+            parser = HolidayPageParser(2026)
+            longest = 0
+            for i in range(0, len(minified), size):
+                parser.feed(minified[i:i + size])
+                longest = max(longest, len(parser._line))
+            self.assertEqual(parser.close(), expected, f"chunk size {size}")
+            # Held back up to the next cell/row end, never the whole page
+            self.assertLess(longest, 400, f"chunk size {size}")
+
+    def test_line_buffer_is_capped(self):
+        parser = HolidayPageParser(2026)
+        for _ in range(50):
+            parser.feed("x" * 10000) # No tags, no newlines
+            self.assertLessEqual(len(parser._line), MAX_LINE)
+        parser.feed("<tr><td>Hari Pekerja</td><td>1 May 2026</td></tr>")
+        self.assertEqual(parser.close(), {date(2026, 5, 1): "Hari Pekerja"})
+
+    def test_script_block_joins_surrounding_text(self):
+        page = "<td>Harvest Festival</td><script>\nvar d = '2 June 2026';\n</script>\n<td>30 May 2026</td>"
+        self.assertEqual(parse_holiday_page(page, 2026), {date(2026, 5, 30): "Harvest Festival"})
+
+    def test_invalid_dates_and_default_name(self):
+        page = "<td>31 February 2026</td>\n<td>1 May 2026</td>"
+        self.assertEqual(parse_holiday_page(page, 2026), {date(2026, 5, 1): "Public Holiday"})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+import shutil
+import threading
+from pathlib import Path
+from datetime import date
+
+from services.holiday_service import HolidayService
+from services.holiday_prefetcher import HolidayPrefetcher
+
+
+class TestHolidayPrefetcher(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path("tests/integration_temp_prefetch")
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+        self.test_dir.mkdir()
+        self.service = HolidayService(str(self.test_dir))
+        self.fetched = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.started = threading.Event()
+
+        def fake_fetch(year, **kwargs):
+            self.started.set()
+            self.gate.wait(5)
+            self.fetched.append(year)
+            if year == 2023:
+                raise ConnectionError("offline")
+            return {date(year, 1, 1): "New Year"}
+
+        self.service.fetch_holidays_sync = fake_fetch
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def _collect(self):
+        progress = []
+        finished = threading.Event()
+
+        def on_progress(done, total, year, ok):
+            progress.append((done, total, year, ok))
+            if done == total:
+                finished.set()
+        return progress, finished, on_progress
+
+    def test_prefetch_nearest_years_first(self):
+        prefetcher = HolidayPrefetcher(self.service, radius=2, max_workers=1)
+        progress, finished, on_progress = self._collect()
+
+        years = prefetcher.prefetch(2026, on_progress=on_progress)
+        self.assertTrue(finished.wait(5))
+        prefetcher.close()
+
+        self.assertEqual(years, [2026, 2025, 2027, 2024, 2028])
+        self.assertEqual(self.fetched, years)
+        self.assertEqual([p[2] for p in progress], years)
+        for year in years:
+            self.assertEqual(self.service.peek(year), {date(year, 1, 1): "New Year"})
+
+    def test_failed_year_is_reported_not_raised(self):
+        prefetcher = HolidayPrefetcher(self.service, radius=1, max_workers=2)
+        progress, finished, on_progress = self._collect()
+
+        prefetcher.prefetch(2024, on_progress=on_progress)
+        self.assertTrue(finished.wait(5))
+        prefetcher.close()
+
+        outcome = {year: ok for _, _, year, ok in progress}
+        self.assertEqual(outcome, {2023: False, 2024: True, 2025: True})
+        self.assertIsNone(self.service.peek(2023))
+
+    def test_warm_years_are_not_refetched(self):
+        self.service.get_holidays_sync(2026)
+        prefetcher = HolidayPrefetcher(self.service, radius=1, max_workers=1)
+        progress, finished, on_progress = self._collect()
+
+        prefetcher.prefetch(2026, on_progress=on_progress)
+        self.assertTrue(finished.wait(5))
+        prefetcher.close()
+
+        self.assertEqual(sorted(self.fetched), [2025, 2026, 2027])
+
+    def test_newer_prefetch_supersedes_queued_years(self):
+        prefetcher = HolidayPrefetcher(self.service, radius=2, max_workers=1)
+        self.gate.clear() # Hold the worker on its first year
+
+        prefetcher.prefetch(2026)
+        self.assertTrue(self.started.wait(5))
+        progress, finished, on_progress = self._collect()
+        prefetcher.prefetch(2030, radius=0, on_progress=on_progress)
+        self.gate.set()
+
+        self.assertTrue(finished.wait(5))
+        prefetcher.close()
+
+        # 2026 was already in flight; the rest of the first request was dropped
+        self.assertEqual(self.fetched, [2026, 2030])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import asyncio
+import unittest
+import shutil
+from pathlib import Path
+from datetime import date, timedelta
+
+from services.fetch_policy import RetryPolicy
+from services.holiday_service import HolidayService
+from services.holiday_sources import HolidaySource, available_regions, get_source, register_source, unregister_source
+
+
+class _FixedParser:
+    """Ignores the page and returns one holiday, so no real markup is needed."""
+
+    def __init__(self, year):
+        self.year = year
+
+    def feed(self, text):
+        pass
+
+    def close(self):
+        return {date(self.year, 12, 11): "Hari Keputeraan Sultan"}
+
+
+class TestHolidaySources(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path("tests/integration_temp_sources")
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+        self.test_dir.mkdir()
+        register_source(HolidaySource("Selangor", "http://127.0.0.1:9/{year}", _FixedParser, ttl=timedelta(days=1)))
+        self.addCleanup(unregister_source, "Selangor")
+        self.service = HolidayService(str(self.test_dir), retry_policy=RetryPolicy(attempts=1))
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_registry(self):
+        self.assertIn("Sabah", available_regions())
+        self.assertIn("Selangor", available_regions())
+        self.assertEqual(get_source("Selangor").url_for(2026), "http://127.0.0.1:9/2026")
+        with self.assertRaises(ValueError):
+            register_source(HolidaySource("Selangor", "http://elsewhere"))
+
+    def test_regions_are_cached_separately(self):
+        self.service.save_to_cache(2026, {date(2026, 5, 30): "Pesta Kaamatan"})
+        self.service.save_to_cache(2026, {date(2026, 12, 11): "Hari Keputeraan Sultan"}, region="Selangor")
+
+        sabah, _ = self.service.get_holidays_sync(2026, offline=True)
+        selangor, _ = self.service.get_holidays_sync(2026, offline=True, region="Selangor")
+
+        self.assertEqual(list(sabah), [date(2026, 5, 30)])
+        self.assertEqual(list(selangor), [date(2026, 12, 11)])
+        self.assertEqual(self.service.peek(2026, region="Selangor"), selangor)
+
+        self.service.clear_cache(region="Selangor")
+        self.assertIsNone(self.service.peek(2026, region="Selangor"))
+        self.assertIsNotNone(self.service.peek(2026))
+
+    def test_region_uses_its_own_parser(self):
+        # The fetch itself fails (nothing listens on port 9), so feed the
+        # registered parser the way fetch_holidays_sync would
+        parser = get_source("Selangor").parser_factory(2026)
+        parser.feed("<html></html>")
+        self.assertEqual(parser.close(), {date(2026, 12, 11): "Hari Keputeraan Sultan"})
+
+        with self.assertRaises(RuntimeError):
+            self.service.get_holidays_sync(2026, region="Selangor")
+
+    def test_unregistered_region_cannot_be_fetched(self):
+        with self.assertRaises(RuntimeError):
+            self.service.fetch_holidays_sync(2026, region="Atlantis")
+
+    def test_region_calendars_loaded_together(self):
+        self.service.save_to_cache(2026, {date(2026, 5, 30): "Pesta Kaamatan"})
+        self.service.save_to_cache(2027, {})
+        self.service.save_to_cache(2026, {date(2026, 12, 11): "Hari Keputeraan Sultan"}, region="Selangor")
+        self.service.save_to_cache(2027, {date(2027, 12, 11): "Hari Keputeraan Sultan"}, region="Selangor")
+
+        calendars = asyncio.run(self.service.get_region_calendars(["Sabah", "Selangor"], [2026, 2027], offline=True))
+
+        self.assertEqual(calendars["Sabah"], {date(2026, 5, 30): "Pesta Kaamatan"})
+        self.assertEqual(len(calendars["Selangor"]), 2)
+        with self.assertRaises(RuntimeError):
+            asyncio.run(self.service.get_region_calendars(["Johor"], [2026], offline=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
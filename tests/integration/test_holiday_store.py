@@ -0,0 +1,147 @@
+import unittest
+import shutil
+import json
+import sqlite3
+from pathlib import Path
+from datetime import date
+from services.holiday_store import HolidayStore, Validators, SCHEMA_VERSION, MIGRATIONS
+from services.holiday_service import HolidayService
+from domain.models import HolidayDiff
+
+class TestHolidayStoreIntegration(unittest.TestCase):
+    """
+    Integration tests for the SQLite holiday store.
+    """
+
+    def setUp(self):
+        self.test_dir = Path("tests/integration_temp_store")
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+        self.test_dir.mkdir()
+        self.store = HolidayStore(str(self.test_dir / "holidays.db"))
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_schema_and_wal(self):
+        self.assertEqual(self.store.schema_version, SCHEMA_VERSION)
+        conn = sqlite3.connect(str(self.store.db_path))
+        try:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        finally:
+            conn.close()
+
+    def test_upgrade_from_v1(self):
+        path = self.test_dir / "old.db"
+        conn = sqlite3.connect(str(path))
+        for statement in MIGRATIONS[1]:
+            conn.execute(statement)
+        conn.execute("INSERT INTO fetches (region, year, fetched_at) VALUES ('Sabah', 2025, '2025-01-01T00:00:00')")
+        conn.execute("PRAGMA user_version = 1")
+        conn.commit()
+        conn.close()
+
+        store = HolidayStore(str(path))
+        self.assertEqual(store.schema_version, SCHEMA_VERSION)
+        self.assertEqual(store.validators(2025), Validators())
+        self.assertEqual(store.load_year(2025), ({}, "2025-01-01T00:00:00"))
+
+    def test_touch_keeps_holidays(self):
+        self.store.save_year(2026, {date(2026, 1, 1): "New Year"}, validators=Validators('"a"', None, "hash"))
+        self.assertTrue(self.store.touch(2026, validators=Validators('"b"'), fetched_at="2026-06-01T00:00:00"))
+
+        self.assertEqual(self.store.load_year(2026), ({date(2026, 1, 1): "New Year"}, "2026-06-01T00:00:00"))
+        self.assertEqual(self.store.validators(2026), Validators('"b"', None, "hash"))
+        self.assertFalse(self.store.touch(2099))
+
+    def test_years_and_regions_are_separate(self):
+        self.store.save_year(2026, {date(2026, 1, 1): "New Year", date(2026, 5, 30): "Harvest Festival"})
+        self.store.save_year(2027, {date(2027, 1, 1): "New Year"})
+        self.store.save_year(2026, {date(2026, 1, 1): "New Year"}, region="Sarawak")
+
+        self.assertEqual(self.store.years(), [2026, 2027])
+        holidays, fetched_at = self.store.load_year(2026)
+        self.assertEqual(len(holidays), 2)
+        self.assertTrue(fetched_at)
+        self.assertEqual(len(self.store.load_year(2026, region="Sarawak")[0]), 1)
+        self.assertIsNone(self.store.load_year(2028))
+
+    def test_resave_replaces_year(self):
+        self.store.save_year(2026, {date(2026, 1, 1): "New Year", date(2026, 2, 1): "Old"})
+        self.store.save_year(2026, {date(2026, 1, 1): "New Year"})
+        self.assertEqual(self.store.load_year(2026)[0], {date(2026, 1, 1): "New Year"})
+
+    def test_empty_year_is_still_cached(self):
+        self.store.save_year(2030, {})
+        self.assertEqual(self.store.load_year(2030)[0], {})
+
+    def test_month_range_query(self):
+        self.store.save_year(2026, {
+            date(2026, 1, 1): "New Year",
+            date(2026, 3, 23): "Hari Raya Aidilfitri",
+            date(2026, 3, 24): "Hari Raya Aidilfitri Day 2",
+            date(2026, 12, 25): "Christmas",
+        })
+        self.assertEqual(sorted(self.store.load_month(2026, 3)), [date(2026, 3, 23), date(2026, 3, 24)])
+        self.assertEqual(list(self.store.load_month(2026, 12)), [date(2026, 12, 25)])
+
+    def test_json_caches_migrated_on_first_run(self):
+        cache_dir = self.test_dir / "legacy"
+        cache_dir.mkdir()
+        legacy = cache_dir / "holiday_cache_2025.json"
+        legacy.write_text(json.dumps({
+            "version": 1, "year": 2025, "state": "Sabah",
+            "fetched_at": "2025-01-02T03:04:05",
+            "holidays": {"2025-12-25": "Christmas"}
+        }), encoding="utf-8")
+
+        service = HolidayService(str(cache_dir))
+        # Nothing is written until the store is first needed
+        self.assertFalse((cache_dir / "holidays.db").exists())
+        self.assertTrue(legacy.exists())
+
+        holidays, source = service.get_holidays_sync(2025, offline=True)
+        self.assertEqual(holidays, {date(2025, 12, 25): "Christmas"})
+        self.assertEqual(source, "Cache (2025-01-02T03:04:05)")
+        self.assertFalse(legacy.exists())
+        self.assertTrue((cache_dir / "holiday_cache_2025.json.migrated").exists())
+
+    def test_apply_diff_writes_only_changes(self):
+        self.store.save_year(2026, {
+            date(2026, 1, 1): "New Year",
+            date(2026, 5, 30): "Kaamatan",
+            date(2026, 12, 25): "Christmas",
+        })
+        diff = HolidayDiff.between(
+            self.store.load_year(2026)[0],
+            {date(2026, 1, 1): "New Year", date(2026, 5, 30): "Pesta Kaamatan", date(2026, 8, 31): "Merdeka"}
+        )
+        self.store.apply_diff(2026, diff, validators=Validators(etag='"v2"'))
+
+        holidays, _ = self.store.load_year(2026)
+        self.assertEqual(holidays, {
+            date(2026, 1, 1): "New Year",
+            date(2026, 5, 30): "Pesta Kaamatan",
+            date(2026, 8, 31): "Merdeka",
+        })
+        self.assertEqual(self.store.validators(2026).etag, '"v2"')
+
+    def test_service_refresh_stores_diff(self):
+        service = HolidayService(str(self.test_dir))
+        service.save_to_cache(2026, {date(2026, 1, 1): "New Year", date(2026, 12, 25): "Christmas"})
+        service.fetch_holidays_sync = lambda year, **kwargs: {date(2026, 1, 1): "Tahun Baru", date(2026, 12, 25): "Christmas",
+                                                    date(2026, 3, 1): "New Sunday Holiday"}
+        saves = []
+        service.store.save_year = lambda *a, **kw: saves.append(a)
+
+        service.get_holidays_sync(2026, force_refresh=True)
+
+        self.assertEqual(saves, []) # No whole-year rewrite
+        stored = service.load_cached_holidays(2026)[0]
+        self.assertEqual(stored[date(2026, 1, 1)], "Tahun Baru")
+        self.assertEqual(stored[date(2026, 3, 1)], "New Sunday Holiday")
+        self.assertEqual(stored[date(2026, 12, 25)], "Christmas")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from dataclasses import replace
+from datetime import date
+from domain.models import CalculationResult, Holiday
+from ui.components.render_cache import RenderCache, size_bucket
+
+class TestRenderCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = RenderCache(maxsize=2)
+        cache.put(("a", (640, 480)), 1)
+        cache.put(("b", (640, 480)), 2)
+        cache.get(("a", (640, 480))) # a is now most recent
+        cache.put(("c", (640, 480)), 3)
+
+        self.assertIn(("a", (640, 480)), cache)
+        self.assertNotIn(("b", (640, 480)), cache)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.info()["hits"], 1)
+
+    def test_size_bucket(self):
+        # Small resize jitter maps to the same entry
+        self.assertEqual(size_bucket(801, 580), size_bucket(830, 600))
+        self.assertNotEqual(size_bucket(800, 600), size_bucket(900, 600))
+
+    def test_discard(self):
+        cache = RenderCache()
+        cache.put(("a", (64, 64)), 1)
+        cache.put(("a", (96, 64)), 2)
+        cache.put(("b", (64, 64)), 3)
+        self.assertEqual(cache.discard(lambda k: k[0] == "a"), 2)
+        self.assertEqual(cache.keys(), [("b", (64, 64))])
+
+class TestResultFingerprint(unittest.TestCase):
+
+    def setUp(self):
+        self.res = CalculationResult(
+            grade="JG6", rate=100, year=2026, month=1,
+            total_days_in_month=31, working_days_count=20,
+            weekend_days_count=8, public_holidays_count=1, personal_leave_count=2,
+            holidays=[Holiday(date(2026, 1, 1), "New Year")],
+            total_reimbursement=2000
+        )
+
+    def test_equal_results_share_fingerprint(self):
+        self.assertEqual(self.res.fingerprint(), replace(self.res).fingerprint())
+
+    def test_changes_alter_fingerprint(self):
+        renamed = replace(self.res, holidays=[Holiday(date(2026, 1, 1), "Tahun Baru")])
+        self.assertNotEqual(self.res.fingerprint(), renamed.fingerprint())
+        self.assertNotEqual(self.res.fingerprint(), replace(self.res, month=2).fingerprint())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,223 @@
+import shutil
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from datetime import date
+
+from services.fetch_policy import CircuitBreaker, CircuitOpenError, FetchError, RetryPolicy
+from services.holiday_service import HolidayService
+
+FIXTURE = Path(__file__).resolve().parent.parent / "fixtures" / "sabah_public_holidays.html"
+
+
+class _FaultyHandler(BaseHTTPRequestHandler):
+    """
+    Serves the fixture page, misbehaving as told by server.faults: one
+    entry is used per request ("ok", "slow", "503", "404", "truncate");
+    once the list runs out server.default applies.
+    """
+
+    def do_GET(self):
+        srv = self.server
+        with srv.lock:
+            fault = srv.faults.pop(0) if srv.faults else srv.default
+            srv.hits += 1
+        body = srv.body
+        if fault == "slow":
+            time.sleep(srv.latency)
+        if fault in ("503", "404"):
+            self.send_response(int(fault))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if fault == "truncate":
+            self.wfile.write(body[:len(body) // 3])
+            self.close_connection = True
+            return
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass # Client gave up on a slow response
+
+    def log_message(self, *args):
+        pass
+
+
+class TestResilientFetch(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path("tests/integration_temp_resilient")
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+        self.test_dir.mkdir()
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _FaultyHandler)
+        self.server.body = FIXTURE.read_bytes()
+        self.server.faults = []
+        self.server.default = "ok"
+        self.server.latency = 0.5
+        self.server.hits = 0
+        self.server.lock = threading.Lock()
+        threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+
+        self.service = HolidayService(
+            str(self.test_dir),
+            retry_policy=RetryPolicy(attempts=3, base_delay=0.01, max_delay=0.02, timeout=0.2),
+            breaker_threshold=3,
+            breaker_reset=0.2
+        )
+        self.service.base_url = f"http://127.0.0.1:{self.server.server_address[1]}/ms/public-holidays"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        deadline = time.monotonic() + 2
+        while self.service._inflight and time.monotonic() < deadline:
+            time.sleep(0.01)
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_retries_5xx(self):
+        self.server.faults = ["503", "503"]
+        holidays, source = self.service.get_holidays_sync(2026)
+        self.assertEqual(source, "Live Fetch")
+        self.assertEqual(len(holidays), 18)
+        self.assertEqual(self.server.hits, 3)
+        self.assertEqual(self.service.cache_stats()["retries"], 2)
+
+    def test_retries_truncated_body(self):
+        self.server.faults = ["truncate"]
+        holidays, _ = self.service.get_holidays_sync(2026)
+        self.assertEqual(len(holidays), 18)
+        self.assertEqual(self.server.hits, 2)
+
+    def test_retries_slow_response(self):
+        self.server.faults = ["slow"]
+        holidays, _ = self.service.get_holidays_sync(2026)
+        self.assertEqual(len(holidays), 18)
+        self.assertEqual(self.server.hits, 2)
+
+    def test_client_errors_are_not_retried(self):
+        self.server.faults = ["404"]
+        with self.assertRaises(FetchError):
+            self.service.get_holidays_sync(2026)
+        self.assertEqual(self.server.hits, 1)
+        self.assertEqual(self.service.breaker().state, CircuitBreaker.CLOSED)
+
+    def test_breaker_fails_fast_to_cache_then_probe_recovers(self):
+        self.service.save_to_cache(2026, {date(2026, 1, 1): "Cached New Year"})
+        self.server.default = "503"
+
+        # One failed refresh (3 failed attempts) opens the circuit; the
+        # cached copy is served
+        holidays, source = self.service.get_holidays_sync(2026, force_refresh=True)
+        self.assertEqual(holidays, {date(2026, 1, 1): "Cached New Year"})
+        self.assertIn("source unavailable", source)
+        self.assertEqual(self.server.hits, 3)
+        self.assertEqual(self.service.breaker().state, CircuitBreaker.OPEN)
+
+        # Open circuit: no request, no wait
+        start = time.perf_counter()
+        _, source = self.service.get_holidays_sync(2026, force_refresh=True)
+        self.assertLess(time.perf_counter() - start, 0.1)
+        self.assertIn("source unavailable", source)
+        self.assertEqual(self.server.hits, 3)
+        self.assertEqual(self.service.cache_stats()["fast_failures"], 1)
+
+        # Without any copy the error surfaces immediately
+        with self.assertRaises(CircuitOpenError):
+            self.service.get_holidays_sync(2030)
+
+        # Source recovers: the background probe closes the circuit and
+        # replaces the cached copy
+        self.server.default = "ok"
+        deadline = time.monotonic() + 5
+        while self.service.breaker().state != CircuitBreaker.CLOSED and time.monotonic() < deadline:
+            time.sleep(0.02)
+        self.assertEqual(self.service.breaker().state, CircuitBreaker.CLOSED)
+        self.assertGreaterEqual(self.service.cache_stats()["probes"], 1)
+        while len(self.service.peek(2026) or {}) != 18 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        self.assertEqual(len(self.service.peek(2026)), 18)
+
+    def test_non_retryable_probe_failure_keeps_probing(self):
+        self.server.default = "503"
+        with self.assertRaises(FetchError):
+            self.service.get_holidays_sync(2026)
+        self.assertEqual(self.service.breaker().state, CircuitBreaker.OPEN)
+
+        # The first probe gets a 404: not retryable, but it must still end
+        # the half-open state and leave another probe scheduled
+        self.server.faults = ["404"]
+        self.server.default = "ok"
+        deadline = time.monotonic() + 5
+        while self.service.breaker().state != CircuitBreaker.CLOSED and time.monotonic() < deadline:
+            time.sleep(0.02)
+        self.assertEqual(self.service.breaker().state, CircuitBreaker.CLOSED)
+        self.assertGreaterEqual(self.service.cache_stats()["probes"], 2)
+        holidays, _ = self.service.get_holidays_sync(2026)
+        self.assertEqual(len(holidays), 18)
+
+    def test_probe_waits_for_running_fetch(self):
+        breaker = self.service.breaker()
+        for _ in range(3):
+            breaker.record_failure()
+        # A fetch of the same year is in flight when the probe is due
+        with self.service._lock:
+            self.service._inflight[(self.service.region, 2026)] = None
+        self.service._revalidate_in_background(2026, self.service.region, probe=True)
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN) # Not stranded half-open
+        with self.service._lock:
+            del self.service._inflight[(self.service.region, 2026)]
+
+        deadline = time.monotonic() + 5
+        while breaker.state != CircuitBreaker.CLOSED and time.monotonic() < deadline:
+            time.sleep(0.02)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_dead_host_opens_circuit_within_one_call(self):
+        # Nothing listens on the port any more
+        self.server.shutdown()
+        self.server.server_close()
+        with self.assertRaises(FetchError):
+            self.service.get_holidays_sync(2026)
+        self.assertEqual(self.service.breaker().state, CircuitBreaker.OPEN)
+        self.assertEqual(self.service.cache_stats()["retries"], 2)
+
+    def test_call_stays_within_total_timeout(self):
+        # A hanging source with a per-attempt timeout that alone would
+        # allow 3 x 0.5 s; the call as a whole gets 0.6 s
+        self.server.default = "slow"
+        self.server.latency = 2.0
+        self.service.retry_policy = RetryPolicy(attempts=3, base_delay=0.01, max_delay=0.02, timeout=0.5, total_timeout=0.6)
+        start = time.perf_counter()
+        with self.assertRaises(FetchError):
+            self.service.get_holidays_sync(2026)
+        self.assertLess(time.perf_counter() - start, 0.9)
+        self.assertEqual(self.server.hits, 2)
+        self.assertEqual(self.service.breaker().state, CircuitBreaker.CLOSED)
+
+    def test_failed_probe_backs_off(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=1.0, max_reset_timeout=3.0)
+        self.assertTrue(breaker.record_failure())
+        self.assertFalse(breaker.allow())
+        self.assertTrue(breaker.start_probe())
+        self.assertFalse(breaker.start_probe()) # Only one probe at a time
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(breaker.probe_delay, 2.0)
+        breaker.start_probe()
+        breaker.record_failure()
+        self.assertEqual(breaker.probe_delay, 3.0)
+        breaker.record_success()
+        self.assertTrue(breaker.allow())
+        self.assertEqual(breaker.probe_delay, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+import shutil
+from pathlib import Path
+from datetime import date
+from domain.calculator import calculate_period
+from services.roster_service import RosterService, load_roster, write_roster_summary
+
+class TestRosterServiceIntegration(unittest.TestCase):
+    """
+    Integration tests for RosterService.
+    Verifies roster loading from disk and process-pool fan-out.
+    """
+
+    def setUp(self):
+        self.test_dir = Path("tests/integration_temp_roster")
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+        self.test_dir.mkdir()
+
+        self.holidays_map = {
+            date(2026, 3, 23): "Hari Raya Aidilfitri",
+            date(2026, 3, 24): "Hari Raya Aidilfitri Day 2",
+        }
+
+        self.roster_path = self.test_dir / "roster.csv"
+        lines = ["Employee ID,Grade,Leave Dates"]
+        for i in range(50):
+            leave = "2026-03-25;26/03/2026" if i % 3 == 0 else ""
+            lines.append(f"E{i:03d},{['jg5', 'JG6', 'JGA'][i % 3]},{leave}")
+        self.roster_path.write_text("\n".join(lines), encoding="utf-8")
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def test_load_roster(self):
+        roster = load_roster(str(self.roster_path))
+        self.assertEqual(len(roster), 50)
+        self.assertEqual(roster[0].grade, "JG5")
+        self.assertEqual(roster[0].leave_dates, {date(2026, 3, 25), date(2026, 3, 26)})
+        self.assertEqual(roster[1].leave_dates, set())
+
+    def test_pool_matches_single_calculation(self):
+        roster = load_roster(str(self.roster_path))
+        service = RosterService(self.holidays_map, max_workers=2, chunk_size=8)
+
+        results = {r.employee_id: r.result for r in service.calculate(roster, 2026, 3)}
+
+        self.assertEqual(len(results), 50)
+        self.assertEqual(service.stats.employees, 50)
+        self.assertEqual(service.stats.chunks, 7)
+        self.assertGreater(service.stats.employees_per_second, 0)
+        for entry in roster:
+            expected = calculate_period(2026, 3, entry.grade, self.holidays_map, entry.leave_dates)
+            self.assertEqual(results[entry.employee_id], expected)
+
+    def test_write_summary(self):
+        roster = load_roster(str(self.roster_path))
+        service = RosterService(self.holidays_map, max_workers=1)
+        out = self.test_dir / "summary.csv"
+
+        count = write_roster_summary(service.calculate(roster, 2026, 3), str(out))
+
+        self.assertEqual(count, 50)
+        content = out.read_text(encoding="utf-8")
+        self.assertIn("E000,JG5,2026-03,50,18", content)
+
+    def test_region_per_employee(self):
+        roster_path = self.test_dir / "regions.csv"
+        roster_path.write_text("\n".join([
+            "Employee ID,Grade,State",
+            "S1,JG6,",
+            "K1,JG6,Selangor",
+            "S2,JG6,Sabah",
+        ]), encoding="utf-8")
+        roster = load_roster(str(roster_path))
+        self.assertEqual([e.region for e in roster], [None, "Selangor", "Sabah"])
+
+        selangor = {date(2026, 3, 20): "Hari Raya Aidilfitri"}
+        service = RosterService(self.holidays_map, max_workers=1,
+                                region_holidays={"Selangor": selangor, "Sabah": self.holidays_map})
+        results = {r.employee_id: r.result for r in service.calculate(roster, 2026, 3)}
+
+        self.assertEqual(results["S1"].working_days_count, 20)
+        self.assertEqual(results["S2"].working_days_count, 20)
+        self.assertEqual(results["K1"], calculate_period(2026, 3, "JG6", selangor, set()))
+
+    def test_unknown_region_is_rejected(self):
+        roster = load_roster(str(self.roster_path))
+        roster[0].region = "Johor"
+        service = RosterService(self.holidays_map, max_workers=1)
+        summary_path = self.test_dir / "summary.csv"
+        summary_path.write_text("previous run", encoding="utf-8")
+
+        # Raised by the call itself, before the summary file is opened
+        with self.assertRaises(ValueError):
+            write_roster_summary(service.calculate(roster, 2026, 3), str(summary_path))
+        self.assertEqual(summary_path.read_text(encoding="utf-8"), "previous run")
+
+    def test_malformed_rows_are_reported(self):
+        bad_path = self.test_dir / "bad.csv"
+        bad_path.write_text("Employee ID,Grade,Leave Dates\nE1,JG6,\n,,\nE2\n", encoding="utf-8")
+        with self.assertRaisesRegex(ValueError, "row 4 is missing columns"):
+            load_roster(str(bad_path))
+
+        bad_path.write_text("Employee ID,Grade\nE1,JG6\nE2,  \n", encoding="utf-8")
+        with self.assertRaisesRegex(ValueError, "row 3 has no grade"):
+            load_roster(str(bad_path))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,7 @@ import shutil
 import json
 import threading
 from pathlib import Path
-from datetime import date
+from datetime import date, timedelta
 from services.holiday_service import HolidayService
 
 class TestServiceIntegration(unittest.TestCase):
@@ -33,7 +33,7 @@ class TestServiceIntegration(unittest.TestCase):
         self.service.save_to_cache(year, data)
         
         # 2. Check File
-        expected_file = self.test_dir / f"holiday_cache_{year}.json"
+        expected_file = self.test_dir / "holidays.db"
         self.assertTrue(expected_file.exists())
         
         # 3. Load
@@ -49,7 +49,7 @@ class TestServiceIntegration(unittest.TestCase):
         # to ensure the threading/queueing part works.
         
         # Monkey patch the sync fetcher to return immediate data
-        self.service.fetch_holidays_sync = lambda year: {date(year, 1, 1): "Mock Holiday"}
+        self.service.fetch_holidays_sync = lambda year, **kwargs: {date(year, 1, 1): "Mock Holiday"}
         
         result_container = {}
         event = threading.Event()
@@ -71,3 +71,108 @@ class TestServiceIntegration(unittest.TestCase):
         self.assertTrue(success, "Async callback timed out")
         self.assertIn(date(2030, 1, 1), result_container.get('data', {}))
         self.assertEqual(result_container['source'], "Live Fetch")
+
+    def test_memory_cache_skips_store(self):
+        """Second lookup of a year is served from memory, not disk."""
+        self.service.save_to_cache(2031, {date(2031, 1, 1): "New Year"})
+        
+        calls = []
+        original = self.service.load_cached_holidays
+        self.service.load_cached_holidays = lambda year, region=None: calls.append(year) or original(year, region)
+        
+        first = self.service.get_holidays_sync(2031)
+        second = self.service.get_holidays_sync(2031)
+        
+        self.assertEqual(first, second)
+        self.assertEqual(calls, [2031])
+        stats = self.service.cache_stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 1)
+
+    def test_memory_cache_is_bounded(self):
+        service = HolidayService(str(self.test_dir), memory_size=2)
+        service.fetch_holidays_sync = lambda year, **kwargs: {date(year, 1, 1): "New Year"}
+        for year in (2031, 2032, 2033):
+            service.get_holidays_sync(year)
+        stats = service.cache_stats()
+        self.assertEqual(stats["size"], 2)
+        self.assertEqual(stats["evictions"], 1)
+
+    def test_stale_while_revalidate(self):
+        """Stale data is returned immediately; listeners hear about the refresh."""
+        service = HolidayService(str(self.test_dir), ttl=timedelta(seconds=0))
+        service.save_to_cache(2031, {date(2031, 1, 1): "Old Name"})
+        
+        release = threading.Event()
+        def slow_fetch(year, **kwargs):
+            release.wait(2.0)
+            return {date(2031, 1, 1): "New Name"}
+        service.fetch_holidays_sync = slow_fetch
+        
+        updates = []
+        updated = threading.Event()
+        service.add_listener(lambda year, holidays, source, diff: (updates.append((year, holidays, source, diff)), updated.set()))
+        
+        holidays, source = service.get_holidays_sync(2031)
+        self.assertEqual(holidays[date(2031, 1, 1)], "Old Name")
+        self.assertTrue(source.startswith("Cache"))
+        
+        release.set()
+        self.assertTrue(updated.wait(2.0), "Listener was not notified")
+        self.assertEqual(updates[0][:3], (2031, {date(2031, 1, 1): "New Name"}, "Live Fetch"))
+        self.assertEqual(updates[0][3].renamed, {date(2031, 1, 1): ("Old Name", "New Name")})
+        self.assertEqual(service.cache_stats()["refreshes"], 1)
+        self.assertEqual(service.load_from_cache(2031)["holidays"]["2031-01-01"], "New Name")
+
+    def test_concurrent_fetches_are_coalesced(self):
+        """Many async requests for one year share a single network fetch."""
+        calls = []
+        release = threading.Event()
+        def slow_fetch(year, **kwargs):
+            calls.append(year)
+            release.wait(2.0)
+            return {date(year, 1, 1): "New Year"}
+        self.service.fetch_holidays_sync = slow_fetch
+        
+        results = []
+        done = threading.Semaphore(0)
+        def on_success(holidays, source):
+            results.append(holidays)
+            done.release()
+        def on_error(msg):
+            results.append(msg)
+            done.release()
+        
+        for _ in range(10):
+            self.service.fetch_holidays_async(2032, on_success, on_error, force_refresh=True)
+        # Plus a blocking caller on this thread
+        waiter = threading.Thread(target=lambda: results.append(self.service.get_holidays_sync(2032, force_refresh=True)[0]))
+        waiter.start()
+        
+        release.set()
+        for _ in range(10):
+            self.assertTrue(done.acquire(timeout=3.0), "Async callback timed out")
+        waiter.join(3.0)
+        
+        self.assertEqual(len(results), 11)
+        self.assertTrue(all(r == {date(2032, 1, 1): "New Year"} for r in results))
+        self.assertLess(len(calls), 11)
+        self.assertEqual(len(calls) + self.service.cache_stats()["coalesced"], 11)
+
+    def test_coalesced_fetch_shares_errors(self):
+        release = threading.Event()
+        def failing_fetch(year, **kwargs):
+            release.wait(2.0)
+            raise RuntimeError("Network error: down")
+        self.service.fetch_holidays_sync = failing_fetch
+        
+        errors = []
+        done = threading.Semaphore(0)
+        for _ in range(3):
+            self.service.fetch_holidays_async(
+                2033, lambda h, s: done.release(), lambda msg: (errors.append(msg), done.release()), force_refresh=True
+            )
+        release.set()
+        for _ in range(3):
+            self.assertTrue(done.acquire(timeout=3.0))
+        self.assertEqual(errors, ["Network error: down"] * 3)
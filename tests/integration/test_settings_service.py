@@ -0,0 +1,101 @@
+import json
+import shutil
+import time
+import unittest
+from pathlib import Path
+
+from services.settings_service import SettingsService, Settings
+
+
+class TestSettingsService(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path("tests/integration_temp_settings")
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+        self.test_dir.mkdir()
+        self.path = self.test_dir / "settings.json"
+
+    def tearDown(self):
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def _wait_for_write(self, service, writes=1):
+        for _ in range(100):
+            if service.writes >= writes:
+                return
+            time.sleep(0.02)
+
+    def test_rapid_sets_are_coalesced(self):
+        service = SettingsService(str(self.path), flush_delay=0.1)
+        for grade in ["JG5", "JG6", "JG7", "JG8"] * 10:
+            service.set("default_grade", grade)
+
+        self.assertEqual(service.get("default_grade"), "JG8") # From memory
+        self.assertFalse(self.path.exists())
+
+        self._wait_for_write(service)
+        self.assertEqual(service.writes, 1)
+        self.assertEqual(json.loads(self.path.read_text())["default_grade"], "JG8")
+        service.close()
+
+    def test_close_flushes_pending_changes(self):
+        service = SettingsService(str(self.path), flush_delay=60)
+        service.set("developer_mode", True)
+        service.close()
+
+        self.assertTrue(json.loads(self.path.read_text())["developer_mode"])
+        self.assertTrue(SettingsService(str(self.path)).get("developer_mode"))
+
+    def test_flush_after_enough_changes(self):
+        service = SettingsService(str(self.path), flush_delay=60, flush_after=5)
+        for i in range(5):
+            service.set("theme", f"theme{i}")
+        self._wait_for_write(service)
+        self.assertEqual(service.writes, 1)
+        service.close()
+
+    def test_unchanged_value_is_not_written(self):
+        service = SettingsService(str(self.path), flush_delay=None)
+        service.set("default_grade", "JG6") # Already the default
+        self.assertEqual(service.writes, 0)
+        service.set("default_grade", "JG7")
+        self.assertEqual(service.writes, 1)
+
+    def test_failed_write_backs_off(self):
+        # A directory in the way: every write fails
+        self.path.mkdir()
+        service = SettingsService(str(self.path), flush_delay=0.05)
+        service.set("theme", "alt")
+        time.sleep(0.5)
+        # 0.05s debounce, then retries after 0.05, 0.1, 0.2s...
+        self.assertLessEqual(service.failures, 5)
+        self.assertGreaterEqual(service.failures, 1)
+        self.assertEqual(service.writes, 0)
+        service.close()
+
+    def test_unserialisable_value_does_not_stop_flusher(self):
+        service = SettingsService(str(self.path), flush_delay=0.05)
+        service.set("custom", object())
+        for _ in range(100):
+            if service.failures:
+                break
+            time.sleep(0.02)
+        self.assertEqual(service.failures, 1)
+
+        service.set("custom", "fixed")
+        self._wait_for_write(service)
+        self.assertEqual(json.loads(self.path.read_text())["custom"], "fixed")
+        service.close()
+
+    def test_typed_view(self):
+        self.path.write_text(json.dumps({"auto_open_export": "yes", "default_grade": "JG5"}))
+        service = SettingsService(str(self.path))
+        view = service.view
+        self.assertIsInstance(view, Settings)
+        self.assertIs(view.auto_open_export, True)
+        self.assertEqual(view.default_grade, "JG5")
+        self.assertIs(view.developer_mode, False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,13 @@
 import tkinter as tk
 from tkinter import ttk
-import fitz  # PyMuPDF
-from PIL import Image, ImageTk
-import io
+import hashlib
+import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+from ui.components.render_cache import RenderCache, size_bucket
+
+# PyMuPDF and PIL are imported on first render, not at app start-up
 
 class PdfPreview(ttk.Frame):
     def __init__(self, parent, on_prev=None, on_next=None):
@@ -27,10 +32,28 @@ class PdfPreview(ttk.Frame):
         # State
         self.image_ref = None
         self.current_pdf_path = None
+        self.current_key = None
         self.resize_timer = None
         
+        # Rendered pages, keyed by (content key, size bucket). PhotoImages are
+        # made on the Tk thread; everything before that runs on one worker.
+        self.cache = RenderCache()
+        self._make_pdf = {} # key -> callable returning PDF bytes
+        self._docs = {} # key -> open fitz doc, only touched by the worker
+        self._doc_order = []
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-render")
+        self._pending = {} # cache key -> Future
+        self._done = queue.Queue()
+        self._poll_job = None # after() id while _poll is scheduled
+        self._prefetching = [] # Futures of the latest prefetch() call
+        self._prefetch_gen = 0
+        
         # Bindings
         self.canvas.bind("<Configure>", self._on_resize)
+        self.canvas.bind("<Left>", lambda e: self._handle_prev())
+        self.canvas.bind("<Right>", lambda e: self._handle_next())
+        self.canvas.bind("<Button-1>", lambda e: self.canvas.focus_set())
+        self.canvas.bind("<Enter>", lambda e: self.canvas.focus_set())
         
     def _handle_prev(self):
         print("DEBUG: Prev clicked in PdfPreview")
@@ -57,9 +80,72 @@ class PdfPreview(ttk.Frame):
             self.after_cancel(self.resize_timer)
         self.resize_timer = self.after(200, self._render_current)
 
+    def show(self, key, make_pdf):
+        """Show the page for `key`. make_pdf() is only called (on the render
+        thread) when no render for this key is cached yet."""
+        self.current_pdf_path = None
+        self.current_key = key
+        self._make_pdf[key] = make_pdf
+        self._render_current()
+
+    def prefetch(self, jobs):
+        """Render pages the user is likely to ask for next, at the current size.
+        Each job runs on the render thread and returns (key, make_pdf).
+        Work still queued from the previous call is cancelled."""
+        self.cancel_prefetch()
+        w = self.winfo_width()
+        h = self.winfo_height()
+        if w < 50 or h < 50: return
+        bucket = size_bucket(w, h)
+        gen = self._prefetch_gen
+        for job in jobs:
+            fut = self._pool.submit(self._prefetch_one, job, bucket, gen)
+            self._prefetching.append(fut)
+            fut.add_done_callback(lambda f: self._done.put((None, f)))
+        self._start_polling()
+
+    def cancel_prefetch(self):
+        self._prefetch_gen += 1
+        for fut in self._prefetching:
+            fut.cancel()
+        self._prefetching = []
+
     def render_pdf(self, pdf_path: str):
+        try: stamp = os.path.getmtime(pdf_path)
+        except OSError: stamp = None
+        def read():
+            with open(pdf_path, "rb") as f:
+                return f.read()
+        self.show(("file", pdf_path, stamp), read)
         self.current_pdf_path = pdf_path
-        self._render_current()
+
+    def render_bytes(self, data: bytes, key=None):
+        """Show a PDF held in memory (e.g. PdfExporter.to_bytes())."""
+        if key is None:
+            key = hashlib.sha1(data).hexdigest()
+        self.show(key, lambda: data)
+
+    def discard_months(self, months) -> int:
+        """Drop cached renders of (year, month) pages, for keys shaped
+        (year, month, ...). Returns the number of renders dropped."""
+        months = set(months)
+        dropped = self.cache.discard(lambda ck: isinstance(ck[0], tuple) and tuple(ck[0][:2]) in months)
+        if dropped:
+            self._prune_sources()
+        return dropped
+
+    def destroy(self):
+        # A pending after() would fire on the destroyed widget
+        if self._poll_job is not None:
+            self.after_cancel(self._poll_job)
+            self._poll_job = None
+        if self.resize_timer:
+            self.after_cancel(self.resize_timer)
+            self.resize_timer = None
+        self._pending.clear()
+        self._pool.submit(self._close_docs)
+        self._pool.shutdown(wait=False)
+        super().destroy()
         
     def _render_current(self):
         # Buttons are managed by place() in _on_resize and here
@@ -73,41 +159,149 @@ class PdfPreview(ttk.Frame):
         self.btn_prev.lift()
         self.btn_next.lift()
 
-        if not self.current_pdf_path: return
+        if self.current_key is None: return
+        if w < 50 or h < 50: return 
         
+        ck = (self.current_key, size_bucket(w, h))
+        photo = self.cache.get(ck)
+        if photo is not None:
+            self._display(photo)
+            return
+        # Don't let speculative renders queue ahead of the page being asked for
+        if ck not in self._pending:
+            self.cancel_prefetch()
+        self._submit(ck)
+
+    def _submit(self, ck):
+        # Already queued (e.g. several resize events for the same bucket)
+        if ck in self._pending: return
+        key, bucket = ck
+        make_pdf = self._make_pdf.get(key)
+        if make_pdf is None: return
+        fut = self._pool.submit(self._render_page, key, make_pdf, bucket)
+        self._pending[ck] = fut
+        fut.add_done_callback(lambda f, ck=ck: self._done.put((ck, f)))
+        self._start_polling()
+
+    def _start_polling(self):
+        if self._poll_job is None:
+            self._poll_job = self.after(20, self._poll)
+
+    def _poll(self):
+        # Hand finished renders back to the Tk thread
+        self._poll_job = None
+        while True:
+            try:
+                ck, fut = self._done.get_nowait()
+            except queue.Empty:
+                break
+            if ck is None:
+                self._finish_prefetch(fut)
+                continue
+            if self._pending.get(ck) is not fut: continue
+            del self._pending[ck]
+            try:
+                pil_image = fut.result()
+                from PIL import ImageTk
+                photo = ImageTk.PhotoImage(pil_image)
+            except Exception as e:
+                if ck[0] == self.current_key:
+                    self.show_message(f"Error: {str(e)}")
+                continue
+            self.cache.put(ck, photo)
+            self._prune_sources()
+            if ck[0] == self.current_key:
+                # Only show it if the viewport still maps to the same bucket
+                self._render_current()
+        self._prefetching = [f for f in self._prefetching if not f.done()]
+        if self._pending or self._prefetching or not self._done.empty():
+            self._start_polling()
+
+    def _finish_prefetch(self, fut):
+        if fut.cancelled(): return
         try:
-            # Get available size
-            # w, h from above
-            if w < 50 or h < 50: return 
-            
-            doc = fitz.open(self.current_pdf_path)
-            if len(doc) < 1: return
-            page = doc.load_page(0)
-            
-            # Calculate Scale to FIT PAGE
-            rect = page.rect
-            scale_w = (w - 120) / rect.width 
-            scale_h = (h - 40) / rect.height
-            scale = min(scale_w, scale_h)
-            
-            # Render
-            mat = fitz.Matrix(scale, scale)
-            pix = page.get_pixmap(matrix=mat)
-            
-            img_data = pix.tobytes("ppm")
-            pil_image = Image.open(io.BytesIO(img_data))
-            self.image_ref = ImageTk.PhotoImage(pil_image)
-            
-            # Draw centered
-            self.canvas.delete("all")
-            self.canvas.create_image(
-                w//2, h//2,
-                image=self.image_ref,
-                anchor="center"
-            )
-            
+            done = fut.result()
+            if done is None: return
+            ck, make_pdf, pil_image = done
+            from PIL import ImageTk
+            photo = ImageTk.PhotoImage(pil_image)
         except Exception as e:
-            self.show_message(f"Error: {str(e)}")
+            print(f"Failed to prefetch preview: {e}")
+            return
+        self._make_pdf.setdefault(ck[0], make_pdf)
+        self.cache.put(ck, photo)
+        self._prune_sources()
+        if ck[0] == self.current_key:
+            self._render_current()
+
+    def _prefetch_one(self, job, bucket, gen):
+        # Runs on the render thread. Superseded while queued: skip the work.
+        if gen != self._prefetch_gen: return None
+        key, make_pdf = job()
+        ck = (key, bucket)
+        if ck in self.cache: return None
+        return ck, make_pdf, self._render_page(key, make_pdf, bucket)
+
+    def _prune_sources(self):
+        # Forget PDF factories nothing can ask for any more
+        live = {k for (k, _b) in self.cache.keys()} | {k for (k, _b) in self._pending}
+        live.add(self.current_key)
+        for key in list(self._make_pdf):
+            if key not in live:
+                del self._make_pdf[key]
+
+    def _render_page(self, key, make_pdf, bucket):
+        # Runs on the render thread
+        import fitz  # PyMuPDF
+        from PIL import Image
+        
+        doc = self._docs.get(key)
+        if doc is None:
+            doc = fitz.open(stream=make_pdf(), filetype="pdf")
+            self._docs[key] = doc
+            self._doc_order.append(key)
+            # A handful of open docs is enough to re-rasterise on resize
+            while len(self._doc_order) > 4:
+                old = self._docs.pop(self._doc_order.pop(0), None)
+                if old is not None:
+                    try: old.close()
+                    except Exception: pass
+        else:
+            self._doc_order.remove(key)
+            self._doc_order.append(key)
+        if len(doc) < 1:
+            raise ValueError("Empty document")
+        page = doc.load_page(0)
+        
+        # Calculate Scale to FIT PAGE
+        w, h = bucket
+        rect = page.rect
+        scale_w = (w - 120) / rect.width 
+        scale_h = (h - 40) / rect.height
+        scale = max(0.05, min(scale_w, scale_h))
+        
+        pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False)
+        return Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+
+    def _close_docs(self):
+        for doc in self._docs.values():
+            try: doc.close()
+            except Exception: pass
+        self._docs.clear()
+        self._doc_order.clear()
+
+    def _display(self, photo):
+        self.image_ref = photo
+        w = self.winfo_width()
+        h = self.winfo_height()
+        
+        # Draw centered
+        self.canvas.delete("all")
+        self.canvas.create_image(
+            w//2, h//2,
+            image=self.image_ref,
+            anchor="center"
+        )
 
     def show_message(self, text):
         self.canvas.delete("all")
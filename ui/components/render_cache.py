@@ -0,0 +1,69 @@
+import threading
+from collections import OrderedDict
+
+# Rendered preview pages kept around. Each entry is one page bitmap (~1-3 MB
+# at typical window sizes), so keep this small.
+RENDER_CACHE_SIZE = 12
+
+# Viewport sizes are rounded down to this many pixels so a resize drag of a
+# few pixels lands on the same cache entry instead of forcing a re-render.
+SIZE_BUCKET = 32
+
+
+def size_bucket(width: int, height: int, step: int = SIZE_BUCKET):
+    return (max(step, width // step * step), max(step, height // step * step))
+
+
+class RenderCache:
+    """Bounded LRU of rendered preview pages keyed by (result hash, size bucket)."""
+
+    def __init__(self, maxsize: int = RENDER_CACHE_SIZE):
+        self.maxsize = max(1, maxsize)
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._items:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return self._items[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._items
+
+    def keys(self):
+        with self._lock:
+            return list(self._items)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
+
+    def discard(self, predicate) -> int:
+        """Drop every entry whose key matches predicate(key). Returns the count."""
+        with self._lock:
+            stale = [k for k in self._items if predicate(k)]
+            for k in stale:
+                del self._items[k]
+            return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def info(self) -> dict:
+        with self._lock:
+            return {"size": len(self._items), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
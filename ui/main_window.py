@@ -3,22 +3,51 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import datetime as dt
 import calendar
+import os
 import queue
 import threading
 from typing import Set, Dict, Optional
 
 from domain.models import CalculationResult, Holiday
 from domain.calculator import calculate_period, GRADE_RATES
+from domain.dates import parse_dates
 from services.holiday_service import HolidayService
-from exporters.excel_exporter import ExcelExporter
-from exporters.csv_exporter import CsvExporter
-from exporters.pdf_exporter import PdfExporter
+from services.holiday_bundle import default_bundle_path
+from services.holiday_prefetcher import HolidayPrefetcher
 
 from ui.styles import *
 from ui.components.hero_card import HeroCard
 from ui.components.key_value_grid import KeyValueGrid
 from ui.components.log_viewer import LogViewer
 
+# Heavy modules that are only needed for export/preview
+LAZY_MODULES = (
+    "exporters.pdf_exporter",
+    "exporters.excel_exporter",
+    "exporters.csv_exporter",
+    "fitz",
+    "PIL.Image",
+    "PIL.ImageTk",
+)
+WARM_UP_DELAY_MS = 1500
+HOLIDAY_FETCH_TIMEOUT = 30 # Seconds before the status bar reports a failure
+PREFETCH_RADIUS = 1 # Years either side of the selected one kept warm
+PREVIEW_PREFETCH_MONTHS = 1 # Months either side of the previewed one rendered ahead
+
+def warm_up_heavy_imports():
+    """Import export/preview dependencies ahead of first use (worker thread)."""
+    import importlib
+    for name in LAZY_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass # Missing optional dependency; surfaced when actually used
+
+
+def _preview_key(res: CalculationResult):
+    # The month lets a holiday update drop just the renders it reaches
+    return (res.year, res.month, res.fingerprint())
+
 
 class MainWindow:
     def __init__(self, root: tk.Tk):
@@ -27,14 +56,17 @@ class MainWindow:
         self.root.geometry("1100x750")
         
         # Services
-        self.holiday_service = HolidayService()
+        self.holiday_service = HolidayService(bundle_path=str(default_bundle_path()))
         self.holiday_queue = queue.Queue()
+        self.holiday_service.add_listener(self._on_holiday_update)
+        self.prefetcher = HolidayPrefetcher(self.holiday_service, radius=PREFETCH_RADIUS)
         
         # State
         self.holidays_map: Dict[dt.date, str] = {}
         self.holiday_source: str = "None"
         self.leave_dates: Set[dt.date] = set()
         self.current_result: Optional[CalculationResult] = None
+        self._holiday_request = None # Pending fetch, cancelled if superseded
         
         # UI
         self._setup_styles()
@@ -45,6 +77,21 @@ class MainWindow:
         
         # Start queue poller
         self.root.after(100, self._process_queue)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+        # Exporters and the preview renderer are imported lazily; warm them
+        # up in the background once the window has had time to settle.
+        if self.settings_service.get("warm_exporters"):
+            self.root.after(WARM_UP_DELAY_MS, self._start_warm_up)
+
+    def _on_close(self):
+        # Settings are written lazily; make sure the last changes land
+        self.settings_service.close()
+        self.prefetcher.close()
+        self.root.destroy()
+
+    def _start_warm_up(self):
+        threading.Thread(target=warm_up_heavy_imports, daemon=True).start()
 
     def _setup_styles(self):
         style = ttk.Style()
@@ -60,6 +107,7 @@ class MainWindow:
         if m == 1:
             self.month_var.set(12)
             self.year_var.set(y - 1)
+            self.refresh_holidays()
         else:
             self.month_var.set(m - 1)
         self._update_combo_from_var()
@@ -70,6 +118,7 @@ class MainWindow:
         if m == 12:
             self.month_var.set(1)
             self.year_var.set(y + 1)
+            self.refresh_holidays()
         else:
             self.month_var.set(m + 1)
         self._update_combo_from_var()
@@ -187,10 +236,8 @@ class MainWindow:
         if self.settings_service.get("developer_mode"):
             self.notebook.add(self.log_viewer, text="Logs (Debug)")
         
-        # PDF Preview Tab
+        # PDF Preview Tab (PyMuPDF/PIL are only imported on first render)
         from ui.components.pdf_preview import PdfPreview
-        import tempfile
-        import os
         
         self.pdf_preview = PdfPreview(self.notebook, on_prev=self.preview_nav_prev, on_next=self.preview_nav_next)
         self.notebook.add(self.pdf_preview, text="PDF Preview")
@@ -247,15 +294,8 @@ class MainWindow:
         f_data.pack(fill=tk.X, pady=(0, 10))
         
         def clear_cache():
-            # Delete json files in cache dir
-            import glob
-            count = 0
-            for p in self.holiday_service.get_cache_path(2000).parent.glob("holiday_cache_*.json"):
-                try:
-                    p.unlink()
-                    count += 1
-                except: pass
-            messagebox.showinfo("Cache Cleared", f"Deleted {count} cache file(s).\nPlease click 'Refresh Holidays' to re-download data.")
+            count = self.holiday_service.clear_cache()
+            messagebox.showinfo("Cache Cleared", f"Deleted {count} cached year(s).\nPlease click 'Refresh Holidays' to re-download data.")
             
         btn_clear = ttk.Button(f_data, text="Clear Holiday Cache", command=clear_cache)
         btn_clear.pack(anchor="w")
@@ -351,19 +391,40 @@ class MainWindow:
         self.status_lbl.config(text=f"Fetching holidays for {year}...", fg=COLOR_WARNING)
         self.btn_refresh.config(state="disabled")
         
-        self.holiday_service.fetch_holidays_async(
+        if self._holiday_request is not None:
+            self._holiday_request.cancel() # e.g. user navigated on to another year
+        self._holiday_request = self.holiday_service.fetch_holidays_async(
             year,
             self._on_holiday_success,
             self._on_holiday_error,
-            force_refresh=force
+            force_refresh=force,
+            timeout=HOLIDAY_FETCH_TIMEOUT
         )
+        # Warm the neighbouring years so navigation and the cross-year
+        # observed rule don't wait on a fetch later
+        self.prefetcher.prefetch(year, on_progress=self._on_prefetch_progress)
         
+    def _on_prefetch_progress(self, done, total, year, ok):
+        self.holiday_queue.put(("prefetch", done, total, year, ok))
+
+    def _holidays_for(self, year: int) -> Dict[dt.date, str]:
+        """Holidays for `year` plus whatever neighbouring years are already in memory."""
+        merged: Dict[dt.date, str] = {}
+        merged.update(self.holidays_map)
+        for y in (year - 1, year, year + 1):
+            merged.update(self.holiday_service.peek(y) or {})
+        return merged
+
     def _on_holiday_success(self, holidays, source):
         self.holiday_queue.put(("success", holidays, source))
 
     def _on_holiday_error(self, error):
         self.holiday_queue.put(("error", error))
 
+    def _on_holiday_update(self, year, holidays, source, diff):
+        # Background refresh found newer data than what we served
+        self.holiday_queue.put(("updated", year, holidays, source, diff))
+
     def _process_queue(self):
         try:
             while True:
@@ -376,6 +437,34 @@ class MainWindow:
                 elif status == "error":
                     self.status_lbl.config(text=f"Error: {msg[1]}", fg=COLOR_ERROR)
                     messagebox.showerror("Holiday Fetch Error", msg[1])
+                elif status == "updated":
+                    year, holidays, source, diff = msg[1:]
+                    if year == self.year_var.get():
+                        self.holidays_map = holidays
+                        self.holiday_source = source
+                        detail = f": {diff.summary()}" if diff is not None else ""
+                        self.status_lbl.config(text=f"Holidays updated ({source}){detail}", fg=COLOR_ACCENT)
+                    # Only redo the result on screen if the change reaches its month
+                    # (a neighbouring year can move an observed day into it)
+                    res = self.current_result
+                    if res:
+                        # No diff: nothing was in memory before, so assume every month
+                        affected = diff.affected_months if diff is not None else {(year, m) for m in range(1, 13)}
+                        # Renders of those months show the old holidays; free them
+                        self.pdf_preview.discard_months(affected)
+                        if (res.year, res.month) in affected:
+                            self.calculate()
+                elif status == "prefetch":
+                    done, total, year, ok = msg[1:]
+                    if not ok:
+                        print(f"Failed to prefetch holidays for {year}")
+                    if str(self.btn_refresh["state"]) == "disabled":
+                        pass # The selected year is still loading; keep that message
+                    elif done < total:
+                        self.status_lbl.config(text=f"Holidays loaded ({self.holiday_source}), prefetching {done}/{total}...", fg=COLOR_ACCENT)
+                    else:
+                        self.status_lbl.config(text=f"Holidays loaded ({self.holiday_source})", fg=COLOR_ACCENT)
+                    continue # Not a reply to the refresh button
                 
                 self.btn_refresh.config(state="normal")
         except queue.Empty:
@@ -401,50 +490,41 @@ class MainWindow:
             return
             
         try:
-            # Generate to temp file
-            import tempfile
-            import os
-            
-            fd, path = tempfile.mkstemp(suffix=".pdf")
-            os.close(fd)
-            
-            # Generate
-            exporter = PdfExporter(self.current_result, self.holiday_source)
-            exporter.export(path)
-            
-            # Render
-            self.pdf_preview.render_pdf(path)
-            
-            # Clean up? PyMuPDF might lock it? 
-            # We'll leave it in temp for now or try to delete later.
-            # OS should handle temp cleanup eventually.
+            # Keyed by month and result content: returning to a month (or a size)
+            # that was already rendered skips both the export and the rasterising.
+            # The export itself runs on the preview's render thread.
+            from exporters.pdf_exporter import PdfExporter
+            res, source = self.current_result, self.holiday_source
+            self.pdf_preview.show(_preview_key(res), lambda: PdfExporter(res, source).to_bytes())
+            self._prefetch_preview_neighbours(res)
             
         except Exception as e:
             self.pdf_preview.show_message(f"Preview Error: {str(e)}")
 
+    def _prefetch_preview_neighbours(self, res: CalculationResult):
+        """Calculate and render the months either side of `res` in the background,
+        so the preview arrows show them straight from the render cache."""
+        from exporters.pdf_exporter import PdfExporter
+        
+        grade, leave, source = res.grade, set(self.leave_dates), self.holiday_source
+        jobs = []
+        # Nearest months first
+        for step in range(1, PREVIEW_PREFETCH_MONTHS + 1):
+            for delta in (step, -step):
+                idx = res.year * 12 + (res.month - 1) + delta
+                y, m = divmod(idx, 12)
+                # Snapshot the holidays here; the job itself runs on the render thread
+                holidays = self._holidays_for(y)
+                def job(y=y, m=m + 1, holidays=holidays):
+                    r = calculate_period(year=y, month=m, grade=grade, holidays_map=holidays, leave_dates=leave)
+                    return _preview_key(r), (lambda: PdfExporter(r, source).to_bytes())
+                jobs.append(job)
+        self.pdf_preview.prefetch(jobs)
+
     def calculate(self):
         # 1. Parse Leave
         raw_leave = self.txt_leave.get("1.0", tk.END).strip()
-        self.leave_dates = set()
-        if raw_leave:
-            import re
-            # Split by comma or newline
-            parts = re.split(r'[,\n]', raw_leave)
-            for p in parts:
-                p = p.strip()
-                if not p: continue
-                # Parse date logic (simple fallback for now)
-                try:
-                    # try ISO first
-                    d = dt.date.fromisoformat(p)
-                    self.leave_dates.add(d)
-                except:
-                    # try DMY
-                    try:
-                        d = dt.datetime.strptime(p, "%d/%m/%Y").date()
-                        self.leave_dates.add(d)
-                    except:
-                        pass # Ignore invalid
+        self.leave_dates = parse_dates(raw_leave) # Invalid entries are ignored
 
         # 2. Run Calc
         try:
@@ -452,7 +532,7 @@ class MainWindow:
                 year=self.year_var.get(),
                 month=self.month_var.get(),
                 grade=self.grade_var.get(),
-                holidays_map=self.holidays_map,
+                holidays_map=self._holidays_for(self.year_var.get()),
                 leave_dates=self.leave_dates
             )
             self.current_result = result
@@ -505,6 +585,7 @@ class MainWindow:
         try:
             path = filedialog.asksaveasfilename(defaultextension=".xlsx", filetypes=[("Excel Files", "*.xlsx")])
             if path:
+                from exporters.excel_exporter import ExcelExporter
                 exporter = ExcelExporter(self.current_result, self.holiday_source)
                 exporter.export(path)
                 
@@ -523,6 +604,7 @@ class MainWindow:
         try:
             path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV Files", "*.csv")])
             if path:
+                from exporters.csv_exporter import CsvExporter
                 exporter = CsvExporter(self.current_result)
                 exporter.export(path)
                 
@@ -541,6 +623,7 @@ class MainWindow:
         try:
             path = filedialog.asksaveasfilename(defaultextension=".pdf", filetypes=[("PDF Files", "*.pdf")])
             if path:
+                from exporters.pdf_exporter import PdfExporter
                 exporter = PdfExporter(self.current_result, self.holiday_source)
                 exporter.export(path)
                 